@@ -0,0 +1,35 @@
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Lower
+from django_filters import rest_framework as filters
+
+from users.models import CustomUser
+
+
+class UserFilter(filters.FilterSet):
+    """
+    Filters for the user list.
+
+    ``search`` is a case-insensitive prefix match on username or email,
+    written as ``LOWER(column) LIKE 'term%'`` so it can use the
+    ``text_pattern_ops`` expression indexes on PostgreSQL.
+    """
+
+    level = filters.NumberFilter()
+    level_min = filters.NumberFilter(field_name="level", lookup_expr="gte")
+    level_max = filters.NumberFilter(field_name="level", lookup_expr="lte")
+    is_active = filters.BooleanFilter()
+    search = filters.CharFilter(method="filter_search")
+
+    class Meta:
+        model = CustomUser
+        fields = ("level", "is_active")
+
+    def filter_search(
+        self, queryset: QuerySet[CustomUser], name: str, value: str
+    ) -> QuerySet[CustomUser]:
+        term = value.strip().lower()
+        if not term:
+            return queryset
+        return queryset.alias(
+            username_lower=Lower("username"), email_lower=Lower("email")
+        ).filter(Q(username_lower__startswith=term) | Q(email_lower__startswith=term))
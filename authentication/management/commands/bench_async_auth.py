@@ -0,0 +1,206 @@
+"""Benchmark password reset requests and the email delivery behind them.
+
+A reset request only queues the email (``jobs.queue``); the worker sends it.
+The command measures both halves on a throwaway database:
+
+- requests: one sync WSGI worker and one ASGI worker, the latter with the
+  sync and with the async auth views (``ASYNC_AUTH_VIEWS``), driven by the
+  same number of concurrent clients;
+- delivery: ``--emails`` queued reset emails worked off by ``run_worker
+  --burst`` against a local stand-in for the Resend API that answers each
+  call after a fixed delay.
+
+Usage::
+
+    python manage.py bench_async_auth
+    python manage.py bench_async_auth --concurrency 100 --latency-ms 300
+    python manage.py bench_async_auth --emails 500 --worker-concurrency 16
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+
+from authentication.views.password_reset_request_view import reset_email_key
+from core.benchmarks import bench_database, format_table, run_http_load, serve_process
+from jobs.queue import enqueue
+
+User = get_user_model()
+
+
+@contextmanager
+def fake_email_api(latency: float) -> Iterator[str]:
+    """Serve a minimal Resend-compatible ``POST /emails`` endpoint."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+            body = json.dumps({"id": str(uuid.uuid4())}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+
+
+class Command(BaseCommand):
+    help = "Time password reset requests and the queued email delivery"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--duration", type=float, default=10.0)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Threads for the WSGI worker (gthread when > 1).",
+        )
+        parser.add_argument(
+            "--emails", type=int, default=200, help="Reset emails to deliver."
+        )
+        parser.add_argument(
+            "--latency-ms",
+            type=float,
+            default=200.0,
+            help="Simulated email API latency per call.",
+        )
+        parser.add_argument(
+            "--worker-concurrency",
+            type=int,
+            default=settings.JOB_QUEUE_CONCURRENCY,
+            help="Threads of the job worker sending the emails.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        with bench_database() as db_env:
+            env = {
+                **db_env,
+                "SECURE_SSL_REDIRECT": "0",
+                # Every request resets the same account's password.
+                "THROTTLE_ENABLED": "0",
+            }
+            request_rows = self.time_requests(env, options)
+            delivery_row = self.time_delivery(env, options)
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"Requests: 1 worker, {options['concurrency']} concurrent clients"
+        )
+        self.stdout.write(
+            format_table(
+                ("server", "requests", "errors", "req/s", "p50 ms", "p99 ms"),
+                request_rows,
+            )
+        )
+        self.stdout.write("")
+        self.stdout.write(f"Delivery: {options['latency_ms']:.0f} ms email API latency")
+        self.stdout.write(
+            format_table(("emails", "threads", "seconds", "emails/s"), [delivery_row])
+        )
+
+    def time_requests(
+        self, env: dict[str, str], options: dict[str, Any]
+    ) -> list[tuple[object, ...]]:
+        email = "bench-reset@example.com"
+        User.objects.create_user(
+            username="bench-reset", email=email, password="bench-password-123"
+        )
+        runs = (
+            ("wsgi (sync)", ["--threads", str(options["threads"])], "0"),
+            ("asgi (sync views)", ["--asgi"], "0"),
+            ("asgi (async views)", ["--asgi"], "1"),
+        )
+        rows = []
+        for label, serve_args, async_views in runs:
+            self.stdout.write(f"Running {label}...")
+            with serve_process(
+                [*serve_args, "--workers", "1", "--skip-collectstatic"],
+                env={**env, "ASYNC_AUTH_VIEWS": async_views},
+            ) as base_url:
+                result = run_http_load(
+                    f"{base_url}/api/auth/password/reset/",
+                    concurrency=options["concurrency"],
+                    duration=options["duration"],
+                    method="POST",
+                    body=json.dumps({"email": email}).encode(),
+                    headers={"Content-Type": "application/json"},
+                )
+            rows.append(
+                (
+                    label,
+                    result.requests,
+                    result.errors,
+                    f"{result.throughput:.1f}",
+                    f"{result.percentile(50):.0f}",
+                    f"{result.percentile(99):.0f}",
+                )
+            )
+        return rows
+
+    def time_delivery(
+        self, env: dict[str, str], options: dict[str, Any]
+    ) -> tuple[object, ...]:
+        users = User.objects.bulk_create(
+            User(username=f"bench-mail-{n}", email=f"bench-mail-{n}@example.com")
+            for n in range(options["emails"])
+        )
+        for user in users:
+            enqueue(
+                "send_password_reset_email",
+                {"user_id": str(user.pk)},
+                key=reset_email_key(user),
+            )
+
+        threads = options["worker_concurrency"]
+        self.stdout.write(f"Delivering {len(users)} emails...")
+        with fake_email_api(options["latency_ms"] / 1000) as api_url:
+            started = time.perf_counter()
+            subprocess.run(  # noqa: S603
+                [
+                    sys.executable,
+                    str(settings.BASE_DIR / "manage.py"),
+                    "run_worker",
+                    "--burst",
+                    "--concurrency",
+                    str(threads),
+                ],
+                env={
+                    **os.environ,
+                    **env,
+                    "RESEND_API_KEY": "re_bench",
+                    "RESEND_API_URL": api_url,
+                    "RESEND_PASSWORD_RESET_TEMPLATE_ID": "",
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            elapsed = time.perf_counter() - started
+        return (len(users), threads, f"{elapsed:.1f}", f"{len(users) / elapsed:.1f}")
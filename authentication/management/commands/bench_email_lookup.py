@@ -0,0 +1,150 @@
+"""Benchmark the email lookups of registration and password reset.
+
+Fills a throwaway database with ``--users`` rows (1M by default) whose
+emails are stored in mixed case, then times the lookup registration runs
+to reject a taken email and the one a reset request runs to find the
+account: the old ``email__iexact`` filter next to ``with_email``, which
+the ``user_lower_email_uniq`` index serves.  It also times both requests
+through the API (registration includes hashing the password) and prints
+the query plans.
+
+Usage::
+
+    python manage.py bench_email_lookup
+    python manage.py bench_email_lookup --users 200000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.benchmarks import bench_database, format_table
+from users.models import CustomUser
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Time registration and password reset email lookups on a large table"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        count, repeat = options["users"], options["repeat"]
+        with bench_database(), override_settings(THROTTLE_ENABLED=False):
+            self.stdout.write(f"Creating {count:,} users...")
+            self.populate(count)
+            connection.cursor().execute("ANALYZE")
+
+            # Spread over the table, asked for in another case than stored.
+            emails = [
+                f"user{n * count // repeat}@example.com".upper() for n in range(repeat)
+            ]
+            lookups = {
+                "email__iexact": lambda email: CustomUser.all_objects.filter(
+                    email__iexact=email
+                ),
+                "with_email": CustomUser.all_objects.with_email,
+            }
+            rows = []
+            for label, lookup in lookups.items():
+                rows.append(
+                    self.time_lookup(
+                        f"register check, {label}", emails, lookup, "exists"
+                    )
+                )
+                rows.append(
+                    self.time_lookup(f"reset lookup, {label}", emails, lookup, "first")
+                )
+            rows.extend(self.time_requests(emails))
+
+            self.stdout.write("")
+            self.stdout.write(f"{count:,} users, {repeat} lookups each")
+            self.stdout.write(format_table(("lookup", "ms/lookup"), rows))
+            for label, lookup in lookups.items():
+                self.stdout.write("")
+                self.stdout.write(f"{label}:")
+                self.stdout.write(lookup(emails[0]).explain())
+
+    def populate(self, count: int) -> None:
+        password = make_password("bench-password-123")
+        for start in range(0, count, BATCH_SIZE):
+            CustomUser.objects.bulk_create(
+                CustomUser(
+                    username=f"user{n}",
+                    email=f"User{n}@Example.com",
+                    password=password,
+                    is_deleted=n % 50 == 0,
+                )
+                for n in range(start, min(start + BATCH_SIZE, count))
+            )
+
+    @staticmethod
+    def time_lookup(
+        label: str,
+        emails: list[str],
+        lookup: Any,
+        method: str,
+    ) -> tuple[object, ...]:
+        started = time.perf_counter()
+        for email in emails:
+            queryset: QuerySet[CustomUser] = lookup(email)
+            if not getattr(queryset, method)():
+                msg = f"{label} missed {email}"
+                raise CommandError(msg)
+        elapsed = time.perf_counter() - started
+        return (label, f"{elapsed / len(emails) * 1000:.2f}")
+
+    @staticmethod
+    def time_requests(emails: list[str]) -> list[tuple[object, ...]]:
+        client = APIClient(HTTP_HOST="localhost")
+        requests = (
+            (
+                "POST register (taken email)",
+                reverse("auth:register"),
+                lambda email: {
+                    "username": f"new-{email}",
+                    "email": email,
+                    "password": "bench-password-123",
+                },
+                400,
+            ),
+            (
+                "POST register (new email)",
+                reverse("auth:register"),
+                lambda email: {
+                    "username": f"new-{email}",
+                    "email": f"new-{email}",
+                    "password": "bench-password-123",
+                },
+                201,
+            ),
+            (
+                "POST password-reset",
+                reverse("auth:password_reset"),
+                lambda email: {"email": email},
+                200,
+            ),
+        )
+        rows = []
+        for label, path, payload, expected in requests:
+            started = time.perf_counter()
+            for email in emails:
+                response = client.post(path, payload(email), secure=True)
+                if response.status_code != expected:
+                    msg = f"POST {path} returned {response.status_code}"
+                    raise CommandError(msg)
+            elapsed = time.perf_counter() - started
+            rows.append((label, f"{elapsed / len(emails) * 1000:.2f}"))
+        return rows
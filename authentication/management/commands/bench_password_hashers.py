@@ -0,0 +1,106 @@
+"""Benchmark password hashing cost: logins per second per core.
+
+Verifies a password ``--rounds`` times with each hasher setting, as a
+login does, and reports the wall time and the CPU time per check; the
+logins one core sustains is the inverse of the CPU time (Argon2 with
+several lanes spreads one check over several threads).  The setting in
+use is starred.
+
+Usage::
+
+    python manage.py bench_password_hashers
+    python manage.py bench_password_hashers --argon2 2,19456,1 3,65536,4 --pbkdf2 600000
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.hashers import BasePasswordHasher
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.benchmarks import format_table
+from core.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+
+
+class Command(BaseCommand):
+    help = "Time password checks at several Argon2 and PBKDF2 costs"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rounds", type=int, default=10)
+        parser.add_argument(
+            "--argon2",
+            nargs="*",
+            default=["1,19456,1", "2,19456,1", "3,65536,1", "2,102400,8"],
+            help="time_cost,memory_cost_kib,parallelism settings.",
+        )
+        parser.add_argument(
+            "--pbkdf2",
+            type=int,
+            nargs="*",
+            default=[260000, 600000, 1000000],
+            help="Iteration counts.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        in_use = {
+            "argon2": f"t={settings.PASSWORD_ARGON2_TIME_COST} "
+            f"m={settings.PASSWORD_ARGON2_MEMORY_COST} "
+            f"p={settings.PASSWORD_ARGON2_PARALLELISM}",
+            "pbkdf2": str(settings.PASSWORD_PBKDF2_ITERATIONS),
+        }
+        current = {(settings.PASSWORD_HASHER, in_use[settings.PASSWORD_HASHER])}
+        rows = []
+        for spec in options["argon2"]:
+            time_cost, memory_cost, parallelism = (int(n) for n in spec.split(","))
+            hasher = type(
+                "Hasher",
+                (Argon2PasswordHasher,),
+                {
+                    "time_cost": time_cost,
+                    "memory_cost": memory_cost,
+                    "parallelism": parallelism,
+                },
+            )()
+            cost = f"t={time_cost} m={memory_cost} p={parallelism}"
+            rows.append(self.row("argon2", cost, hasher, options["rounds"], current))
+        for iterations in options["pbkdf2"]:
+            hasher = type(
+                "Hasher", (PBKDF2PasswordHasher,), {"iterations": iterations}
+            )()
+            rows.append(
+                self.row("pbkdf2", str(iterations), hasher, options["rounds"], current)
+            )
+
+        self.stdout.write("")
+        self.stdout.write(f"{options['rounds']} checks per setting")
+        self.stdout.write(
+            format_table(("hasher", "cost", "wall ms", "cpu ms", "logins/s/core"), rows)
+        )
+
+    @staticmethod
+    def row(
+        name: str,
+        cost: str,
+        hasher: BasePasswordHasher,
+        rounds: int,
+        current: set[tuple[str, str]],
+    ) -> tuple[object, ...]:
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(rounds):
+            hasher.verify(PASSWORD, encoded)
+        wall = (time.perf_counter() - wall) / rounds
+        cpu = (time.process_time() - cpu) / rounds
+        marker = " *" if (name, cost) in current else ""
+        return (
+            name + marker,
+            cost,
+            f"{wall * 1000:.1f}",
+            f"{cpu * 1000:.1f}",
+            f"{1 / cpu:,.0f}",
+        )
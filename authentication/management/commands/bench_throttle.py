@@ -0,0 +1,100 @@
+"""Benchmark the per-request overhead of the auth rate limits.
+
+Times the checks a login request goes through (``ClientIPThrottle`` and
+``AccountThrottle``, see ``core.throttling``) next to DRF's stock
+``AnonRateThrottle``, for a client under its limit and for one already
+over it, against the local-memory cache and, when ``REDIS_URL`` is set,
+against Redis.
+
+Usage::
+
+    python manage.py bench_throttle
+    REDIS_URL=redis://localhost:6379/0 python manage.py bench_throttle --requests 20000
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import AnonRateThrottle, BaseThrottle
+
+from authentication.views.login_view import LoginView
+from core.benchmarks import format_table
+
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bench-throttle",
+    },
+}
+if os.getenv("REDIS_URL"):
+    CACHE_BACKENDS["redis"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+
+
+class Command(BaseCommand):
+    help = "Time the rate limit checks of the auth endpoints per request"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=5000)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        count = options["requests"]
+        request = Request(
+            APIRequestFactory().post(
+                "/", {"username": "bench", "password": "x"}, format="json"
+            ),
+            parsers=[JSONParser()],
+        )
+        # Parsed once up front, as the view does before its throttles run.
+        request.data  # noqa: B018
+        view = LoginView()
+
+        rows = []
+        for backend, config in CACHE_BACKENDS.items():
+            for state, limit in (("under limit", count * 2), ("over limit", 1)):
+                rate = f"{limit}/min"
+                stock = type("Stock", (AnonRateThrottle,), {"rate": rate})
+                rates = {"login": rate, "login_account": rate}
+                with override_settings(
+                    CACHES={"default": config},
+                    REST_FRAMEWORK={
+                        **settings.REST_FRAMEWORK,
+                        "DEFAULT_THROTTLE_RATES": rates,
+                    },
+                ):
+                    for label, throttles in (
+                        ("ip + account", view.throttle_classes),
+                        ("drf AnonRateThrottle", [stock]),
+                    ):
+                        cache.clear()
+                        micros = self.time_checks(request, view, throttles, count)
+                        rows.append((backend, label, state, f"{micros:.1f}"))
+
+        self.stdout.write("")
+        self.stdout.write(f"{count:,} checks per run")
+        self.stdout.write(format_table(("cache", "throttle", "client", "µs/req"), rows))
+
+    @staticmethod
+    def time_checks(
+        request: Request,
+        view: Any,
+        throttles: list[type[BaseThrottle]],
+        count: int,
+    ) -> float:
+        started = time.perf_counter()
+        for _ in range(count):
+            for throttle in throttles:
+                throttle().allow_request(request, view)
+        return (time.perf_counter() - started) / count * 1e6
@@ -0,0 +1,141 @@
+"""Benchmark the user list endpoint against a large user table.
+
+Fills a throwaway database with ``--users`` rows (1M by default), then
+times list requests through the API: first and deep cursor pages, filters,
+prefix search and a ``?fields=`` projection.  For contrast it also times the
+bare keyset and ``OFFSET`` queries for a page at the same depth and, with
+``--legacy``, the old behaviour of serializing the whole table at once.
+
+Usage::
+
+    python manage.py bench_user_list
+    python manage.py bench_user_list --users 200000 --repeat 50 --legacy
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication.serializers.user_serializer import CustomUserSerializer
+from core.benchmarks import bench_database, count_round_trips, format_table
+from users.models import CustomUser
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Time user list pages, filters and projections on a large table"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=100,
+            help="Cursor pages to walk before timing the deep page.",
+        )
+        parser.add_argument(
+            "--legacy",
+            action="store_true",
+            help="Also serialize the whole table, as the unpaginated list did.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        with bench_database():
+            self.stdout.write(f"Creating {options['users']:,} users...")
+            self.populate(options["users"])
+            connection.cursor().execute("ANALYZE")
+
+            client = APIClient(HTTP_HOST="localhost")
+            client.force_authenticate(CustomUser.objects.first())
+            url = "/api/auth/users/"
+
+            deep_url = url
+            for _ in range(options["depth"]):
+                deep_url = client.get(deep_url, secure=True).data["next"]
+
+            cases = (
+                ("first page", url),
+                (f"cursor page {options['depth']}", deep_url),
+                ("level=7", f"{url}?level=7"),
+                ("search=user12", f"{url}?search=user12"),
+                ("fields=id,username", f"{url}?fields=id,username"),
+            )
+            rows = [
+                self.time_request(client, label, path, options["repeat"])
+                for label, path in cases
+            ]
+            rows.extend(self.time_page_queries(options["depth"], options["repeat"]))
+            if options["legacy"]:
+                rows.append(self.time_full_list())
+
+        self.stdout.write("")
+        self.stdout.write(format_table(("request", "queries", "rows", "ms/req"), rows))
+
+    def populate(self, count: int) -> None:
+        password = make_password("bench-password-123")
+        joined = timezone.now()
+        for start in range(0, count, BATCH_SIZE):
+            CustomUser.objects.bulk_create(
+                CustomUser(
+                    username=f"user{n}",
+                    email=f"user{n}@example.com",
+                    password=password,
+                    level=n % 10 + 1,
+                    date_joined=joined - timedelta(seconds=n),
+                    is_deleted=n % 50 == 0,
+                )
+                for n in range(start, min(start + BATCH_SIZE, count))
+            )
+
+    def time_request(
+        self, client: APIClient, label: str, path: str, repeat: int
+    ) -> tuple[object, ...]:
+        response = client.get(path, secure=True)
+        if response.status_code != 200:
+            msg = f"GET {path} returned {response.status_code}"
+            raise CommandError(msg)
+        with count_round_trips(connection) as trips:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                client.get(path, secure=True)
+            elapsed = time.perf_counter() - started
+        return (
+            label,
+            f"{trips.queries / repeat:.0f}",
+            len(response.data["results"]),
+            f"{elapsed / repeat * 1000:.2f}",
+        )
+
+    def time_page_queries(self, depth: int, repeat: int) -> list[tuple[object, ...]]:
+        """Time the bare page query at *depth*: keyset vs ``OFFSET``."""
+        queryset = CustomUser.objects.order_by("-date_joined")
+        offset = depth * 50
+        boundary = queryset.values_list("date_joined", flat=True)[offset - 1]
+        pages = (
+            (f"SQL keyset page {depth}", queryset.filter(date_joined__lt=boundary)),
+            (f"SQL offset page {depth}", queryset[offset:]),
+        )
+        rows = []
+        for label, page in pages:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                found = len(page[:50])
+            elapsed = time.perf_counter() - started
+            rows.append((label, 1, found, f"{elapsed / repeat * 1000:.2f}"))
+        return rows
+
+    def time_full_list(self) -> tuple[object, ...]:
+        started = time.perf_counter()
+        rows = CustomUserSerializer(CustomUser.all_objects.all(), many=True).data
+        elapsed = time.perf_counter() - started
+        return ("unpaginated (legacy)", 1, len(rows), f"{elapsed * 1000:.2f}")
@@ -0,0 +1,24 @@
+"""Periodic authentication jobs, run by ``manage.py run_scheduler``."""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from jobs.batches import pk_chunks
+from jobs.registry import scheduled
+
+
+@scheduled("cleanup_expired_tokens", every=timedelta(days=1), at=time(4, 0))
+def cleanup_expired_tokens(batch_size: int) -> int:
+    """Delete expired outstanding tokens and their blacklist entries."""
+    # ``flushexpiredtokens`` in chunks, so no single DELETE (and cascade to
+    # the blacklist) holds locks on the whole expired backlog.
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+    deleted = 0
+    for chunk in pk_chunks(expired, batch_size):
+        _, counts = OutstandingToken.objects.filter(pk__in=chunk).delete()
+        deleted += counts.get(OutstandingToken._meta.label, 0)
+    return deleted
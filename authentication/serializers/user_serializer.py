@@ -1,10 +1,14 @@
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
+from core.serializers.sparse_fieldsets import SparseFieldsetSerializerMixin
 from users.models import CustomUser
 
+EMAIL_TAKEN = "A user with this email already exists."
 
-class CustomUserSerializer(serializers.ModelSerializer):
+
+class CustomUserSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
 
     class Meta:
@@ -24,8 +28,8 @@ class CustomUserSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "date_joined")
 
     def validate_email(self, value: str) -> str:
-        if CustomUser.all_objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
+        if CustomUser.all_objects.with_email(value).exists():
+            raise serializers.ValidationError(EMAIL_TAKEN)
         return value.lower()
 
     def validate_password(self, value: str) -> str:
@@ -36,5 +40,13 @@ class CustomUserSerializer(serializers.ModelSerializer):
         password = validated_data.pop("password")
         user = CustomUser(**validated_data)
         user.set_password(password)
-        user.save()
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            # A concurrent registration took the email between
+            # validate_email and the insert (user_lower_email_uniq).
+            if user.email and CustomUser.all_objects.with_email(user.email).exists():
+                raise serializers.ValidationError({"email": [EMAIL_TAKEN]}) from None
+            raise
         return user
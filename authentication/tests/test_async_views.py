@@ -0,0 +1,87 @@
+"""Tests for the async variants of the I/O-bound auth endpoints."""
+
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.views.logout_view import AsyncLogoutView
+from authentication.views.password_reset_request_view import (
+    AsyncPasswordResetRequestView,
+)
+from authentication.views.user_data_view import AsyncUserDataView
+from jobs.models import QueuedJob
+from users.models import CustomUser
+
+
+class AsyncAuthViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="asyncuser",
+            email="async@example.com",
+            password="strongpassword123",
+        )
+
+    def setUp(self) -> None:
+        self.factory = APIRequestFactory()
+
+    # ─── Password Reset Request ────────────────────────────────────────
+
+    async def test_password_reset_request_queues_email(self) -> None:
+        request = self.factory.post("/", {"email": "ASYNC@example.com"}, format="json")
+        response = await AsyncPasswordResetRequestView.as_view()(request)
+        assert response.status_code == status.HTTP_200_OK
+        job = await QueuedJob.objects.aget()
+        assert job.name == "send_password_reset_email"
+        assert job.payload == {"user_id": str(self.user.pk)}
+
+    async def test_password_reset_request_unknown_email(self) -> None:
+        request = self.factory.post("/", {"email": "nobody@example.com"}, format="json")
+        response = await AsyncPasswordResetRequestView.as_view()(request)
+        assert response.status_code == status.HTTP_200_OK
+        assert not await QueuedJob.objects.aexists()
+
+    # ─── User Data ─────────────────────────────────────────────────────
+
+    async def test_user_data_authenticated(self) -> None:
+        request = self.factory.get("/")
+        force_authenticate(request, user=self.user)
+        response = await AsyncUserDataView.as_view()(request)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["username"] == "asyncuser"
+
+    async def test_user_data_not_modified(self) -> None:
+        request = self.factory.get("/")
+        force_authenticate(request, user=self.user)
+        response = await AsyncUserDataView.as_view()(request)
+        assert response.status_code == status.HTTP_200_OK
+
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH=response["ETag"])
+        force_authenticate(request, user=self.user)
+        response = await AsyncUserDataView.as_view()(request)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    async def test_user_data_unauthenticated(self) -> None:
+        response = await AsyncUserDataView.as_view()(self.factory.get("/"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    # ─── Logout ────────────────────────────────────────────────────────
+
+    async def test_logout_blacklists_token(self) -> None:
+        refresh = await sync_to_async(RefreshToken.for_user)(self.user)
+        request = self.factory.post("/", {"refresh": str(refresh)}, format="json")
+        response = await AsyncLogoutView.as_view()(request)
+        assert response.status_code == status.HTTP_205_RESET_CONTENT
+        assert await BlacklistedToken.objects.filter(
+            token__jti=refresh["jti"]
+        ).aexists()
+
+    async def test_logout_invalid_token(self) -> None:
+        request = self.factory.post("/", {"refresh": "invalid-token"}, format="json")
+        response = await AsyncLogoutView.as_view()(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
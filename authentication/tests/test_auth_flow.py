@@ -12,6 +12,8 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from jobs.models import QueuedJob
+from jobs.queue import run_pending_jobs
 from users.models import CustomUser
 
 
@@ -70,6 +72,35 @@ class AuthFlowTests(APITestCase):
         response = self.client.post(url, payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_register_duplicate_email_in_other_case(self) -> None:
+        self.user.delete()  # soft-deleted accounts keep their email
+        url = reverse("auth:register")
+        payload = {
+            "username": "another",
+            "email": "Test@Example.COM",
+            "password": "newstrongpassword123",
+        }
+        response = self.client.post(url, payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "email" in response.data
+
+    def test_register_race_on_email_is_a_validation_error(self) -> None:
+        url = reverse("auth:register")
+        payload = {
+            "username": "another",
+            "email": "TEST@example.com",
+            "password": "newstrongpassword123",
+        }
+        # As if the other registration committed after validate_email ran.
+        with patch(
+            "authentication.serializers.user_serializer.CustomUserSerializer."
+            "validate_email",
+            side_effect=str.lower,
+        ):
+            response = self.client.post(url, payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "email" in response.data
+
     # ─── Token Refresh ─────────────────────────────────────────────────
 
     def test_token_refresh_success(self) -> None:
@@ -99,19 +130,34 @@ class AuthFlowTests(APITestCase):
 
     # ─── Password Reset Request ────────────────────────────────────────
 
-    @patch("authentication.views.password_reset_request_view.send_email")
+    @patch("authentication.deferred.send_email")
     def test_password_reset_request_sends_email(self, mock_send_email) -> None:
         mock_send_email.return_value = {"id": "email-id"}
         url = reverse("auth:password_reset")
         response = self.client.post(url, {"email": "test@example.com"})
         assert response.status_code == status.HTTP_200_OK
+        # Sent by the worker, once however often it was requested.
+        self.client.post(url, {"email": "test@example.com"})
+        mock_send_email.assert_not_called()
+        assert run_pending_jobs() == 1
         mock_send_email.assert_called_once()
+        assert mock_send_email.call_args.kwargs["to"] == "test@example.com"
+
+    def test_password_reset_request_matches_email_in_any_case(self) -> None:
+        self.user.email = "Test@Example.com"
+        self.user.save()
+        url = reverse("auth:password_reset")
+        self.client.post(url, {"email": "test@EXAMPLE.com"})
+        job = QueuedJob.objects.get()
+        assert job.payload == {"user_id": str(self.user.pk)}
 
-    @patch("authentication.views.password_reset_request_view.send_email")
+    @patch("authentication.deferred.send_email")
     def test_password_reset_request_nonexistent_email(self, mock_send_email) -> None:
         url = reverse("auth:password_reset")
         response = self.client.post(url, {"email": "nobody@example.com"})
         assert response.status_code == status.HTTP_200_OK
+        assert not QueuedJob.objects.exists()
+        run_pending_jobs()
         mock_send_email.assert_not_called()
 
     # ─── Password Reset Confirm ────────────────────────────────────────
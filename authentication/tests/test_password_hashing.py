@@ -0,0 +1,50 @@
+"""Tests for the configurable password hashers and rehash on login."""
+
+from __future__ import annotations
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.hashers import Argon2PasswordHasher
+from users.models import CustomUser
+
+PASSWORD = "a-long-enough-password"
+
+
+class PasswordRehashTests(APITestCase):
+    def setUp(self) -> None:
+        self.user = CustomUser.objects.create_user(
+            username="hashed", email="hashed@example.com"
+        )
+
+    def login(self, password: str = PASSWORD) -> int:
+        return self.client.post(
+            reverse("auth:login"), {"username": "hashed", "password": password}
+        ).status_code
+
+    def stored_hash(self) -> str:
+        self.user.refresh_from_db()
+        return self.user.password
+
+    def test_pbkdf2_hash_is_upgraded_on_login(self) -> None:
+        self.user.password = make_password(PASSWORD, hasher="pbkdf2_sha256")
+        self.user.save(update_fields=["password"])
+
+        assert self.login("wrong") == status.HTTP_401_UNAUTHORIZED
+        assert self.stored_hash().startswith("pbkdf2_sha256$")
+
+        assert self.login() == status.HTTP_200_OK
+        assert identify_hasher(self.stored_hash()).algorithm == "argon2"
+        assert self.login() == status.HTTP_200_OK
+
+    def test_hash_at_other_cost_is_redone_at_the_configured_one(self) -> None:
+        cheaper = type("Cheaper", (Argon2PasswordHasher,), {"time_cost": 1})()
+        self.user.password = cheaper.encode(PASSWORD, cheaper.salt())
+        self.user.save(update_fields=["password"])
+
+        assert self.login() == status.HTTP_200_OK
+        hasher = Argon2PasswordHasher()
+        assert not hasher.must_update(self.stored_hash())
+        assert hasher.decode(self.stored_hash())["time_cost"] == hasher.time_cost
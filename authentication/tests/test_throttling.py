@@ -0,0 +1,127 @@
+"""Tests for the rate limits of the auth endpoints (``core.throttling``)."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from authentication.views.password_reset_request_view import (
+    AsyncPasswordResetRequestView,
+)
+from core.throttling import ClientIPThrottle
+from jobs.models import QueuedJob
+from users.models import CustomUser
+
+RATES = {
+    "login": "5/min",
+    "login_account": "3/min",
+    "password_reset": "5/min",
+    "password_reset_account": "2/min",
+    "token_refresh": "2/min",
+}
+
+
+@override_settings(
+    REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": RATES}
+)
+class AuthThrottleTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="target", email="target@example.com", password="right-pass-123"
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def login(self, username: str, ip: str = "10.0.0.1") -> int:
+        return self.client.post(
+            reverse("auth:login"),
+            {"username": username, "password": "wrong"},
+            REMOTE_ADDR=ip,
+        ).status_code
+
+    # ─── Login ─────────────────────────────────────────────────────────
+
+    def test_account_limit_spans_ips_and_skips_the_hash(self) -> None:
+        with mock.patch(
+            "rest_framework_simplejwt.serializers.authenticate", wraps=authenticate
+        ) as spy:
+            codes = [self.login("Target", ip=f"10.0.0.{n}") for n in range(5)]
+        assert codes == [401, 401, 401, 429, 429]
+        assert spy.call_count == 3
+
+        response = self.client.post(
+            reverse("auth:login"), {"username": "target", "password": "x"}
+        )
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert 0 < int(response["Retry-After"]) <= 60
+        # Other accounts are still served.
+        assert self.login("someone-else") == status.HTTP_401_UNAUTHORIZED
+
+    def test_ip_limit_spans_accounts(self) -> None:
+        codes = [self.login(f"user{n}") for n in range(6)]
+        assert codes[-1] == status.HTTP_429_TOO_MANY_REQUESTS
+        assert self.login("user0", ip="10.0.0.2") == status.HTTP_401_UNAUTHORIZED
+
+    @override_settings(THROTTLE_ENABLED=False)
+    def test_limits_can_be_turned_off(self) -> None:
+        assert {self.login("target") for _ in range(6)} == {401}
+
+    # ─── Token Refresh / Password Reset ────────────────────────────────
+
+    def test_token_refresh_is_limited_per_ip(self) -> None:
+        url = reverse("auth:token_refresh")
+        codes = [self.client.post(url, {"refresh": "x"}).status_code for _ in range(3)]
+        assert codes[-1] == status.HTTP_429_TOO_MANY_REQUESTS
+
+    async def test_password_reset_is_limited_per_email(self) -> None:
+        factory = APIRequestFactory()
+        codes = []
+        for n in range(3):
+            request = factory.post(
+                "/",
+                {"email": "TARGET@example.com"},
+                format="json",
+                REMOTE_ADDR=f"10.0.1.{n}",
+            )
+            response = await AsyncPasswordResetRequestView.as_view()(request)
+            codes.append(response.status_code)
+        assert codes == [200, 200, 429]
+        assert await QueuedJob.objects.acount() == 1
+
+
+class SlidingWindowTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.view = mock.Mock(throttle_scope="sliding")
+        self.request = mock.Mock(META={"REMOTE_ADDR": "10.0.0.9"})
+
+    def allowed(self, at: float) -> bool:
+        with mock.patch("core.throttling.time.time", return_value=at):
+            return ClientIPThrottle().allow_request(self.request, self.view)
+
+    @override_settings(
+        REST_FRAMEWORK={
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {"sliding": "4/min"},
+        }
+    )
+    def test_previous_window_weighs_by_its_remaining_share(self) -> None:
+        start = 600.0  # the start of a window
+        assert all(self.allowed(start + 50) for _ in range(4))
+        assert not self.allowed(start + 55)  # counted all the same
+        # 15 s into the next window, 3/4 of the previous one still counts
+        # (5 * 0.75 + 1 > 4): no fresh burst right after the boundary.
+        assert not self.allowed(start + 75)
+        # At 45 s only 1/4 does: 5 * 0.25 + 2 <= 4.
+        assert self.allowed(start + 105)
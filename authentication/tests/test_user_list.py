@@ -0,0 +1,99 @@
+"""Tests for the paginated, filterable user list."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import CustomUser
+
+
+class UserListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        now = timezone.now()
+        cls.users = [
+            CustomUser.objects.create_user(
+                username=name,
+                email=f"{name}@example.com",
+                password="x",
+                level=level,
+                date_joined=now - timedelta(days=days),
+            )
+            for name, level, days in (
+                ("alice", 1, 3),
+                ("albert", 2, 2),
+                ("bob", 2, 1),
+                ("carol", 5, 0),
+            )
+        ]
+        CustomUser.objects.create_user(
+            username="ghost", email="ghost@example.com", password="x"
+        ).delete()
+        cls.url = reverse("auth:user-list")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.users[0])
+
+    def usernames(self, response) -> list[str]:
+        return [user["username"] for user in response.data["results"]]
+
+    # ─── Pagination ────────────────────────────────────────────────────
+
+    def test_pages_newest_first_without_deleted_users(self) -> None:
+        response = self.client.get(self.url, {"page_size": 3})
+        assert response.status_code == status.HTTP_200_OK
+        assert self.usernames(response) == ["carol", "bob", "albert"]
+        assert "count" not in response.data
+
+        response = self.client.get(response.data["next"])
+        assert self.usernames(response) == ["alice"]
+        assert response.data["next"] is None
+
+    # ─── Filtering ─────────────────────────────────────────────────────
+
+    def test_filter_by_level(self) -> None:
+        response = self.client.get(self.url, {"level": 2})
+        assert self.usernames(response) == ["bob", "albert"]
+
+        response = self.client.get(self.url, {"level_min": 3})
+        assert self.usernames(response) == ["carol"]
+
+    def test_search_matches_username_or_email_prefix(self) -> None:
+        response = self.client.get(self.url, {"search": "AL"})
+        assert self.usernames(response) == ["albert", "alice"]
+
+        response = self.client.get(self.url, {"search": "lice"})
+        assert self.usernames(response) == []
+
+    # ─── Sparse Fieldsets ──────────────────────────────────────────────
+
+    def test_fields_limit_response_and_selected_columns(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"fields": "id,username"})
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["results"][0]) == {"id", "username"}
+        select = next(q["sql"] for q in queries if "users_customuser" in q["sql"])
+        assert '"email"' not in select
+        assert '"date_joined"' in select
+
+    def test_unknown_field_is_rejected(self) -> None:
+        response = self.client.get(self.url, {"fields": "id,nope"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "fields" in response.data
+
+    def test_fields_ignored_on_create(self) -> None:
+        payload = {
+            "username": "dave",
+            "email": "dave@example.com",
+            "password": "newstrongpassword123",
+        }
+        response = self.client.post(f"{self.url}?fields=id", payload)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["username"] == "dave"
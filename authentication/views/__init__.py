@@ -1,14 +1,20 @@
 from authentication.views.login_view import LoginView
-from authentication.views.logout_view import LogoutView
+from authentication.views.logout_view import AsyncLogoutView, LogoutView
 from authentication.views.password_reset_confirm_view import PasswordResetConfirmView
-from authentication.views.password_reset_request_view import PasswordResetRequestView
+from authentication.views.password_reset_request_view import (
+    AsyncPasswordResetRequestView,
+    PasswordResetRequestView,
+)
 from authentication.views.register_view import RegisterView
 from authentication.views.token_refresh_view import TokenRefreshAPIView
-from authentication.views.user_data_view import UserDataView
+from authentication.views.user_data_view import AsyncUserDataView, UserDataView
 from authentication.views.user_detail_view import UserRetrieveUpdateDestroy
 from authentication.views.user_list_view import UserListCreate
 
 __all__ = [
+    "AsyncLogoutView",
+    "AsyncPasswordResetRequestView",
+    "AsyncUserDataView",
     "LoginView",
     "LogoutView",
     "PasswordResetConfirmView",
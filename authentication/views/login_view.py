@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 
 from authentication.serializers.auth_serializers import LoginSerializer
+from core.throttling import AccountThrottle, ClientIPThrottle
 
 
 @extend_schema(
@@ -24,11 +25,16 @@ from authentication.serializers.auth_serializers import LoginSerializer
             },
         },
         401: {"description": "Invalid credentials"},
+        429: {"description": "Too many attempts for this IP or username"},
     },
 )
 class LoginView(TokenObtainPairView):
     serializer_class = LoginSerializer
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+    # Checked before the serializer hashes the password.
+    throttle_classes: ClassVar[list[type]] = [ClientIPThrottle, AccountThrottle]
+    throttle_scope = "login"
+    throttle_account_field = "username"
 
     def post(self, request: Request, *args: object, **kwargs: object) -> Response:
         return super().post(request, *args, **kwargs)
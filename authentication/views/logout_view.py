@@ -2,6 +2,9 @@
 
 from typing import ClassVar
 
+from adrf.views import APIView as AsyncAPIView
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
@@ -9,12 +12,21 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
 
 from authentication.serializers.auth_serializers import LogoutSerializer
+from core.views.mixins import TransactionPolicyMixin
+
+User = get_user_model()
 
 
-@extend_schema(
+logout_schema = extend_schema(
     tags=["Authentication"],
     summary="Logout",
     description=(
@@ -27,7 +39,28 @@ from authentication.serializers.auth_serializers import LogoutSerializer
         400: {"description": "Bad request (invalid or missing token)"},
     },
 )
-class LogoutView(APIView):
+
+
+async def ablacklist(token: RefreshToken) -> None:
+    """Async-ORM port of ``RefreshToken.blacklist``."""
+    jti = token.payload[api_settings.JTI_CLAIM]
+    user_id = token.payload.get(api_settings.USER_ID_CLAIM)
+    user = await User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).afirst()
+
+    outstanding, _ = await OutstandingToken.objects.aget_or_create(
+        jti=jti,
+        defaults={
+            "user": user,
+            "created_at": token.current_time,
+            "token": str(token),
+            "expires_at": datetime_from_epoch(token.payload["exp"]),
+        },
+    )
+    await BlacklistedToken.objects.aget_or_create(token=outstanding)
+
+
+@logout_schema
+class LogoutView(TransactionPolicyMixin, APIView):
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
 
     def post(self, request: Request, *args: object, **kwargs: object) -> Response:
@@ -48,3 +81,30 @@ class LogoutView(APIView):
             {"detail": "Successfully logged out."},
             status=status.HTTP_205_RESET_CONTENT,
         )
+
+
+@logout_schema
+class AsyncLogoutView(AsyncAPIView):
+    """Async variant that blacklists the token through the async ORM."""
+
+    permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+
+    async def post(self, request: Request, *args: object, **kwargs: object) -> Response:
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        refresh_token = serializer.validated_data["refresh"]
+        try:
+            # Verification includes a (sync) blacklist lookup.
+            token = await sync_to_async(RefreshToken)(refresh_token)
+        except TokenError as exc:
+            return Response(
+                {"detail": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        await ablacklist(token)
+
+        return Response(
+            {"detail": "Successfully logged out."},
+            status=status.HTTP_205_RESET_CONTENT,
+        )
@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from authentication.serializers.auth_serializers import PasswordResetConfirmSerializer
+from core.views.mixins import TransactionPolicyMixin
 
 User = get_user_model()
 
@@ -36,7 +37,7 @@ User = get_user_model()
         400: {"description": "Invalid token, uid, or password mismatch"},
     },
 )
-class PasswordResetConfirmView(APIView):
+class PasswordResetConfirmView(TransactionPolicyMixin, APIView):
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
 
     def post(self, request: Request, *args: object, **kwargs: object) -> Response:
@@ -1,11 +1,10 @@
-"""Password reset request view — sends a reset link via Resend."""
+"""Password reset request view — queues a reset link email."""
 
-from typing import ClassVar
+import time
+from typing import Any, ClassVar
 
+from adrf.views import APIView as AsyncAPIView
 from django.contrib.auth import get_user_model
-from django.contrib.auth.tokens import PasswordResetTokenGenerator
-from django.utils.encoding import force_bytes
-from django.utils.http import urlsafe_base64_encode
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
@@ -14,13 +13,22 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from authentication.serializers.auth_serializers import PasswordResetRequestSerializer
-from core.email import send_email
-from django.conf import settings
+from core.throttling import AccountThrottle, ClientIPThrottle
+from jobs.queue import aenqueue, enqueue
 
 User = get_user_model()
 
 
-@extend_schema(
+def reset_email_key(user: Any) -> str:
+    """Idempotency key allowing one queued reset email per user and minute."""
+    return f"password-reset:{user.pk}:{int(time.time() // 60)}"
+
+
+RESET_REQUESTED_DETAIL = (
+    "If an account with that email exists, a reset link has been sent."
+)
+
+password_reset_request_schema = extend_schema(
     tags=["Authentication"],
     summary="Request Password Reset",
     description=(
@@ -35,55 +43,68 @@ User = get_user_model()
                 "detail": {"type": "string"},
             },
         },
+        429: {"description": "Too many requests for this IP or email"},
     },
 )
+
+
+@password_reset_request_schema
 class PasswordResetRequestView(APIView):
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+    throttle_classes: ClassVar[list[type]] = [ClientIPThrottle, AccountThrottle]
+    throttle_scope = "password_reset"
+    throttle_account_field = "email"
 
     def post(self, request: Request, *args: object, **kwargs: object) -> Response:
         serializer = PasswordResetRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data["email"]
 
-        user = User.all_objects.filter(email__iexact=email).first()
+        user = User.all_objects.with_email(email).first()
         if user is not None and user.is_active:
-            token_generator = PasswordResetTokenGenerator()
-            token = token_generator.make_token(user)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-
-            reset_url = (
-                f"{settings.FRONTEND_URL.rstrip('/')}/reset-password?uid={uid}&token={token}"
+            # Sent by a worker, so Resend's latency and outages stay out of
+            # the request; repeated requests within a minute send one email.
+            enqueue(
+                "send_password_reset_email",
+                {"user_id": str(user.pk)},
+                key=reset_email_key(user),
             )
 
-            template_id = settings.RESEND_PASSWORD_RESET_TEMPLATE_ID
-            if template_id:
-                send_email(
-                    to=user.email,
-                    template_id=template_id,
-                    data={
-                        "username": user.get_username(),
-                        "reset_url": reset_url,
-                    },
-                )
-            else:
-                send_email(
-                    to=user.email,
-                    subject="Password Reset Request",
-                    text=(
-                        f"Hi {user.get_username()},\n\n"
-                        f"You requested a password reset. Click the link below:\n"
-                        f"{reset_url}\n\n"
-                        f"If you didn't request this, you can ignore this email."
-                    ),
-                    html=(
-                        f"<p>Hi {user.get_username()},</p>"
-                        f"<p>You requested a password reset. Click the link below:</p>"
-                        f'<p><a href="{reset_url}">Reset Password</a></p>'
-                        f"<p>If you didn't request this, you can ignore this email.</p>"
-                    ),
-                )
+        return Response(
+            {"detail": RESET_REQUESTED_DETAIL},
+            status=status.HTTP_200_OK,
+        )
+
+
+@password_reset_request_schema
+class AsyncPasswordResetRequestView(AsyncAPIView):
+    """
+    Async variant that queues the email without blocking a worker.
+
+    It used to await the Resend API itself, which is what made it pay off
+    under ASGI.  Now the job queue sends the email, so all that is left is
+    one INSERT, and the sync view is faster (see ``bench_async_auth``).
+    """
+
+    permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+    throttle_classes: ClassVar[list[type]] = [ClientIPThrottle, AccountThrottle]
+    throttle_scope = "password_reset"
+    throttle_account_field = "email"
+
+    async def post(self, request: Request, *args: object, **kwargs: object) -> Response:
+        serializer = PasswordResetRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        email = serializer.validated_data["email"]
+
+        user = await User.all_objects.with_email(email).afirst()
+        if user is not None and user.is_active:
+            await aenqueue(
+                "send_password_reset_email",
+                {"user_id": str(user.pk)},
+                key=reset_email_key(user),
+            )
 
         return Response(
-            {"detail": "If an account with that email exists, a reset link has been sent."},
+            {"detail": RESET_REQUESTED_DETAIL},
             status=status.HTTP_200_OK,
         )
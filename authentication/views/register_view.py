@@ -7,6 +7,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from authentication.serializers.user_serializer import CustomUserSerializer
+from core.throttling import ClientIPThrottle
+from core.views.mixins import TransactionPolicyMixin
 
 
 @extend_schema(
@@ -17,11 +19,14 @@ from authentication.serializers.user_serializer import CustomUserSerializer
     responses={
         201: CustomUserSerializer,
         400: {"description": "Validation error"},
+        429: {"description": "Too many registrations from this IP"},
     },
 )
-class RegisterView(generics.CreateAPIView):
+class RegisterView(TransactionPolicyMixin, generics.CreateAPIView):
     serializer_class = CustomUserSerializer
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+    throttle_classes: ClassVar[list[type]] = [ClientIPThrottle]
+    throttle_scope = "register"
 
     def create(self, request: Request, *_args: object, **_kwargs: object) -> Response:
         serializer = self.get_serializer(data=request.data)
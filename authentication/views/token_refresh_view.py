@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from authentication.serializers.auth_serializers import TokenRefreshAPIViewSerializer
+from core.throttling import ClientIPThrottle
 
 
 @extend_schema(
@@ -23,11 +24,14 @@ from authentication.serializers.auth_serializers import TokenRefreshAPIViewSeria
             },
         },
         401: {"description": "Invalid or expired refresh token"},
+        429: {"description": "Too many requests from this IP"},
     },
 )
 class TokenRefreshAPIView(TokenRefreshView):
     serializer_class = TokenRefreshAPIViewSerializer
     permission_classes: ClassVar[list[AllowAny]] = [AllowAny]
+    throttle_classes: ClassVar[list[type]] = [ClientIPThrottle]
+    throttle_scope = "token_refresh"
 
     def post(self, request: Request, *args: object, **kwargs: object) -> Response:
         return super().post(request, *args, **kwargs)
@@ -3,16 +3,37 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from authentication.serializers.user_serializer import CustomUserSerializer
-from core.views.authenticated_views import AuthenticatedGenericAPIView
-
+from core.views.authenticated_views import (
+    AsyncAuthenticatedGenericAPIView,
+    AuthenticatedGenericAPIView,
+)
+from core.views.mixins import (
+    ConditionalGetMixin,
+    ConditionalValidators,
+    conditional_etag,
+)
 
-@extend_schema(
+user_data_schema = extend_schema(
     tags=["Users"],
     summary="Current User",
     description="Retrieve the profile data of the currently authenticated user.",
     responses={200: CustomUserSerializer},
 )
-class UserDataView(AuthenticatedGenericAPIView):
+
+
+class CurrentUserConditionalGetMixin(ConditionalGetMixin):
+    """Conditional GET validators of the requesting user's own row."""
+
+    def get_conditional_validators(self, request: Request) -> ConditionalValidators:
+        # Authentication already loaded the user row: no extra query.
+        updated_at = request.user.updated_at
+        return ConditionalValidators(
+            conditional_etag(request, updated_at.isoformat()), updated_at
+        )
+
+
+@user_data_schema
+class UserDataView(CurrentUserConditionalGetMixin, AuthenticatedGenericAPIView):
     serializer_class = CustomUserSerializer
 
     def get(self, request: Request, *_args, **_kwargs) -> Response:
@@ -25,3 +46,16 @@ class UserDataView(AuthenticatedGenericAPIView):
         user = request.user
         serializer = self.get_serializer(user)
         return Response(serializer.data, status=200)
+
+
+@user_data_schema
+class AsyncUserDataView(
+    CurrentUserConditionalGetMixin, AsyncAuthenticatedGenericAPIView
+):
+    """Async variant; authentication runs off the event loop via adrf."""
+
+    serializer_class = CustomUserSerializer
+
+    async def get(self, request: Request, *_args, **_kwargs) -> Response:
+        serializer = self.get_serializer(request.user)
+        return Response(serializer.data, status=200)
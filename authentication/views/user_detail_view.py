@@ -2,6 +2,7 @@ from drf_spectacular.utils import extend_schema
 
 from authentication.serializers.user_serializer import CustomUserSerializer
 from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin
 from users.models import CustomUser
 
 
@@ -17,7 +18,9 @@ from users.models import CustomUser
         204: {"description": "User deleted successfully."},
     },
 )
-class UserRetrieveUpdateDestroy(AuthenticatedRetrieveUpdateDestroyAPIView):
+class UserRetrieveUpdateDestroy(
+    ConditionalGetMixin, AuthenticatedRetrieveUpdateDestroyAPIView
+):
     """
     View to retrieve, update, or delete a specific user by primary key.
 
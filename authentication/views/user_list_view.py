@@ -1,30 +1,54 @@
-from drf_spectacular.utils import extend_schema
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.permissions import IsAuthenticated
 
+from authentication.filters import UserFilter
 from authentication.serializers.user_serializer import CustomUserSerializer
+from core.pagination import DefaultCursorPagination
 from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import FastListMixin, SparseFieldsetMixin
 from users.models import CustomUser
 
 
+class UserCursorPagination(DefaultCursorPagination):
+    ordering = "-date_joined"
+
+
 @extend_schema(
     tags=["Users"],
     summary="List / Create Users",
     description=(
-        "List all users or create a new user. Requires authentication."
+        "List users newest first, one cursor page at a time, or create a new "
+        "user. Filter with `level`, `level_min`, `level_max`, `is_active` and "
+        "`search` (username/email prefix); pick columns with `fields=a,b`. "
+        "Requires authentication."
     ),
+    parameters=[
+        OpenApiParameter(
+            "fields",
+            OpenApiTypes.STR,
+            description="Comma-separated subset of fields to return.",
+        ),
+    ],
     responses={
         200: CustomUserSerializer(many=True),
         201: CustomUserSerializer,
     },
 )
-class UserListCreate(AuthenticatedListCreateAPIView):
+class UserListCreate(
+    FastListMixin, SparseFieldsetMixin, AuthenticatedListCreateAPIView
+):
     """
     View to list all users or create a new user.
 
     * Requires token authentication.
-    * Only admin users are able to access this view.
+    * Soft-deleted users are not listed.
     """
 
-    queryset = CustomUser.all_objects.all()
+    queryset = CustomUser.objects.all()
     serializer_class = CustomUserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = UserCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = UserFilter
@@ -0,0 +1,142 @@
+"""Shared admin building blocks for large, soft-deleted tables."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, ClassVar
+
+from django.conf import settings
+from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.db.models.functions import Lower
+from django.http import HttpRequest
+from django.utils import timezone
+
+
+def estimated_row_count(queryset: QuerySet) -> int | None:
+    """Return the planner's row estimate for *queryset*'s table.
+
+    Only unfiltered querysets on PostgreSQL have one; ``None`` otherwise,
+    including for tables that were never analyzed.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or query.where or query.distinct:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row[0] if row is not None and row[0] >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips ``COUNT(*)`` on huge, unfiltered tables.
+
+    When the planner estimates more than ``ADMIN_ESTIMATED_COUNT_THRESHOLD``
+    rows, the estimate from ``pg_class`` is used as the count; the last
+    pages may then be short or missing.  Filtered lists count exactly.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimated_row_count(self.object_list)
+            if (
+                estimate is not None
+                and estimate > settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+
+class PrefixSearchMixin:
+    """
+    Case-insensitive prefix search written as ``LOWER(column) LIKE 'term%'``.
+
+    On PostgreSQL this is the form ``LOWER(column) text_pattern_ops``
+    indexes serve, unlike the admin's default ``UPPER(column) LIKE
+    '%term%'`` which scans the table.  The admin lists soft-deleted rows
+    too, so those indexes must not be partial on ``is_deleted``: see
+    users migration 0008 and productivity migration 0011.  Every word of
+    the search term must prefix-match one of ``search_fields``.
+    """
+
+    def get_search_results(
+        self, request: HttpRequest, queryset: QuerySet, search_term: str
+    ) -> tuple[QuerySet, bool]:
+        fields = self.get_search_fields(request)  # type: ignore[attr-defined]
+        for word in search_term.lower().split():
+            aliases = {f"{field}_lower": Lower(field) for field in fields}
+            condition = Q()
+            for alias in aliases:
+                condition |= Q(**{f"{alias}__startswith": word})
+            queryset = queryset.alias(**aliases).filter(condition)
+        return queryset, False
+
+
+class SoftDeleteAdminMixin:
+    """
+    Admin defaults for ``BaseModel`` tables.
+
+    * lists every row, soft-deleted ones included;
+    * never counts the whole table (``show_full_result_count``) and uses
+      :class:`EstimatedCountPaginator`;
+    * replaces the per-object "delete selected" action (which walks the
+      related-object collector) with batched soft-delete and restore
+      actions that issue a single ``UPDATE``.
+    """
+
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    list_per_page = 50
+    actions: ClassVar[tuple[str, ...]] = ("soft_delete_selected", "restore_selected")
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset = self.model.all_objects.all()  # type: ignore[attr-defined]
+        ordering = self.get_ordering(request)  # type: ignore[attr-defined]
+        return queryset.order_by(*ordering) if ordering else queryset
+
+    def get_actions(self, request: HttpRequest) -> dict[str, Any]:
+        actions = super().get_actions(request)  # type: ignore[misc]
+        actions.pop("delete_selected", None)
+        return actions
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet) -> None:
+        self._soft_delete(queryset)
+
+    def _soft_delete(self, queryset: QuerySet) -> int:
+        now = timezone.now()
+        # updated_at is set by hand: update() bypasses auto_now, and the
+        # sync feed and ETags key off it.
+        return queryset.filter(is_deleted=False).update(
+            is_deleted=True, deleted_at=now, updated_at=now
+        )
+
+    @admin.action(description="Soft delete selected %(verbose_name_plural)s")
+    def soft_delete_selected(self, request: HttpRequest, queryset: QuerySet) -> None:
+        count = self._soft_delete(queryset)
+        self.message_user(request, f"Soft deleted {count} record(s).", messages.SUCCESS)  # type: ignore[attr-defined]
+
+    @admin.action(description="Restore selected %(verbose_name_plural)s")
+    def restore_selected(self, request: HttpRequest, queryset: QuerySet) -> None:
+        count = queryset.filter(is_deleted=True).update(
+            is_deleted=False, deleted_at=None, updated_at=timezone.now()
+        )
+        self.message_user(request, f"Restored {count} record(s).", messages.SUCCESS)  # type: ignore[attr-defined]
+
+
+class SoftDeleteAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    """``ModelAdmin`` with :class:`SoftDeleteAdminMixin` applied."""
+
+    list_filter: ClassVar[tuple[str, ...]] = ("is_deleted",)
+    readonly_fields: ClassVar[tuple[str, ...]] = (
+        "created_at",
+        "updated_at",
+        "deleted_at",
+    )
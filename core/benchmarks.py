@@ -0,0 +1,301 @@
+"""Helpers shared by the ``bench_*`` management commands.
+
+These are development tools: they start local servers, generate load and
+print small result tables.  Nothing here is imported by the application at
+request time.
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.test.utils import CaptureQueriesContext
+
+
+def free_port() -> int:
+    """Return a TCP port that is currently free on localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@dataclass
+class LoadResult:
+    """Outcome of a load run against a single URL."""
+
+    requests: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Latency percentile in milliseconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index] * 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return statistics.fmean(self.latencies) * 1000 if self.latencies else 0.0
+
+
+def run_http_load(
+    url: str,
+    *,
+    concurrency: int,
+    duration: float,
+    method: str = "GET",
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+) -> LoadResult:
+    """Hammer *url* from *concurrency* threads for *duration* seconds.
+
+    Each thread keeps its own keep-alive connection so the client side does
+    not dominate the measurement.  Any non-2xx/3xx response counts as an
+    error.
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    result = LoadResult()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker() -> None:
+        latencies, errors = _request_until(
+            parts.hostname, parts.port, deadline, method, path, body, headers or {}
+        )
+        with lock:
+            result.latencies.extend(latencies)
+            result.errors += errors
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    result.requests = len(result.latencies)
+    return result
+
+
+def _request_until(
+    host: str | None,
+    port: int | None,
+    deadline: float,
+    method: str,
+    path: str,
+    body: bytes | None,
+    headers: dict[str, str],
+) -> tuple[list[float], int]:
+    """Send requests on one keep-alive connection until *deadline*.
+
+    Returns the latencies of the answered requests and the error count.
+    """
+    conn: http.client.HTTPConnection | None = None
+    latencies: list[float] = []
+    errors = 0
+    while time.perf_counter() < deadline:
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = None
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.status >= 400:
+            errors += 1
+        if response.getheader("Connection", "").lower() == "close":
+            conn.close()
+            conn = None
+    if conn is not None:
+        conn.close()
+    return latencies, errors
+
+
+def wait_for_http(url: str, *, timeout: float = 30.0) -> None:
+    """Block until *url* answers any HTTP response, or raise ``TimeoutError``."""
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            conn.request("GET", parts.path or "/")
+            conn.getresponse().read()
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.2)
+        else:
+            conn.close()
+            return
+    msg = f"Server at {url} did not come up within {timeout:.0f}s"
+    raise TimeoutError(msg)
+
+
+@contextmanager
+def serve_process(
+    serve_args: Sequence[str],
+    *,
+    env: dict[str, str] | None = None,
+    ready_path: str = "/",
+) -> Iterator[str]:
+    """Run ``manage.py serve`` in a subprocess and yield its base URL.
+
+    The server binds a free localhost port; its output is discarded so the
+    benchmark tables stay readable.
+    """
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            str(settings.BASE_DIR / "manage.py"),
+            "serve",
+            "--bind",
+            f"127.0.0.1:{port}",
+            *serve_args,
+        ],
+        env={**os.environ, "GUNICORN_ACCESSLOG": "", **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_http(base_url + ready_path)
+        yield base_url
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+@contextmanager
+def bench_database() -> Iterator[dict[str, str]]:
+    """Create a throwaway, migrated copy of the default database.
+
+    Yields the environment overrides that point a ``manage.py serve``
+    subprocess at the same database, and drops it afterwards, so benchmarks
+    never touch real data.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    old_name = connection.settings_dict["NAME"]
+    test_settings = connection.settings_dict["TEST"]
+    old_test_name = test_settings.get("NAME")
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            if connection.vendor == "sqlite":
+                # The default SQLite test database lives in memory, which
+                # other processes cannot see.
+                test_settings["NAME"] = os.path.join(tmp, "bench.sqlite3")
+            test_name = connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False
+            )
+            try:
+                yield {"POSTGRES_DB": test_name}
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+        finally:
+            test_settings["NAME"] = old_test_name
+
+
+_TRANSACTION_SQL = frozenset({"BEGIN", "COMMIT", "ROLLBACK"})
+
+
+@dataclass
+class RoundTrips:
+    """Statements sent to the database server, by kind."""
+
+    queries: int = 0
+    begins: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.queries + self.begins + self.commits + self.rollbacks
+
+
+@contextmanager
+def count_round_trips(connection: BaseDatabaseWrapper) -> Iterator[RoundTrips]:
+    """Count queries plus the BEGIN/COMMIT/ROLLBACK issued on *connection*.
+
+    ``CaptureQueriesContext`` only sees statements run through cursors; the
+    transaction control statements are counted by wrapping the connection's
+    own methods.
+    """
+    counts = RoundTrips()
+    set_autocommit, commit, rollback = (
+        connection.set_autocommit,
+        connection.commit,
+        connection.rollback,
+    )
+
+    def counting_set_autocommit(
+        autocommit: bool, *args: object, **kwargs: object
+    ) -> None:
+        if not autocommit:
+            counts.begins += 1
+        set_autocommit(autocommit, *args, **kwargs)
+
+    def counting_commit() -> None:
+        counts.commits += 1
+        commit()
+
+    def counting_rollback() -> None:
+        counts.rollbacks += 1
+        rollback()
+
+    connection.set_autocommit = counting_set_autocommit
+    connection.commit = counting_commit
+    connection.rollback = counting_rollback
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            yield counts
+            # Read before the context exits.  Some backends (SQLite) log their
+            # transaction statements as queries; those are counted above.
+            counts.queries = sum(
+                1 for query in queries if query["sql"] not in _TRANSACTION_SQL
+            )
+    finally:
+        del connection.set_autocommit, connection.commit, connection.rollback
+
+
+def format_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> str:
+    """Render rows as a fixed-width text table."""
+    cells = [[str(h) for h in headers], *[[str(c) for c in row] for row in rows]]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = [
+        "  ".join(c.rjust(w) for c, w in zip(row, widths, strict=True)) for row in cells
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
@@ -0,0 +1,24 @@
+"""Connection pool introspection.
+
+Pools live per worker process (see ``DATABASE_POOL`` in settings), so the
+numbers describe the process that answers the call.
+"""
+
+from __future__ import annotations
+
+from django.db import connections
+
+
+def pool_stats() -> dict[str, dict[str, int] | None]:
+    """Return psycopg pool counters per database alias.
+
+    Aliases without a pool (persistent or per-request connections, or a
+    backend other than PostgreSQL) map to ``None``.  ``get_stats()`` reports
+    gauges such as ``pool_size`` and ``pool_available`` plus counters such as
+    ``requests_waiting`` and ``connections_errors``; see the psycopg_pool docs.
+    """
+    stats: dict[str, dict[str, int] | None] = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        stats[alias] = pool.get_stats() if pool is not None else None
+    return stats
@@ -0,0 +1,83 @@
+"""Database routers.
+
+``ReadReplicaRouter`` sends reads to the replica alias, but only inside a
+:func:`replica_reads` block.  Views opt in per request (see
+``core.views.mixins.TransactionPolicyMixin``); everything else — writes,
+admin, management commands, signal handlers — stays on ``default``.
+
+Replicas lag behind the primary, so a user who just wrote something is
+pinned to the primary for ``DATABASE_REPLICA_STICKY_SECONDS`` (see
+:func:`mark_sticky`) and sees their own writes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+def replica_alias() -> str | None:
+    """Return the configured replica alias, or ``None`` if there is none."""
+    alias = settings.DATABASE_REPLICA_ALIAS
+    return alias if alias in settings.DATABASES else None
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Route ORM reads issued inside the block to the replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Force reads inside the block to the primary, even within replica_reads."""
+    token = _replica_reads.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def _sticky_key(user_id: object) -> str:
+    return f"db:primary-sticky:{user_id}"
+
+
+def mark_sticky(user_id: object) -> None:
+    """Pin *user_id*'s reads to the primary while the replica catches up."""
+    if replica_alias() is not None:
+        cache.set(_sticky_key(user_id), True, settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+def is_sticky(user_id: object) -> bool:
+    """Return whether *user_id* wrote recently enough to need the primary."""
+    return bool(cache.get(_sticky_key(user_id)))
+
+
+class ReadReplicaRouter:
+    """Route reads to the replica inside :func:`replica_reads`, writes to default."""
+
+    def db_for_read(self, model: type, **hints: Any) -> str | None:
+        if _replica_reads.get():
+            return replica_alias()
+        return None
+
+    def db_for_write(self, model: type, **hints: Any) -> str:
+        # Objects loaded from the replica remember it in ``_state.db``;
+        # without an explicit answer Django would write them back there.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # Both aliases hold the same data.
+        return True
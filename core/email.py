@@ -5,9 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from django.conf import settings
-
 import resend
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +50,30 @@ def send_email(
         logger.warning("RESEND_API_KEY is not configured; email not sent.")
         return {"id": "mock-email-id", "warning": "No RESEND_API_KEY configured"}
 
+    params = _build_params(
+        to=to, subject=subject, html=html, text=text, template_id=template_id, data=data
+    )
+
+    try:
+        response = resend.Emails.send(params)
+        logger.info(
+            "Email sent to %s via Resend (id=%s)", params["to"], response.get("id")
+        )
+        return response
+    except Exception:
+        logger.exception("Failed to send email to %s", params["to"])
+        raise
+
+
+def _build_params(
+    *,
+    to: str | list[str],
+    subject: str,
+    html: str,
+    text: str,
+    template_id: str,
+    data: dict[str, Any] | None,
+) -> dict[str, Any]:
     resend.api_key = settings.RESEND_API_KEY
 
     recipients: list[str] = [to] if isinstance(to, str) else list(to)
@@ -72,10 +95,4 @@ def send_email(
         if text:
             params["text"] = text
 
-    try:
-        response = resend.Emails.send(params)
-        logger.info("Email sent to %s via Resend (id=%s)", recipients, response.get("id"))
-        return response
-    except Exception:
-        logger.exception("Failed to send email to %s", recipients)
-        raise
+    return params
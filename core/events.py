@@ -0,0 +1,145 @@
+"""In-process domain events, dispatched in batches after commit.
+
+Model methods :func:`emit` events (``TaskCompleted``, ``XPAwarded``, ...)
+instead of running side effects inline.  Inside a transaction the events
+are buffered and dispatched once it commits, all together, so a handler
+sees every event of the transaction in one call and can coalesce its work
+per user.  Events emitted in a savepoint that is rolled back, or in a
+transaction that is, are dropped.  Outside a transaction an event is
+dispatched right away, in a batch of one.
+
+Handlers take the list of events of the types they :func:`subscribe` to.
+They run after the data is committed, so an exception there is logged
+rather than raised to a caller whose work already succeeded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    """Base class of domain events; every event concerns one user."""
+
+    user_id: Any
+
+
+EventHandler = Callable[[list[Any]], None]
+
+subscribers: dict[type[Event], list[EventHandler]] = defaultdict(list)
+
+
+def subscribe(*event_types: type[Event]) -> Callable[[EventHandler], EventHandler]:
+    """Register the decorated function for batches of *event_types*."""
+
+    def register(handler: EventHandler) -> EventHandler:
+        for event_type in event_types:
+            if handler not in subscribers[event_type]:
+                subscribers[event_type].append(handler)
+        return handler
+
+    return register
+
+
+def dispatch(events: Sequence[Event]) -> None:
+    """Call each subscriber once with the events it subscribed to, in order."""
+    batches: dict[EventHandler, list[Event]] = {}
+    for event in events:
+        for handler in subscribers.get(type(event), ()):
+            batches.setdefault(handler, []).append(event)
+    for handler, batch in batches.items():
+        try:
+            handler(batch)
+        except Exception:
+            logger.exception("Event handler %s failed", handler.__qualname__)
+
+
+class _Pending:
+    """An event of an open transaction, unless its savepoint rolled back."""
+
+    def __init__(self, event: Event) -> None:
+        self.event = event
+        self.dropped = False
+
+    def drop(self) -> None:
+        self.dropped = True
+
+
+class _Hook:
+    """A commit hook that calls *on_drop* if Django discards it unrun.
+
+    Django drops the hooks of a savepoint or transaction that rolls back,
+    and reference counting frees them at once, which runs the finalizer.
+    """
+
+    def __init__(self, on_drop: Callable[[], None]) -> None:
+        self._finalizer = weakref.finalize(self, on_drop)
+        self._finalizer.atexit = False
+
+    def __call__(self) -> None:
+        self._finalizer.detach()
+
+
+class _Batch:
+    """The events of one transaction, flushed by a single commit hook."""
+
+    def __init__(self, using: str) -> None:
+        self.events: list[_Pending] = []
+        self.open = True
+        transaction.on_commit(_Flush(self), using=using, robust=True)
+
+    def add(self, event: Event, using: str) -> None:
+        pending = _Pending(event)
+        self.events.append(pending)
+        # Its own hook tells whether the event survived its savepoints.
+        transaction.on_commit(_Hook(pending.drop), using=using, robust=True)
+
+    def close(self) -> None:
+        # The flush hook was dropped: it was registered with the first
+        # event, so every event since went with the same savepoint.
+        self.open = False
+        self.events = []
+
+
+class _Flush(_Hook):
+    """The commit hook dispatching a batch's events that were not dropped."""
+
+    def __init__(self, batch: _Batch) -> None:
+        super().__init__(batch.close)
+        self.batch = batch
+
+    def __call__(self) -> None:
+        super().__call__()
+        self.batch.open = False
+        events, self.batch.events = self.batch.events, []
+        dispatch([pending.event for pending in events if not pending.dropped])
+
+
+# Connections are per thread, and so are their transactions' batches.
+_local = threading.local()
+
+
+def emit(event: Event, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Dispatch *event* once the current transaction on *using* commits."""
+    if not transaction.get_connection(using).in_atomic_block:
+        dispatch([event])
+        return
+
+    batches: dict[str, _Batch] = _local.__dict__.setdefault("batches", {})
+    batch = batches.get(using)
+    # A batch is open until its flush hook runs or is dropped, so the first
+    # event of a transaction, or after a rollback, starts a new one.
+    if batch is None or not batch.open:
+        batch = batches[using] = _Batch(using)
+    batch.add(event, using)
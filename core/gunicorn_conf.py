@@ -0,0 +1,71 @@
+"""Gunicorn configuration for serving the project in production.
+
+Every setting is read from the environment so the same image can be tuned
+per deployment.  ``manage.py serve`` is the usual entrypoint; it translates
+its command-line options into these variables before exec'ing gunicorn.
+
+Environment variables
+---------------------
+SERVER_INTERFACE
+    ``wsgi`` (default) serves ``core.wsgi`` with sync/gthread workers,
+    ``asgi`` serves ``core.asgi`` with uvicorn workers.
+GUNICORN_BIND
+    Socket to bind (default ``0.0.0.0:8000``).
+WEB_CONCURRENCY
+    Worker processes (default ``2 * cpus + 1``).
+GUNICORN_THREADS
+    Threads per WSGI worker; more than one switches to ``gthread``.
+GUNICORN_PRELOAD
+    ``1`` (default) imports the application once in the master before
+    forking, so workers share memory pages and boot faster.
+GUNICORN_MAX_REQUESTS / GUNICORN_MAX_REQUESTS_JITTER
+    Recycle a worker after this many requests (plus random jitter) to bound
+    memory growth.
+GUNICORN_TIMEOUT / GUNICORN_GRACEFUL_TIMEOUT / GUNICORN_KEEPALIVE
+    Worker timeouts in seconds.
+
+Reloading
+---------
+``kill -HUP <master>`` gracefully replaces workers.  With preloading enabled
+the code lives in the master, so deploy new code with ``USR2`` (start a new
+master) followed by ``WINCH``/``QUIT`` to the old one.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def _cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+interface = os.getenv("SERVER_INTERFACE", "wsgi").lower()
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+
+if interface == "asgi":
+    wsgi_app = "core.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "core.wsgi:application"
+    worker_class = "gthread" if threads > 1 else "sync"
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", str(_cpu_count() * 2 + 1)))
+
+preload_app = bool(int(os.getenv("GUNICORN_PRELOAD", "1")))
+reload = bool(int(os.getenv("GUNICORN_RELOAD", "0")))
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "info")
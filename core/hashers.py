@@ -0,0 +1,25 @@
+"""Password hashers whose cost comes from settings.
+
+Django's hashers hard-code their cost.  These read it from the
+``PASSWORD_ARGON2_*`` and ``PASSWORD_PBKDF2_ITERATIONS`` settings, keeping
+the algorithm names (``argon2``, ``pbkdf2_sha256``) so existing hashes
+still verify.  A hash made by a hasher other than the first of
+``PASSWORD_HASHERS``, or at other costs, is replaced at the user's next
+successful login: ``check_password`` re-hashes the password it was just
+given.  ``manage.py bench_password_hashers`` measures the costs.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    time_cost = settings.PASSWORD_ARGON2_TIME_COST
+    memory_cost = settings.PASSWORD_ARGON2_MEMORY_COST
+    parallelism = settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    iterations = settings.PASSWORD_PBKDF2_ITERATIONS
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
 from django.db import models
 from django.utils import timezone
@@ -35,6 +35,43 @@ class BaseModel(models.Model):
     objects = SoftDeleteManager()
     all_objects: models.Manager["BaseModel"] = models.Manager()
 
+    # Fields (by attname) whose loaded values are remembered so that save()
+    # overrides can tell what changed; see stored_value().
+    tracked_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Any, values: Any) -> BaseModel:
+        instance = super().from_db(db, field_names, values)
+        if cls.tracked_fields:
+            instance._remember_tracked()
+        return instance
+
+    def _remember_tracked(self) -> None:
+        self._stored_values = {
+            name: self.__dict__.get(name) for name in self.tracked_fields
+        }
+
+    def stored_value(self, name: str) -> Any:
+        """Value of tracked field *name* as last loaded or saved (``None`` if new)."""
+        return getattr(self, "_stored_values", {}).get(name)
+
+    def tracked_changed(self, *names: str) -> bool:
+        """Whether any of *names* (default: every tracked field) changed."""
+        return any(
+            self.stored_value(name) != getattr(self, name)
+            for name in names or self.tracked_fields
+        )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # auto_now only fires for fields being saved; keep updated_at honest
+        # for partial saves so ETags and sync cursors see the change.
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "updated_at" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "updated_at"]
+        super().save(*args, **kwargs)
+        if self.tracked_fields:
+            self._remember_tracked()
+
     # ----- Soft Delete -----
     def delete(self, using: Optional[str] = None, keep_parents: bool = False) -> tuple:
         """Soft delete the record (mark as deleted instead of removing)."""
@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination for large, append-mostly tables.
+
+    Pages are fetched with ``WHERE <ordering> < cursor ... LIMIT page_size``,
+    so the cost of a page does not grow with its depth the way ``OFFSET``
+    does, and the total is never counted.  Subclasses set ``ordering`` to an
+    indexed column.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "-created_at"
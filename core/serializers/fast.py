@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import relations, serializers
+
+# Fields whose ``to_representation`` returns database values unchanged.
+_IDENTITY_FIELDS: frozenset[type[serializers.Field]] = frozenset(
+    {
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.EmailField,
+        serializers.IntegerField,
+        serializers.ReadOnlyField,
+        serializers.SlugField,
+    }
+)
+
+Converter = Callable[[Any], Any] | None
+
+
+@dataclass(frozen=True)
+class _Column:
+    name: str
+    source: str
+    convert: Converter
+
+
+@dataclass(frozen=True)
+class _ManyToMany:
+    name: str
+    field: models.ManyToManyField
+    convert: Converter
+
+
+class FastSerializer:
+    """
+    Compiled, read-only twin of a ``ModelSerializer``.
+
+    Instead of building model instances and walking every serializer field
+    for every object, rows are fetched with ``values()`` and turned into
+    dicts by a per-field plan computed once per serializer class.  Plain
+    columns, foreign keys and many-to-many primary keys are supported; the
+    output renders to the same JSON as ``serializer_class(many=True).data``.
+
+    Use :meth:`compile`, which returns ``None`` for serializers with fields
+    the plan cannot express (method fields, nested serializers, dotted
+    sources); callers fall back to the regular serializer then.
+    """
+
+    def __init__(
+        self,
+        model: type[models.Model],
+        columns: Sequence[_Column],
+        many_to_many: Sequence[_ManyToMany],
+        field_order: Sequence[str],
+    ) -> None:
+        self.model = model
+        self.columns = tuple(columns)
+        self.many_to_many = tuple(many_to_many)
+        self.field_order = tuple(field_order)
+
+    @classmethod
+    def compile(
+        cls,
+        serializer_class: type[serializers.ModelSerializer],
+        field_names: Iterable[str] | None = None,
+    ) -> FastSerializer | None:
+        """Build (or fetch the cached) plan for *serializer_class*.
+
+        *field_names* restricts the plan to a subset, e.g. a ``?fields=``
+        projection.
+        """
+        names = None if field_names is None else frozenset(field_names)
+        return _compile(serializer_class, names)
+
+    def project(
+        self, queryset: models.QuerySet, *extra: str
+    ) -> models.QuerySet[Any, dict[str, Any]]:
+        """Return *queryset* as ``values()`` dicts carrying the plan's columns.
+
+        *extra* names additional columns needed by the caller, such as the
+        paginator's ordering field.
+        """
+        sources = {column.source for column in self.columns}
+        sources.add(self.model._meta.pk.attname)
+        sources.update(extra)
+        return queryset.values(*sorted(sources))
+
+    def serialize(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Turn projected rows into representation dicts."""
+        rows = list(rows)
+        related = self._fetch_many_to_many(rows)
+        pk = self.model._meta.pk.attname
+        result = []
+        for row in rows:
+            data = {}
+            for column in self.columns:
+                value = row[column.source]
+                if value is not None and column.convert is not None:
+                    value = column.convert(value)
+                data[column.name] = value
+            for m2m in self.many_to_many:
+                data[m2m.name] = related[m2m.name].get(row[pk], [])
+            result.append({name: data[name] for name in self.field_order})
+        return result
+
+    def _fetch_many_to_many(
+        self, rows: Sequence[dict[str, Any]]
+    ) -> dict[str, dict[Any, list[Any]]]:
+        related: dict[str, dict[Any, list[Any]]] = {}
+        if not self.many_to_many or not rows:
+            return related
+        pk = self.model._meta.pk.attname
+        ids = [row[pk] for row in rows]
+        for m2m in self.many_to_many:
+            through = m2m.field.remote_field.through
+            source = m2m.field.m2m_field_name()
+            target = m2m.field.m2m_reverse_field_name()
+            # Filter targets through their default manager, as the related
+            # manager used by the regular serializer does (soft deletes).
+            targets = m2m.field.related_model._default_manager.values("pk")
+            links = through._default_manager.filter(
+                **{f"{source}__in": ids, f"{target}__in": targets}
+            ).values_list(f"{source}_id", f"{target}_id")
+            grouped: dict[Any, list[Any]] = defaultdict(list)
+            for owner, value in links:
+                grouped[owner].append(
+                    m2m.convert(value) if m2m.convert is not None else value
+                )
+            related[m2m.name] = grouped
+        return related
+
+
+def _converter(field: serializers.Field) -> Converter:
+    if type(field) in _IDENTITY_FIELDS:
+        return None
+    return field.to_representation
+
+
+def _pk_converter(field: relations.PrimaryKeyRelatedField) -> Converter:
+    # PrimaryKeyRelatedField renders ``value.pk``; values() already yields it.
+    return field.pk_field.to_representation if field.pk_field is not None else None
+
+
+def _plan_field(
+    name: str, field: serializers.Field, model_field: models.Field
+) -> _Column | _ManyToMany | None:
+    """How to render *field* from ``values()`` rows, or None if it cannot be."""
+    if isinstance(field, relations.ManyRelatedField):
+        child = field.child_relation
+        if not (
+            isinstance(child, relations.PrimaryKeyRelatedField)
+            and isinstance(model_field, models.ManyToManyField)
+        ):
+            return None
+        return _ManyToMany(name, model_field, _pk_converter(child))
+    if isinstance(field, relations.PrimaryKeyRelatedField):
+        if not model_field.many_to_one:
+            return None
+        return _Column(name, model_field.attname, _pk_converter(field))
+    if isinstance(field, relations.RelatedField | serializers.BaseSerializer) or (
+        not model_field.concrete or model_field.is_relation
+    ):
+        return None
+    return _Column(name, model_field.attname, _converter(field))
+
+
+@cache
+def _compile(
+    serializer_class: type[serializers.ModelSerializer],
+    field_names: frozenset[str] | None,
+) -> FastSerializer | None:
+    model = serializer_class.Meta.model
+    fields = serializer_class(context={}).fields
+    columns: list[_Column] = []
+    many_to_many: list[_ManyToMany] = []
+    order: list[str] = []
+    for name, field in fields.items():
+        if field.write_only or (field_names is not None and name not in field_names):
+            continue
+        if field.source == "*" or "." in field.source:
+            return None
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        plan = _plan_field(name, field, model_field)
+        if plan is None:
+            return None
+        (many_to_many if isinstance(plan, _ManyToMany) else columns).append(plan)
+        order.append(name)
+    return FastSerializer(model, columns, many_to_many, order)
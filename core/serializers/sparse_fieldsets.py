@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+
+FIELDS_QUERY_PARAM = "fields"
+
+
+def requested_fields(request: Request | None) -> frozenset[str] | None:
+    """
+    Return the field names listed in ``?fields=a,b``, or ``None``.
+
+    Only safe methods are projected; a write always uses the full serializer.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    raw = request.query_params.get(FIELDS_QUERY_PARAM, "")
+    names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    return names or None
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Serializer mixin that keeps only the fields requested with ``?fields=``.
+
+    Unknown names are rejected with a 400 so typos do not silently return
+    an empty object.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        requested = requested_fields(self.context.get("request"))  # type: ignore[attr-defined]
+        if requested is None:
+            return
+        available = set(self.fields)  # type: ignore[attr-defined]
+        unknown = requested - available
+        if unknown:
+            raise serializers.ValidationError(
+                {FIELDS_QUERY_PARAM: f"Unknown field(s): {', '.join(sorted(unknown))}."}
+            )
+        for name in available - requested:
+            self.fields.pop(name)  # type: ignore[attr-defined]
@@ -8,6 +8,7 @@ Enhanced for multi-environment use and production safety.
 from __future__ import annotations
 
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -33,6 +34,7 @@ if not SECRET_KEY:
     raise ValueError("❌ SECRET_KEY must be set in your environment file.")
 
 DEBUG = bool(int(os.getenv("DEBUG", "0")))
+TESTING = sys.argv[1:2] == ["test"]
 
 ALLOWED_HOSTS: list[str] = [
     h.strip() for h in os.getenv("ALLOWED_HOSTS", "").split(",") if h.strip()
@@ -51,6 +53,7 @@ DJANGO_APPS = [
 THIRD_PARTY_APPS = [
     "compressor",
     "rest_framework",
+    "django_filters",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
     "drf_spectacular",
@@ -64,18 +67,60 @@ LOCAL_APPS = [
     "lyfe_tracker",
     "gamification",
     "authentication",
+    "sync",
+    "jobs",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 
+# JSON (de)serialization for the API: "orjson" (fast) or "stdlib" (DRF's).
+API_JSON_BACKEND = os.getenv("API_JSON_BACKEND", "orjson")
+_API_JSON_CLASSES = {
+    "orjson": ("core.renderers.ORJSONRenderer", "core.parsers.ORJSONParser"),
+    "stdlib": (
+        "rest_framework.renderers.JSONRenderer",
+        "rest_framework.parsers.JSONParser",
+    ),
+}
+_json_renderer, _json_parser = _API_JSON_CLASSES[API_JSON_BACKEND]
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": (
+        _json_renderer,
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        _json_parser,
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # Proxies in front of the app whose X-Forwarded-For entries are trusted
+    # for the client IP of rate limits (0: use REMOTE_ADDR).
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0")),
+    "DEFAULT_THROTTLE_RATES": {
+        "login": os.getenv("THROTTLE_LOGIN_RATE", "30/min"),
+        "login_account": os.getenv("THROTTLE_LOGIN_ACCOUNT_RATE", "10/min"),
+        "register": os.getenv("THROTTLE_REGISTER_RATE", "20/hour"),
+        "password_reset": os.getenv("THROTTLE_PASSWORD_RESET_RATE", "20/hour"),
+        "password_reset_account": os.getenv(
+            "THROTTLE_PASSWORD_RESET_ACCOUNT_RATE", "5/hour"
+        ),
+        "token_refresh": os.getenv("THROTTLE_TOKEN_REFRESH_RATE", "60/min"),
+    },
 }
 
+# ─── Rate Limiting ───────────────────────────────────────────────────
+# The unauthenticated auth endpoints are limited per client IP and, for
+# login and password reset, per account (core.throttling), before any
+# password is hashed or email queued.  Counters live in the cache: set
+# REDIS_URL so that all workers share them.
+THROTTLE_ENABLED = bool(int(os.getenv("THROTTLE_ENABLED", "1")))
+
 # ─── SimpleJWT ───────────────────────────────────────────────────────
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
@@ -130,9 +175,48 @@ else:
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
+# ─── Async Views ─────────────────────────────────────────────────────
+# Route the auth endpoints (password reset, user data, logout) to their
+# async variants.  Off by default, also under core.asgi: with the reset email
+# queued they do no async I/O, and a WSGI worker with the sync views answers
+# about twice as many requests (see `manage.py bench_async_auth`).
+ASYNC_AUTH_VIEWS = bool(int(os.getenv("ASYNC_AUTH_VIEWS", "0")))
+
+# ─── Offline Sync ────────────────────────────────────────────────────
+# Changes younger than the safety window are held back from /api/sync/ so
+# a cursor never passes a write whose transaction has not committed yet.
+SYNC_SAFETY_WINDOW_SECONDS = int(os.getenv("SYNC_SAFETY_WINDOW_SECONDS", "5"))
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", "500"))
+SYNC_MAX_PAGE_SIZE = int(os.getenv("SYNC_MAX_PAGE_SIZE", "1000"))
+
+# ─── Recurring Tasks ─────────────────────────────────────────────────
+# Occurrences of recurring tasks exist as rows this many days ahead; the
+# window is extended by `manage.py materialize_recurring_tasks`.
+RECURRENCE_WINDOW_DAYS = int(os.getenv("RECURRENCE_WINDOW_DAYS", "14"))
+
+# ─── Scheduled Jobs ──────────────────────────────────────────────────
+# `manage.py run_scheduler` checks for due jobs every SCHEDULER_POLL_SECONDS.
+# A job's lease outlives a crashed scheduler by SCHEDULER_LEASE_SECONDS;
+# keep it above the longest run, or a job may run twice at once.
+SCHEDULER_POLL_SECONDS = float(os.getenv("SCHEDULER_POLL_SECONDS", "30"))
+SCHEDULER_LEASE_SECONDS = int(os.getenv("SCHEDULER_LEASE_SECONDS", "900"))
+# Rows updated per statement by the jobs.
+JOB_BATCH_SIZE = int(os.getenv("JOB_BATCH_SIZE", "1000"))
+
+# ─── Task Queue ──────────────────────────────────────────────────────
+# Deferred work (emails, badge awards) is queued in the database and run
+# by `manage.py run_worker` on JOB_QUEUE_CONCURRENCY threads.  A job whose
+# worker died is retried once its JOB_QUEUE_LEASE_SECONDS lease expires.
+JOB_QUEUE_CONCURRENCY = int(os.getenv("JOB_QUEUE_CONCURRENCY", "4"))
+JOB_QUEUE_POLL_SECONDS = float(os.getenv("JOB_QUEUE_POLL_SECONDS", "1"))
+JOB_QUEUE_LEASE_SECONDS = int(os.getenv("JOB_QUEUE_LEASE_SECONDS", "300"))
+
 # ─── Middleware ──────────────────────────────────────────────────────
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Serves STATIC_ROOT with the precompressed .br/.gz variants written by
+    # collectstatic, before any other middleware runs.
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.middleware.gzip.GZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -161,6 +245,20 @@ TEMPLATES = [
     },
 ]
 
+# Compiled templates are kept for the life of the process in production;
+# in development the default loaders still pick up edits.
+if not DEBUG:
+    TEMPLATES[0]["APP_DIRS"] = False
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        )
+    ]
+
 WSGI_APPLICATION = "core.wsgi.application"
 
 # ─── Database ────────────────────────────────────────────────────────
@@ -172,11 +270,78 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", ""),
         "HOST": os.getenv("POSTGRES_HOST", "localhost"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
-        "CONN_MAX_AGE": 60,
-        "ATOMIC_REQUESTS": True,
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        # Transactions are opted into per view (core.views.mixins.
+        # TransactionPolicyMixin) so reads run in autocommit.
+        "ATOMIC_REQUESTS": False,
     }
 }
 
+# Connection pool (psycopg 3): each worker process keeps up to
+# DB_POOL_MAX_SIZE connections shared by its threads.  CONN_HEALTH_CHECKS
+# makes the pool check each connection on checkout.  Pooling replaces
+# persistent connections, so CONN_MAX_AGE must be 0.
+DATABASE_POOL = bool(int(os.getenv("DB_POOL", "1"))) and (
+    DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql"
+)
+if DATABASE_POOL:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+        }
+    }
+
+# Read replica: views using TransactionPolicyMixin send their safe-method
+# reads here.  POSTGRES_REPLICA_HOST points at a streaming replica;
+# DB_REPLICA_NAME alone uses a second database on the same server (or a copy
+# of the SQLite file) for local testing.
+DATABASE_REPLICA_ALIAS = os.getenv("DB_REPLICA_ALIAS", "replica")
+DATABASE_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "10"))
+if os.getenv("POSTGRES_REPLICA_HOST") or os.getenv("DB_REPLICA_NAME"):
+    DATABASES[DATABASE_REPLICA_ALIAS] = {
+        **DATABASES["default"],
+        "NAME": os.getenv("DB_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "HOST": os.getenv("POSTGRES_REPLICA_HOST", DATABASES["default"]["HOST"]),
+        "PORT": os.getenv("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        # A real replica shares the primary's data, so tests read through it;
+        # a local stand-in gets its own test database.
+        "TEST": {"MIRROR": "default"} if os.getenv("POSTGRES_REPLICA_HOST") else {},
+    }
+
+DATABASE_ROUTERS = ["core.db.routers.ReadReplicaRouter"]
+
+# ─── Cache ───────────────────────────────────────────────────────────
+# Shared across workers when REDIS_URL is set (replica stickiness and other
+# per-user state rely on that); per-process memory otherwise.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# ─── Landing Page ────────────────────────────────────────────────────
+# The landing page is cached whole (per language).  Bump RELEASE_VERSION on
+# every deploy so the new build does not serve the previous one's HTML.
+RELEASE_VERSION = os.getenv("RELEASE_VERSION", "dev")
+LANDING_CACHE_SECONDS = int(os.getenv("LANDING_CACHE_SECONDS", "600"))
+
+# ─── Admin ───────────────────────────────────────────────────────────
+# Above this many rows (planner estimate, PostgreSQL only) unfiltered admin
+# lists show the estimate instead of running COUNT(*).
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "100000")
+)
+
 # ─── Password Validation ─────────────────────────────────────────────
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -187,6 +352,28 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# ─── Password Hashing ────────────────────────────────────────────────
+# Passwords are hashed with PASSWORD_HASHER ("argon2" or "pbkdf2") at the
+# costs below (core.hashers).  Hashes made by the other one, or at other
+# costs, keep working and are re-hashed on the user's next login, so a
+# change rolls out without a migration.  Measure logins per second per
+# core at each setting with `manage.py bench_password_hashers`.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "argon2")
+# Argon2id; memory in KiB.  The defaults are OWASP's minimum (19 MiB, 2
+# passes, 1 lane): Django's (100 MiB, 8 lanes) cost far more CPU per login.
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "19456"))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "1"))
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "1000000"))
+_password_hashers = {
+    "argon2": "core.hashers.Argon2PasswordHasher",
+    "pbkdf2": "core.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _password_hashers.pop(PASSWORD_HASHER),
+    *_password_hashers.values(),
+]
+
 # ─── Internationalization ────────────────────────────────────────────
 LANGUAGE_CODE = os.getenv("LANGUAGE_CODE", "en-us")
 TIME_ZONE = os.getenv("TIME_ZONE", "UTC")
@@ -206,6 +393,21 @@ STATICFILES_FINDERS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = DATA_DIR / "media"
 
+# collectstatic writes content-hashed copies plus gzip and brotli variants;
+# WhiteNoise serves hashed names with a far-future, immutable Cache-Control.
+# The manifest only exists after collectstatic (``manage.py serve`` runs it),
+# so development and the test suite use the plain storage.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage"
+            if DEBUG or TESTING
+            else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        )
+    },
+}
+
 
 # ─── Default Primary Key ─────────────────────────────────────────────
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -217,7 +419,7 @@ COMPRESS_OFFLINE = not DEBUG
 
 # ─── Security Settings ───────────────────────────────────────────────
 if not DEBUG:
-    SECURE_SSL_REDIRECT = True
+    SECURE_SSL_REDIRECT = bool(int(os.getenv("SECURE_SSL_REDIRECT", "1")))
     SESSION_COOKIE_SECURE = True
     CSRF_COOKIE_SECURE = True
     SECURE_HSTS_SECONDS = 31536000
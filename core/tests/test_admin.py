@@ -0,0 +1,116 @@
+"""Tests for the shared admin building blocks and registrations."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib import admin
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.admin import EstimatedCountPaginator
+from gamification.models import Badge, Reward, UserBadge, UserReward
+from productivity.models import Goal, Habit, HabitEntry, JournalEntry, Tag, Task
+from users.models import CustomUser
+
+
+class AdminChangelistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin_user = CustomUser.objects.create_superuser(
+            username="root", email="root@example.com", password="x"
+        )
+        cls.user = CustomUser.objects.create_user(
+            username="Alice", email="alice@example.com", password="x"
+        )
+        habit = Habit.objects.create(user=cls.user, name="Read")
+        HabitEntry.objects.create(habit=habit, date="2026-01-01")
+        Goal.objects.create(user=cls.user, name="Ship it")
+        Task.objects.create(user=cls.user, title="Write tests")
+        JournalEntry.objects.create(user=cls.user, content="Day one")
+        Tag.objects.create(user=cls.user, name="work")
+
+    def setUp(self) -> None:
+        self.client.force_login(self.admin_user)
+
+    def changelist(self, model: type) -> str:
+        meta = model._meta
+        return reverse(f"admin:{meta.app_label}_{meta.model_name}_changelist")
+
+    def test_every_model_has_a_changelist(self) -> None:
+        models = (
+            *(CustomUser, Goal, Habit, HabitEntry, JournalEntry, Tag, Task),
+            *(Badge, Reward, UserBadge, UserReward),
+        )
+        for model in models:
+            assert model in admin.site._registry
+            response = self.client.get(self.changelist(model))
+            assert response.status_code == 200, model
+
+    def test_changelist_does_not_count_whole_table_twice(self) -> None:
+        response = self.client.get(self.changelist(Task), {"status__exact": "pending"})
+        assert response.context["cl"].full_result_count is None
+
+    def test_user_search_is_case_insensitive_prefix(self) -> None:
+        url = self.changelist(CustomUser)
+        assert self.client.get(url, {"q": "ali"}).context["cl"].result_count == 1
+        assert self.client.get(url, {"q": "lice"}).context["cl"].result_count == 0
+
+    def test_search_prefix_matches_deleted_rows_too(self) -> None:
+        Task.objects.create(user=self.user, title="write docs").delete()
+        url = self.changelist(Task)
+        assert self.client.get(url, {"q": "WRITE"}).context["cl"].result_count == 2
+        assert self.client.get(url, {"q": "tests"}).context["cl"].result_count == 0
+
+    def test_user_level_filter_uses_fixed_ranges(self) -> None:
+        response = self.client.get(self.changelist(CustomUser), {"level_range": "1-4"})
+        assert response.context["cl"].result_count == 2
+
+    def test_soft_delete_action_is_one_update(self) -> None:
+        Task.objects.create(user=self.user, title="Another")
+        ids = [str(pk) for pk in Task.objects.values_list("pk", flat=True)]
+        with self.assertNumQueries(1):
+            admin.site._registry[Task]._soft_delete(Task.objects.filter(pk__in=ids))
+        assert not Task.objects.exists()
+        assert Task.all_objects.filter(is_deleted=True).count() == 2
+
+    def test_soft_delete_and_restore_actions(self) -> None:
+        task = Task.objects.get()
+        url = self.changelist(Task)
+        self.client.post(
+            url, {"action": "soft_delete_selected", "_selected_action": [task.pk]}
+        )
+        task.refresh_from_db()
+        assert task.is_deleted
+        assert task.deleted_at is not None
+        self.client.post(
+            url, {"action": "restore_selected", "_selected_action": [task.pk]}
+        )
+        task.refresh_from_db()
+        assert not task.is_deleted
+
+    def test_delete_selected_is_not_offered(self) -> None:
+        response = self.client.get(self.changelist(Task))
+        actions = [
+            name
+            for name, _label in response.context["action_form"].fields["action"].choices
+        ]
+        assert "delete_selected" not in actions
+        assert "soft_delete_selected" in actions
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def test_counts_exactly_without_an_estimate(self) -> None:
+        user = CustomUser.objects.create_user(username="a", email="a@example.com")
+        Tag.objects.create(user=user, name="a")
+        assert EstimatedCountPaginator(Tag.objects.all(), 10).count == 1
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_uses_estimate_for_large_tables(self) -> None:
+        with mock.patch("core.admin.estimated_row_count", return_value=5000):
+            assert EstimatedCountPaginator(Tag.objects.all(), 10).count == 5000
+
+    @override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_small_estimate_falls_back_to_count(self) -> None:
+        with mock.patch("core.admin.estimated_row_count", return_value=10):
+            assert EstimatedCountPaginator(Tag.objects.all(), 10).count == 0
@@ -0,0 +1,110 @@
+"""Tests for ETag/Last-Modified handling on user and productivity views."""
+
+from __future__ import annotations
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import JournalEntry, Tag, Task
+from users.models import CustomUser
+
+
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="poller", email="poller@example.com", password="x"
+        )
+        cls.task = Task.objects.create(user=cls.user, title="Poll me")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def revalidate(self, url: str, etag: str):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # ─── Current User ──────────────────────────────────────────────────
+
+    def test_me_answers_304_without_queries(self) -> None:
+        url = reverse("auth:user-data")
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Last-Modified"]
+        with self.assertNumQueries(0):
+            response = self.revalidate(url, response["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+
+    def test_me_changes_after_partial_save(self) -> None:
+        url = reverse("auth:user-data")
+        etag = self.client.get(url)["ETag"]
+        self.user.add_xp(10)
+        self.user.refresh_from_db()
+        self.client.force_authenticate(self.user)
+        assert self.revalidate(url, etag).status_code == status.HTTP_200_OK
+
+    # ─── Detail ────────────────────────────────────────────────────────
+
+    def test_detail_revalidates_on_updated_at(self) -> None:
+        url = reverse("productivity:task-detail", args=[self.task.pk])
+        first = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.revalidate(url, first["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        self.client.patch(url, {"title": "Changed"})
+        response = self.revalidate(url, first["ETag"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "Changed"
+
+    def test_detail_changes_with_its_tags(self) -> None:
+        tag = Tag.objects.create(user=self.user, name="focus")
+        url = reverse("productivity:task-detail", args=[self.task.pk])
+        changes = (
+            lambda: self.task.tags.add(tag),
+            lambda: tag.delete(),
+            lambda: tag.restore(),
+            lambda: tag.task_set.remove(self.task),
+            lambda: tag.task_set.add(self.task),
+            lambda: tag.task_set.clear(),
+        )
+        for change in changes:
+            etag = self.client.get(url)["ETag"]
+            change()
+            assert self.revalidate(url, etag).status_code == status.HTTP_200_OK
+
+    def test_journal_entry_changes_with_its_tags(self) -> None:
+        entry = JournalEntry.objects.create(user=self.user, content="...")
+        tag = Tag.objects.create(user=self.user, name="calm")
+        entry.tags.add(tag)
+        url = reverse("productivity:journal-entry-detail", args=[entry.pk])
+        etag = self.client.get(url)["ETag"]
+        entry.tags.clear()
+        assert self.revalidate(url, etag).status_code == status.HTTP_200_OK
+
+    def test_representation_variants_have_distinct_etags(self) -> None:
+        url = reverse("productivity:task-detail", args=[self.task.pk])
+        assert (
+            self.client.get(url)["ETag"]
+            != self.client.get(url, {"fields": "id"})["ETag"]
+        )
+
+    # ─── List ──────────────────────────────────────────────────────────
+
+    def test_list_changes_on_create_and_delete(self) -> None:
+        url = reverse("productivity:task-list")
+        etag = self.client.get(url)["ETag"]
+        assert self.revalidate(url, etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        other = Task.objects.create(user=self.user, title="New")
+        response = self.revalidate(url, etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        other.delete()
+        assert self.revalidate(url, response["ETag"]).status_code == (
+            status.HTTP_200_OK
+        )
@@ -0,0 +1,50 @@
+"""Tests for connection pool metrics."""
+
+from __future__ import annotations
+
+from unittest import skipIf, skipUnless
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.db.pool import pool_stats
+from users.models import CustomUser
+
+POOLED = bool(connection.settings_dict["OPTIONS"].get("pool"))
+
+
+class DatabasePoolStatsViewTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.url = reverse("db-pool-stats")
+        cls.staff = CustomUser.objects.create_user(
+            username="staff", email="staff@example.com", password="x", is_staff=True
+        )
+        cls.user = CustomUser.objects.create_user(
+            username="member", email="member@example.com", password="x"
+        )
+
+    def test_staff_sees_stats_per_alias(self) -> None:
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert "default" in response.data["pools"]
+
+    def test_non_staff_is_forbidden(self) -> None:
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class PoolStatsTests(APITestCase):
+    @skipIf(POOLED, "default alias is pooled")
+    def test_unpooled_alias_reports_none(self) -> None:
+        assert pool_stats()["default"] is None
+
+    @skipUnless(POOLED, "needs DB_POOL on PostgreSQL")
+    def test_pooled_alias_reports_counters(self) -> None:
+        stats = pool_stats()["default"]
+        assert stats is not None
+        assert "pool_max" in stats
@@ -0,0 +1,165 @@
+"""Tests for domain events batched per transaction."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from core.events import Event, emit, subscribe, subscribers
+from gamification.models import Badge, UserBadge
+from jobs.models import QueuedJob
+from jobs.queue import run_pending_jobs
+from productivity.events import HabitCompleted, TaskCompleted
+from productivity.models import Habit, Task
+from users.events import XPAwarded
+from users.models import CustomUser
+
+
+@dataclass(frozen=True)
+class Pinged(Event):
+    n: int
+
+
+@dataclass(frozen=True)
+class Ponged(Event):
+    pass
+
+
+class EventBusTests(TransactionTestCase):
+    def setUp(self) -> None:
+        self.batches: list[list[Event]] = []
+        patcher = mock.patch.dict(subscribers, clear=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        subscribers[Pinged] = [self.batches.append]
+
+    def test_dispatched_once_after_commit(self) -> None:
+        with transaction.atomic():
+            emit(Pinged(user_id=1, n=1))
+            emit(Ponged(user_id=1))
+            emit(Pinged(user_id=2, n=2))
+            assert self.batches == []
+        assert self.batches == [[Pinged(user_id=1, n=1), Pinged(user_id=2, n=2)]]
+
+    def test_dropped_on_rollback(self) -> None:
+        with self.assertRaises(ValueError), transaction.atomic():
+            emit(Pinged(user_id=1, n=1))
+            raise ValueError
+        assert self.batches == []
+
+    def test_rolled_back_savepoint_drops_only_its_events(self) -> None:
+        with transaction.atomic():
+            emit(Pinged(user_id=1, n=1))
+            with self.assertRaises(ValueError), transaction.atomic():
+                emit(Pinged(user_id=1, n=2))
+                raise ValueError
+            emit(Pinged(user_id=1, n=3))
+        assert [[event.n for event in batch] for batch in self.batches] == [[1, 3]]
+
+    def test_sibling_savepoints_share_one_batch(self) -> None:
+        with transaction.atomic():
+            for n in range(3):
+                with transaction.atomic():
+                    emit(Pinged(user_id=1, n=n))
+        assert [[event.n for event in batch] for batch in self.batches] == [[0, 1, 2]]
+
+    def test_nested_savepoint_events_join_the_batch(self) -> None:
+        with transaction.atomic():
+            emit(Pinged(user_id=1, n=0))
+            with transaction.atomic(), transaction.atomic():
+                emit(Pinged(user_id=1, n=1))
+            emit(Pinged(user_id=1, n=2))
+        assert [[event.n for event in batch] for batch in self.batches] == [[0, 1, 2]]
+
+    def test_rolled_back_last_savepoint_keeps_earlier_events(self) -> None:
+        with transaction.atomic():
+            emit(Pinged(user_id=1, n=1))
+            with self.assertRaises(ValueError), transaction.atomic():
+                emit(Pinged(user_id=1, n=2))
+                raise ValueError
+        assert [[event.n for event in batch] for batch in self.batches] == [[1]]
+
+    def test_rolled_back_first_savepoint_keeps_later_events(self) -> None:
+        with transaction.atomic():
+            with self.assertRaises(ValueError), transaction.atomic():
+                emit(Pinged(user_id=1, n=1))
+                raise ValueError
+            with transaction.atomic():
+                emit(Pinged(user_id=1, n=2))
+            emit(Pinged(user_id=1, n=3))
+        assert [[event.n for event in batch] for batch in self.batches] == [[2, 3]]
+
+    def test_each_transaction_gets_its_own_batch(self) -> None:
+        for n in (1, 2):
+            with transaction.atomic():
+                emit(Pinged(user_id=1, n=n))
+        emit(Pinged(user_id=1, n=3))  # autocommit: right away
+        assert [[event.n for event in batch] for batch in self.batches] == [
+            [1],
+            [2],
+            [3],
+        ]
+
+    def test_failing_handler_does_not_stop_others(self) -> None:
+        @subscribe(Pinged)
+        def broken(events: list[Pinged]) -> None:
+            raise RuntimeError
+
+        subscribers[Pinged].reverse()
+        with self.assertLogs("core.events", "ERROR"):
+            emit(Pinged(user_id=1, n=1))
+        assert len(self.batches) == 1
+
+
+class CompletionEventsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="player", email="player@example.com"
+        )
+        cls.badge = Badge.objects.create(name="First", description="", xp_required=25)
+        Badge.objects.create(name="Later", description="", xp_required=500)
+
+    def test_completions_emit_events_and_one_badge_award(self) -> None:
+        received: list[Event] = []
+        with (
+            mock.patch.dict(
+                subscribers,
+                {
+                    TaskCompleted: [received.extend],
+                    HabitCompleted: [received.extend],
+                },
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for n in range(3):
+                Task.objects.create(user=self.user, title=f"t{n}").mark_done()
+            Habit.objects.create(user=self.user, name="read").complete()
+
+        assert [type(event) for event in received] == [TaskCompleted] * 3 + [
+            HabitCompleted
+        ]
+        # 35 XP went past the 25 XP badge in one batch: one award job.
+        assert QueuedJob.objects.get().payload == {"user_id": str(self.user.pk)}
+        run_pending_jobs()
+        assert list(
+            UserBadge.objects.filter(user=self.user).values_list("badge", flat=True)
+        ) == [self.badge.pk]
+
+    def test_no_award_below_the_next_threshold(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.add_xp(5)
+        assert not QueuedJob.objects.exists()
+
+    def test_xp_events_carry_the_range(self) -> None:
+        received: list[XPAwarded] = []
+        with (
+            mock.patch.dict(subscribers, {XPAwarded: [received.extend]}),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.user.add_xp(10)
+            self.user.add_xp(20)
+        assert [(e.previous_xp, e.xp) for e in received] == [(0, 10), (10, 30)]
@@ -0,0 +1,87 @@
+"""Tests for the compiled read-only serializer path."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from authentication.serializers.user_serializer import CustomUserSerializer
+from core.serializers.fast import FastSerializer
+from productivity.models import Goal, JournalEntry, Tag, Task
+from productivity.serializers import (
+    GoalSerializer,
+    JournalEntrySerializer,
+    TaskSerializer,
+)
+from users.models import CustomUser
+
+
+def render(data: object) -> bytes:
+    return JSONRenderer().render(data)
+
+
+class FastSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="fast", email="fast@example.com", password="x", level=3
+        )
+        cls.goal = Goal.objects.create(
+            user=cls.user, name="Run", target_value=Decimal("42.50")
+        )
+        cls.tag = Tag.objects.create(user=cls.user, name="health")
+        deleted_tag = Tag.objects.create(user=cls.user, name="old")
+        deleted_tag.delete()
+        task = Task.objects.create(
+            user=cls.user,
+            title="Morning run",
+            goal=cls.goal,
+            due_date=timezone.now() + timedelta(days=1),
+        )
+        task.tags.add(cls.tag, deleted_tag)
+        Task.objects.create(user=cls.user, title="No extras")
+        JournalEntry.objects.create(
+            user=cls.user, entry_date=date(2025, 1, 2), content="ok", mood_rating=4
+        )
+
+    def assert_same_json(self, serializer_class, queryset) -> None:
+        fast = FastSerializer.compile(serializer_class)
+        assert fast is not None
+        expected = serializer_class(queryset, many=True).data
+        assert render(fast.serialize(fast.project(queryset))) == render(expected)
+
+    def test_users_render_identically(self) -> None:
+        self.assert_same_json(CustomUserSerializer, CustomUser.objects.all())
+
+    def test_tasks_with_relations_render_identically(self) -> None:
+        self.assert_same_json(TaskSerializer, Task.objects.order_by("title"))
+
+    def test_decimals_and_dates_render_identically(self) -> None:
+        self.assert_same_json(GoalSerializer, Goal.objects.all())
+        self.assert_same_json(JournalEntrySerializer, JournalEntry.objects.all())
+
+    def test_field_subset(self) -> None:
+        fast = FastSerializer.compile(TaskSerializer, {"title", "tags"})
+        rows = fast.serialize(fast.project(Task.objects.order_by("title")))
+        assert rows == [
+            {"title": "Morning run", "tags": [self.tag.pk]},
+            {"title": "No extras", "tags": []},
+        ]
+
+    def test_unsupported_fields_fall_back(self) -> None:
+        class WithMethodField(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Task
+                fields = ("id", "label")
+
+            def get_label(self, obj: Task) -> str:
+                return obj.title
+
+        assert FastSerializer.compile(WithMethodField) is None
@@ -0,0 +1,62 @@
+"""Tests for the orjson renderer and parser."""
+
+from __future__ import annotations
+
+import io
+import uuid
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "target_value": Decimal("42.50"),
+    "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+    "local": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-3))),
+    "entry_date": date(2025, 1, 2),
+    "label": gettext_lazy("Done"),
+    "text": "ação\u2028line\u2029",
+    "nested": [{"n": 1, "f": 1.5, "none": None, "ok": True}],
+}
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_renderer(self) -> None:
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_falls_back_to_stdlib(self) -> None:
+        media_type = "application/json; indent=2"
+        assert ORJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(
+            PAYLOAD, media_type
+        )
+
+    def test_none_renders_empty_body(self) -> None:
+        assert ORJSONRenderer().render(None) == b""
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, body: bytes, encoding: str = "utf-8") -> object:
+        return ORJSONParser().parse(
+            io.BytesIO(body), parser_context={"encoding": encoding}
+        )
+
+    def test_matches_drf_parser(self) -> None:
+        body = '{"title": "ação", "tags": [1, 2.5, null]}'.encode()
+        assert self.parse(body) == JSONParser().parse(io.BytesIO(body))
+
+    def test_other_charsets_are_decoded(self) -> None:
+        assert self.parse('{"t": "ação"}'.encode("latin-1"), "latin-1") == {"t": "ação"}
+
+    def test_invalid_json_raises_parse_error(self) -> None:
+        with self.assertRaises(ParseError):
+            self.parse(b'{"title": ')
+        with self.assertRaises(ParseError):
+            self.parse(b'{"value": NaN}')
@@ -0,0 +1,159 @@
+"""Tests for the per-view transaction policy and replica routing."""
+
+from __future__ import annotations
+
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from core.db.routers import (
+    ReadReplicaRouter,
+    is_sticky,
+    mark_sticky,
+    primary_reads,
+    replica_reads,
+)
+from core.views.mixins import TransactionPolicyMixin
+from users.models import Profile
+
+
+class PolicyView(TransactionPolicyMixin, APIView):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request: Request) -> Response:
+        return Response({"read_db": ReadReplicaRouter().db_for_read(Profile)})
+
+    def post(self, request: Request) -> Response:
+        Profile.objects.create(biography=request.data["biography"])
+        if request.data.get("fail"):
+            raise ValidationError({"fail": "requested"})
+        if request.data.get("reject"):
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+        return Response(status=status.HTTP_201_CREATED)
+
+
+class PrimaryOnlyView(PolicyView):
+    read_from_replica = False
+
+
+def replica_is_separate() -> bool:
+    replica = settings.DATABASES.get(settings.DATABASE_REPLICA_ALIAS)
+    return replica is not None and not replica.get("TEST", {}).get("MIRROR")
+
+
+class TransactionPolicyTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = APIRequestFactory()
+        self.view = PolicyView.as_view()
+
+    def test_write_is_committed(self) -> None:
+        request = self.factory.post("/", {"biography": "kept"}, format="json")
+        response = self.view(request)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Profile.objects.filter(biography="kept").exists()
+
+    def test_write_rolled_back_on_error_response(self) -> None:
+        request = self.factory.post(
+            "/", {"biography": "discarded", "fail": True}, format="json"
+        )
+        response = self.view(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Profile.objects.filter(biography="discarded").exists()
+
+    def test_write_rolled_back_on_returned_error_response(self) -> None:
+        request = self.factory.post(
+            "/", {"biography": "returned", "reject": True}, format="json"
+        )
+        response = self.view(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Profile.objects.filter(biography="returned").exists()
+
+    @override_settings(DATABASE_REPLICA_ALIAS="default")
+    def test_reads_use_replica_alias(self) -> None:
+        response = self.view(self.factory.get("/"))
+        assert response.data["read_db"] == "default"
+
+    @override_settings(DATABASE_REPLICA_ALIAS="unconfigured")
+    def test_reads_without_replica_fall_back(self) -> None:
+        response = self.view(self.factory.get("/"))
+        assert response.data["read_db"] is None
+
+
+@override_settings(DATABASE_REPLICA_ALIAS="default")
+class StickyReadTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.user = get_user_model().objects.create_user(
+            username="sticky", email="sticky@example.com", password="x"
+        )
+
+    def get(self, view: type[PolicyView]) -> Response:
+        request = self.factory.get("/")
+        force_authenticate(request, self.user)
+        return view.as_view()(request)
+
+    def test_successful_write_pins_user_to_primary(self) -> None:
+        request = self.factory.post("/", {"biography": "fresh"}, format="json")
+        force_authenticate(request, self.user)
+        PolicyView.as_view()(request)
+        assert is_sticky(self.user.pk)
+        assert self.get(PolicyView).data["read_db"] is None
+
+    def test_failed_write_does_not_pin(self) -> None:
+        request = self.factory.post(
+            "/", {"biography": "x", "fail": True}, format="json"
+        )
+        force_authenticate(request, self.user)
+        PolicyView.as_view()(request)
+        assert not is_sticky(self.user.pk)
+        assert self.get(PolicyView).data["read_db"] == "default"
+
+    def test_stickiness_expires(self) -> None:
+        with self.settings(DATABASE_REPLICA_STICKY_SECONDS=0):
+            mark_sticky(self.user.pk)
+        assert not is_sticky(self.user.pk)
+
+    def test_view_can_opt_out_of_replica(self) -> None:
+        assert self.get(PrimaryOnlyView).data["read_db"] is None
+
+
+class ReadReplicaRouterTests(TestCase):
+    def test_reads_outside_block_use_default(self) -> None:
+        with self.settings(DATABASE_REPLICA_ALIAS="default"):
+            assert ReadReplicaRouter().db_for_read(Profile) is None
+            with replica_reads():
+                assert ReadReplicaRouter().db_for_read(Profile) == "default"
+
+    def test_writes_always_go_to_default(self) -> None:
+        with replica_reads():
+            assert ReadReplicaRouter().db_for_write(Profile) == "default"
+
+    def test_primary_reads_override_replica_block(self) -> None:
+        with self.settings(DATABASE_REPLICA_ALIAS="default"), replica_reads():
+            with primary_reads():
+                assert ReadReplicaRouter().db_for_read(Profile) is None
+            assert ReadReplicaRouter().db_for_read(Profile) == "default"
+
+
+@skipUnless(replica_is_separate(), "needs a separate replica database")
+class SeparateReplicaTests(TestCase):
+    """Run with e.g. ``DB_REPLICA_NAME=/tmp/replica.sqlite3`` to exercise."""
+
+    databases = "__all__"
+
+    def test_reads_hit_the_replica(self) -> None:
+        Profile.objects.create(biography="primary only")
+        assert Profile.objects.filter(biography="primary only").exists()
+        with replica_reads():
+            assert not Profile.objects.filter(biography="primary only").exists()
@@ -0,0 +1,117 @@
+"""Sliding-window rate limits counted in the cache.
+
+DRF's ``SimpleRateThrottle`` keeps a list of request times per client and
+rewrites it on every request (read, then write: concurrent requests lose
+each other's entries, and the list grows with the rate).  These throttles
+count requests with the cache's atomic ``incr`` instead, one counter per
+fixed window, and estimate the sliding window from the current and the
+previous counter: the previous window's count is weighted by the share of
+it the sliding window still covers.  That costs the same few cache calls
+per request whatever the rate, and is exact enough for abuse limits.
+
+Views pick their limits with ``throttle_scope`` and rates come from
+``REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]`` (``"10/min"``), looked up per
+request so tests can override them.  Requests over the limit still count,
+so a client hammering an endpoint stays limited until it slows down.
+``THROTTLE_ENABLED = False`` turns every limit off.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """``"10/min"`` -> ``(10, 60)``: requests allowed and window in seconds."""
+    count, period = rate.split("/")
+    return int(count), PERIODS[period[0]]
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """Base class; subclasses say what a request is counted against."""
+
+    scope_suffix = ""
+
+    def __init__(self) -> None:
+        self.wait_seconds: float | None = None
+
+    def get_scope(self, view: Any) -> str | None:
+        scope = getattr(view, "throttle_scope", None)
+        return f"{scope}{self.scope_suffix}" if scope else None
+
+    def get_subject(self, request: Request, view: Any) -> str | None:
+        """The identity counted against, or None to not limit the request."""
+        raise NotImplementedError
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        if not settings.THROTTLE_ENABLED:
+            return True
+        scope = self.get_scope(view)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope) if scope else None
+        subject = self.get_subject(request, view) if rate else None
+        if subject is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        index, offset = divmod(time.time(), window)
+        key = f"throttle:{scope}:{subject}"
+        previous = cache.get(f"{key}:{int(index) - 1}", 0)
+        current = self.increment(f"{key}:{int(index)}", timeout=2 * window)
+        weight = 1 - offset / window
+        if previous * weight + current <= limit:
+            return True
+        if current > limit or not previous:
+            self.wait_seconds = window - offset
+        else:
+            # Until enough of the previous window has slid out.
+            self.wait_seconds = window * (1 - (limit - current) / previous) - offset
+        return False
+
+    @staticmethod
+    def increment(key: str, timeout: int) -> int:
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # First request of the window; add() lets one racing client win.
+            if cache.add(key, 1, timeout):
+                return 1
+            return cache.incr(key)
+
+    def wait(self) -> float | None:
+        return self.wait_seconds
+
+
+class ClientIPThrottle(SlidingWindowThrottle):
+    """Limit per client IP (``X-Forwarded-For`` behind ``NUM_PROXIES`` proxies)."""
+
+    def get_subject(self, request: Request, view: Any) -> str | None:
+        return self.get_ident(request)
+
+
+class AccountThrottle(SlidingWindowThrottle):
+    """
+    Limit per account named in the request body.
+
+    The view's ``throttle_account_field`` (``"username"``, ``"email"``) is
+    read case-insensitively, so a password cannot be guessed from many IPs
+    at once; rates are looked up as ``<throttle_scope>_account``.
+    """
+
+    scope_suffix = "_account"
+
+    def get_subject(self, request: Request, view: Any) -> str | None:
+        data = request.data
+        value = data.get(view.throttle_account_field) if hasattr(data, "get") else None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        return hashlib.sha256(value.strip().lower().encode()).hexdigest()[:32]
@@ -23,9 +23,13 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from core.views.database_pool_view import DatabasePoolStatsView
+
 urlpatterns = [
     path("", include("landing.urls")),
     path("api/auth/", include("authentication.urls"), name="auth"),
+    path("api/productivity/", include("productivity.urls")),
+    path("api/sync/", include("sync.urls")),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/docs/",
@@ -33,5 +37,6 @@ urlpatterns = [
         name="swagger-ui",
     ),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path("api/health/db-pool/", DatabasePoolStatsView.as_view(), name="db-pool-stats"),
     path("admin/", admin.site.urls),
 ]
@@ -1,8 +1,11 @@
+from adrf import generics as async_generics
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 
+from core.views.mixins import TransactionPolicyMixin
 
-class AuthenticatedGenericAPIView(generics.GenericAPIView):
+
+class AuthenticatedGenericAPIView(TransactionPolicyMixin, generics.GenericAPIView):
     """
     A base view that requires authentication for access.
     """
@@ -10,7 +13,9 @@ class AuthenticatedGenericAPIView(generics.GenericAPIView):
     permission_classes = [IsAuthenticated]
 
 
-class AuthenticatedRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class AuthenticatedRetrieveUpdateDestroyAPIView(
+    TransactionPolicyMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     A base view that requires authentication for access.
     """
@@ -18,9 +23,19 @@ class AuthenticatedRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAP
     permission_classes = [IsAuthenticated]
 
 
-class AuthenticatedListCreateAPIView(generics.ListCreateAPIView):
+class AuthenticatedListCreateAPIView(
+    TransactionPolicyMixin, generics.ListCreateAPIView
+):
     """
     A base list create view that requires authentication for access.
     """
 
     permission_classes = [IsAuthenticated]
+
+
+class AsyncAuthenticatedGenericAPIView(async_generics.GenericAPIView):
+    """
+    An async (adrf) base view that requires authentication for access.
+    """
+
+    permission_classes = [IsAuthenticated]
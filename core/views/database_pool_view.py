@@ -0,0 +1,24 @@
+from typing import ClassVar
+
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db.pool import pool_stats
+
+
+@extend_schema(
+    tags=["Health"],
+    summary="Database Pool Stats",
+    description=(
+        "Connection pool counters of the worker process that answers, per "
+        "database alias (null when the alias is not pooled). Staff only."
+    ),
+)
+class DatabasePoolStatsView(APIView):
+    permission_classes: ClassVar[list[IsAdminUser]] = [IsAdminUser]
+
+    def get(self, request: Request, *_args, **_kwargs) -> Response:
+        return Response({"pools": pool_stats()}, status=200)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import hashlib
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Count, Max
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.db.routers import is_sticky, mark_sticky, replica_alias, replica_reads
+from core.serializers.fast import FastSerializer
+from core.serializers.sparse_fieldsets import requested_fields
+
+
+class TransactionPolicyMixin:
+    """
+    Per-view transaction policy used instead of ``ATOMIC_REQUESTS``.
+
+    Safe methods run in autocommit, so a read costs no BEGIN/COMMIT
+    round-trips, and are routed to the read replica when one is configured.
+    Methods in ``atomic_methods`` run inside a single ``transaction.atomic``
+    block on the primary that is rolled back when the view answers with an
+    error status (400 or above), whether it raised or returned the response.
+
+    Authentication always reads from the primary.  A user whose write just
+    succeeded is kept on the primary for ``DATABASE_REPLICA_STICKY_SECONDS``
+    so they see their own changes; views that must never read stale data set
+    ``read_from_replica = False`` or override :meth:`should_read_from_replica`.
+    """
+
+    atomic_methods: ClassVar[frozenset[str]] = frozenset(
+        {"POST", "PUT", "PATCH", "DELETE"}
+    )
+    read_from_replica: ClassVar[bool] = True
+
+    def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        if request.method in self.atomic_methods:
+            with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                response = super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+                if response.status_code >= 400:
+                    transaction.set_rollback(True, using=DEFAULT_DB_ALIAS)
+            if response.status_code < 400:
+                self.mark_written(self.request)  # type: ignore[attr-defined]
+            return response
+        with ExitStack() as self._read_routing:
+            return super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        if request.method not in self.atomic_methods and (
+            self.should_read_from_replica(request)
+        ):
+            self._read_routing.enter_context(replica_reads())
+
+    def should_read_from_replica(self, request: Request) -> bool:
+        """Return whether this request's reads may be served by the replica."""
+        if not self.read_from_replica or replica_alias() is None:
+            return False
+        user = request.user
+        return not (user.is_authenticated and is_sticky(user.pk))
+
+    def mark_written(self, request: Request) -> None:
+        """Pin the requesting user to the primary after a successful write."""
+        if request.user.is_authenticated:
+            mark_sticky(request.user.pk)
+
+
+class UserOwnedQuerysetMixin:
+    """Restrict the view's queryset to rows owned by the requesting user."""
+
+    owner_field: ClassVar[str] = "user"
+
+    def get_queryset(self) -> models.QuerySet:
+        queryset = super().get_queryset()  # type: ignore[misc]
+        return queryset.filter(**{self.owner_field: self.request.user})  # type: ignore[attr-defined]
+
+
+def paginator_ordering_fields(view: Any) -> list[str]:
+    """Return the column names a view's paginator orders (and cursors) by."""
+    ordering = getattr(view.paginator, "ordering", None) or ()
+    if isinstance(ordering, str):
+        ordering = (ordering,)
+    return [name.lstrip("-") for name in ordering]
+
+
+class SparseFieldsetMixin:
+    """
+    Load only the columns a ``?fields=`` request asks for.
+
+    Pairs with ``SparseFieldsetSerializerMixin``: the sources of the
+    projected serializer's fields become a ``.only()`` on the queryset, plus
+    the primary key and the paginator's ordering columns.  A requested field
+    that is not a plain column (method fields, dotted or ``*`` sources,
+    many-to-many) leaves the queryset unprojected.
+    """
+
+    def get_queryset(self) -> models.QuerySet:
+        queryset = super().get_queryset()  # type: ignore[misc]
+        if requested_fields(self.request) is None:  # type: ignore[attr-defined]
+            return queryset
+        columns = self.get_projected_columns(queryset.model)
+        return queryset if columns is None else queryset.only(*columns)
+
+    def get_projected_columns(self, model: type[models.Model]) -> list[str] | None:
+        columns = {model._meta.pk.name, *paginator_ordering_fields(self)}
+        for field in self.get_serializer().fields.values():  # type: ignore[attr-defined]
+            if field.write_only:
+                continue
+            if field.source == "*" or "." in field.source:
+                return None
+            try:
+                model_field = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+            columns.add(model_field.name)
+        return sorted(columns)
+
+
+class FastListMixin:
+    """
+    Serve ``list()`` through a compiled :class:`FastSerializer`.
+
+    The filtered queryset is projected with ``values()`` (honouring
+    ``?fields=``), paginated as dicts and turned into the same JSON the
+    regular serializer would produce, without building model instances.
+    Serializers the fast path cannot express fall back to the regular
+    ``list()``.
+    """
+
+    def get_fast_serializer(self) -> FastSerializer | None:
+        requested = requested_fields(self.request)  # type: ignore[attr-defined]
+        fast = FastSerializer.compile(self.get_serializer_class(), requested)  # type: ignore[attr-defined]
+        if fast is not None and requested and not requested <= set(fast.field_order):
+            # Unknown or write-only names: let the regular serializer answer.
+            return None
+        return fast
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        fast = self.get_fast_serializer()
+        if fast is None:
+            return super().list(request, *args, **kwargs)  # type: ignore[misc]
+        queryset = fast.project(
+            self.filter_queryset(self.get_queryset()),  # type: ignore[attr-defined]
+            *paginator_ordering_fields(self),
+        )
+        page = self.paginate_queryset(queryset)  # type: ignore[attr-defined]
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))  # type: ignore[attr-defined]
+        return Response(fast.serialize(queryset))
+
+
+@dataclass(frozen=True)
+class ConditionalValidators:
+    """Validators of a representation: an ETag and, optionally, a date."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+
+class _ConditionalResponse(Exception):  # noqa: N818
+    """Carries a 304/412 response out of ``initial()``."""
+
+    def __init__(self, response: HttpResponseBase) -> None:
+        super().__init__()
+        self.response = response
+
+
+def conditional_etag(request: Request, *parts: object) -> str:
+    """Build an ETag from *parts* plus what else shapes the representation.
+
+    The full path (query string: ``?fields=``, filters, cursor), the
+    negotiated media type and the requesting user are always included.
+    """
+    key = "|".join(
+        str(part)
+        for part in (
+            request.get_full_path(),
+            request.accepted_media_type,
+            request.user.pk,
+            *parts,
+        )
+    )
+    return f'"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+class ConditionalGetMixin:
+    """
+    Answer ``GET``/``HEAD`` with 304 Not Modified when the client is current.
+
+    Validators are computed right after authentication and permission
+    checks, before the object is loaded or serialized:
+
+    * detail views read only ``updated_at`` of the looked-up row and send
+      both ``ETag`` and ``Last-Modified``;
+    * list views use ``Max(updated_at)`` and ``Count`` over the filtered
+      queryset and send an ``ETag`` only (a deleted row leaves the maximum
+      unchanged, but not the count).
+
+    Views override :meth:`get_conditional_validators` when they know a
+    cheaper source.  Writes through ``queryset.update()`` do not touch
+    ``updated_at`` and so are invisible here.
+    """
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)  # type: ignore[misc]
+        self._validators = None
+        if request.method not in ("GET", "HEAD"):
+            return
+        self._validators = self.get_conditional_validators(request)
+        if self._validators is None:
+            return
+        last_modified = self._validators.last_modified
+        response = get_conditional_response(
+            request,
+            etag=self._validators.etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None:
+            raise _ConditionalResponse(response)
+
+    def get_conditional_validators(
+        self, request: Request
+    ) -> ConditionalValidators | None:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field  # type: ignore[attr-defined]
+        if lookup_url_kwarg in self.kwargs:  # type: ignore[attr-defined]
+            updated_at = (
+                queryset.filter(
+                    **{self.lookup_field: self.kwargs[lookup_url_kwarg]}  # type: ignore[attr-defined]
+                )
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+            if updated_at is None:
+                return None  # Let the view answer 404.
+            return ConditionalValidators(
+                conditional_etag(request, updated_at.isoformat()), updated_at
+            )
+        stats = queryset.aggregate(last=Max("updated_at"), count=Count("pk"))
+        return ConditionalValidators(
+            conditional_etag(request, stats["last"], stats["count"])
+        )
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: HttpResponseBase,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        response = super().finalize_response(request, response, *args, **kwargs)  # type: ignore[misc]
+        validators = getattr(self, "_validators", None)
+        if validators is not None and response.status_code in (200, 304):
+            response["ETag"] = validators.etag
+            if validators.last_modified is not None:
+                response["Last-Modified"] = http_date(
+                    validators.last_modified.timestamp()
+                )
+            # Cacheable by the client only, and always revalidated.
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Accept", "Authorization"))
+        return response
+
+    def handle_exception(self, exc: Exception) -> HttpResponseBase:
+        if isinstance(exc, _ConditionalResponse):
+            return exc.response
+        return super().handle_exception(exc)  # type: ignore[misc]
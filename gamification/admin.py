@@ -1,3 +1,36 @@
 from django.contrib import admin
 
-# Register your models here.
+from core.admin import PrefixSearchMixin, SoftDeleteAdmin
+from gamification.models import Badge, Reward, UserBadge, UserReward
+
+
+@admin.register(Reward)
+class RewardAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("name", "reward_type", "cost_xp", "is_deleted")
+    list_filter = ("reward_type", "is_deleted")
+    search_fields = ("name",)  # a small catalog: not indexed
+    ordering = ("name",)
+
+
+@admin.register(Badge)
+class BadgeAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("name", "xp_required", "is_deleted")
+    search_fields = ("name",)  # a small catalog: not indexed
+    ordering = ("xp_required",)
+
+
+@admin.register(UserReward)
+class UserRewardAdmin(SoftDeleteAdmin):
+    list_display = ("user", "reward", "is_used", "created_at", "is_deleted")
+    list_filter = ("is_used", "is_deleted")
+    list_select_related = ("user", "reward")
+    autocomplete_fields = ("user", "reward")
+    ordering = ("-created_at",)
+
+
+@admin.register(UserBadge)
+class UserBadgeAdmin(SoftDeleteAdmin):
+    list_display = ("user", "badge", "created_at", "is_deleted")
+    list_select_related = ("user", "badge")
+    autocomplete_fields = ("user", "badge")
+    ordering = ("-created_at",)
@@ -2,5 +2,8 @@ from django.apps import AppConfig
 
 
 class GamificationConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'gamification'
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "gamification"
+
+    def ready(self) -> None:
+        from gamification import handlers  # noqa: F401
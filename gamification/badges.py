@@ -0,0 +1,54 @@
+"""Badge awards, earned at XP thresholds and granted by a queued job."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from gamification.models import Badge, UserBadge
+from jobs.queue import enqueue
+from users.models import CustomUser
+
+
+def queue_badge_awards(xp_ranges: dict[Any, tuple[int, int]]) -> int:
+    """
+    Queue an award job for each user whose XP crossed a badge threshold.
+
+    *xp_ranges* maps user ids to the ``(previous, current)`` XP they went
+    through; one query finds the thresholds in all of the ranges.  Returns
+    the number of jobs queued.
+    """
+    if not xp_ranges:
+        return 0
+    low = min(previous for previous, _ in xp_ranges.values())
+    high = max(current for _, current in xp_ranges.values())
+    thresholds = list(
+        Badge.objects.filter(xp_required__gt=low, xp_required__lte=high).values_list(
+            "xp_required", flat=True
+        )
+    )
+    queued = 0
+    for user_id, (previous, current) in xp_ranges.items():
+        if any(previous < threshold <= current for threshold in thresholds):
+            enqueue(
+                "award_badges",
+                {"user_id": str(user_id)},
+                key=f"award-badges:{user_id}:{current}",
+            )
+            queued += 1
+    return queued
+
+
+def award_badges(user_id: Any) -> int:
+    """Grant *user_id* every badge their XP qualifies for; returns how many."""
+    user = CustomUser.all_objects.filter(pk=user_id).only("pk", "xp").first()
+    if user is None:
+        return 0
+    earned = Badge.objects.filter(xp_required__lte=user.xp).exclude(
+        pk__in=UserBadge.all_objects.filter(user=user).values("badge_id")
+    )
+    # ignore_conflicts: a retried or concurrent run may have granted some.
+    created = UserBadge.objects.bulk_create(
+        [UserBadge(user=user, badge=badge) for badge in earned],
+        ignore_conflicts=True,
+    )
+    return len(created)
@@ -0,0 +1,14 @@
+"""Queued gamification work, run by ``manage.py run_worker``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from gamification.badges import award_badges
+from jobs.registry import deferred
+
+
+@deferred("award_badges")
+def award_badges_job(payload: dict[str, Any]) -> None:
+    """Grant ``user_id`` the badges their XP qualifies for."""
+    award_badges(payload["user_id"])
@@ -0,0 +1,14 @@
+"""Domain events of the gamification app (see ``core.events``)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from core.events import Event
+
+
+@dataclass(frozen=True)
+class RewardUsed(Event):
+    user_reward_id: Any
+    reward_id: Any
@@ -0,0 +1,22 @@
+"""Gamification side effects of domain events (see ``core.events``)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from core.events import subscribe
+from gamification.badges import queue_badge_awards
+from users.events import XPAwarded
+
+
+@subscribe(XPAwarded)
+def award_badges_for_xp(events: list[XPAwarded]) -> None:
+    """Queue one badge award per user for all the XP a transaction gave."""
+    xp_ranges: dict[Any, tuple[int, int]] = {}
+    for event in events:
+        previous, current = xp_ranges.get(event.user_id, (event.previous_xp, event.xp))
+        xp_ranges[event.user_id] = (
+            min(previous, event.previous_xp),
+            max(current, event.xp),
+        )
+    queue_badge_awards(xp_ranges)
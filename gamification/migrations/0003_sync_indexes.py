@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamification', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='badge',
+            index=models.Index(fields=['updated_at'], name='badge_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reward',
+            index=models.Index(fields=['updated_at'], name='reward_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userbadge',
+            index=models.Index(fields=['user', 'updated_at'], name='userbadge_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userreward',
+            index=models.Index(fields=['user', 'updated_at'], name='userreward_user_updated_idx'),
+        ),
+    ]
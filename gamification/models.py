@@ -2,7 +2,9 @@ from datetime import datetime
 
 from django.db import models
 
+from core.events import emit
 from core.models.base import BaseModel
+from gamification.events import RewardUsed
 from users.models import CustomUser
 
 
@@ -14,6 +16,7 @@ class Reward(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "Reward"
         verbose_name_plural = "Rewards"
+        indexes = [models.Index(fields=["updated_at"], name="reward_updated_idx")]
 
     TYPE_CHOICES: tuple[tuple[str, str], ...] = (
         ("item", "In-Game Item"),
@@ -41,6 +44,11 @@ class UserReward(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "User Reward"
         verbose_name_plural = "User Rewards"
+        indexes = [
+            models.Index(
+                fields=["user", "updated_at"], name="userreward_user_updated_idx"
+            )
+        ]
 
     user = models.ForeignKey(
         CustomUser, on_delete=models.CASCADE, related_name="purchased_rewards"
@@ -54,6 +62,13 @@ class UserReward(BaseModel):
         if not self.is_used:
             self.is_used = True
             self.save()
+            emit(
+                RewardUsed(
+                    user_id=self.user_id,
+                    user_reward_id=self.pk,
+                    reward_id=self.reward_id,
+                )
+            )
 
     def __str__(self) -> str:
         return f"{self.user.username} - {self.reward.name}"
@@ -72,6 +87,7 @@ class Badge(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "Badge"
         verbose_name_plural = "Badges"
+        indexes = [models.Index(fields=["updated_at"], name="badge_updated_idx")]
 
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField()
@@ -99,6 +115,11 @@ class UserBadge(BaseModel):
         verbose_name = "User Badge"
         verbose_name_plural = "User Badges"
         unique_together = ("user", "badge")
+        indexes = [
+            models.Index(
+                fields=["user", "updated_at"], name="userbadge_user_updated_idx"
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} - {self.badge.name}"
@@ -0,0 +1,15 @@
+from gamification.serializers.badge_serializer import (
+    BadgeSerializer,
+    UserBadgeSerializer,
+)
+from gamification.serializers.reward_serializer import (
+    RewardSerializer,
+    UserRewardSerializer,
+)
+
+__all__ = [
+    "BadgeSerializer",
+    "RewardSerializer",
+    "UserBadgeSerializer",
+    "UserRewardSerializer",
+]
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from gamification.models import Badge, UserBadge
+
+
+class BadgeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Badge
+        fields = (
+            "id",
+            "name",
+            "description",
+            "icon",
+            "xp_required",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
+
+
+class UserBadgeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserBadge
+        fields = ("id", "badge", "created_at", "updated_at")
+        read_only_fields = fields
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from gamification.models import Reward, UserReward
+
+
+class RewardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Reward
+        fields = (
+            "id",
+            "name",
+            "description",
+            "cost_xp",
+            "reward_type",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
+
+
+class UserRewardSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserReward
+        fields = ("id", "reward", "is_used", "created_at", "updated_at")
+        read_only_fields = fields
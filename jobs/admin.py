@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from django.contrib import admin
+from django.http import HttpRequest
+
+from jobs.models import JobRun, QueuedJob, ScheduledJob
+
+
+@admin.register(ScheduledJob)
+class ScheduledJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "enabled",
+        "next_run_at",
+        "last_status",
+        "last_duration_ms",
+        "run_count",
+        "failure_count",
+        "lease_owner",
+    )
+    list_filter = ("enabled", "last_status")
+    list_editable = ("enabled",)
+    readonly_fields = (
+        "name",
+        "description",
+        "lease_owner",
+        "lease_expires_at",
+        "last_started_at",
+        "last_duration_ms",
+        "last_status",
+        "run_count",
+        "failure_count",
+    )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        # Jobs are declared in code and synced by the scheduler.
+        return False
+
+
+@admin.register(JobRun)
+class JobRunAdmin(admin.ModelAdmin):
+    list_display = ("job", "started_at", "status", "duration_ms", "processed", "worker")
+    list_filter = ("status", "job")
+    list_select_related = ("job",)
+    date_hierarchy = "started_at"
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: JobRun | None = None
+    ) -> bool:
+        return False
+
+
+@admin.register(QueuedJob)
+class QueuedJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "status",
+        "priority",
+        "attempts",
+        "run_after",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "name")
+    search_fields = ("=idempotency_key",)
+    date_hierarchy = "created_at"
+    readonly_fields = (
+        "name",
+        "payload",
+        "idempotency_key",
+        "attempts",
+        "locked_by",
+        "locked_until",
+        "last_error",
+        "created_at",
+        "finished_at",
+    )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "jobs"
+
+    def ready(self) -> None:
+        # Apps declare periodic jobs in a ``scheduled`` module and the
+        # handlers of queued jobs in a ``deferred`` one.
+        autodiscover_modules("scheduled", "deferred")
@@ -0,0 +1,26 @@
+"""Keyset chunking for jobs that touch many rows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from django.db.models import QuerySet
+
+
+def pk_chunks(queryset: QuerySet, size: int) -> Iterator[list[Any]]:
+    """
+    Yield the primary keys of *queryset* in ascending chunks of *size*.
+
+    Each chunk is read after the previous one was yielded, starting past
+    its last key, so the caller may update the rows (even out of the
+    queryset's filter) without chunks skipping or repeating any.
+    """
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    last = None
+    while True:
+        chunk = list((pks.filter(pk__gt=last) if last is not None else pks)[:size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
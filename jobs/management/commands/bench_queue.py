@@ -0,0 +1,74 @@
+"""Benchmark the database task queue.
+
+In a throwaway database, times enqueueing ``--jobs`` jobs (plain and with
+idempotency keys), then drains them with the ``run_worker`` loop at each
+``--concurrency`` level, once with a no-op handler (queue overhead) and
+once with a handler sleeping ``--io-ms`` (an email API call, say).
+
+Usage::
+
+    python manage.py bench_queue
+    python manage.py bench_queue --jobs 5000 --concurrency 1 4 16 --io-ms 20
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+from core.benchmarks import bench_database, format_table
+from jobs.models import QueuedJob
+from jobs.queue import enqueue, work
+from jobs.registry import handlers
+
+
+class Command(BaseCommand):
+    help = "Time enqueueing and worker throughput of the task queue"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--jobs", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+        parser.add_argument("--io-ms", type=float, default=10.0)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        count = options["jobs"]
+        io_seconds = options["io_ms"] / 1000
+        bench_handlers = {
+            "bench_noop": lambda payload: None,
+            "bench_io": lambda payload: time.sleep(io_seconds),
+        }
+        rows = []
+        with bench_database(), mock.patch.dict(handlers, bench_handlers):
+            for label, key in (("enqueue", False), ("enqueue with key", True)):
+                QueuedJob.objects.all().delete()
+                started = time.perf_counter()
+                for n in range(count):
+                    enqueue("bench_noop", {"n": n}, key=f"bench:{n}" if key else None)
+                elapsed = time.perf_counter() - started
+                rows.append((label, "-", count, f"{count / elapsed:,.0f}"))
+
+            for name in bench_handlers:
+                jobs = count if name == "bench_noop" else min(count, 500)
+                for concurrency in options["concurrency"]:
+                    rows.append(self.drain(name, jobs, concurrency))
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{connection.vendor}, I/O handler sleeps {options['io_ms']} ms"
+        )
+        self.stdout.write(format_table(("run", "threads", "jobs", "jobs/s"), rows))
+
+    def drain(self, name: str, jobs: int, concurrency: int) -> tuple[object, ...]:
+        QueuedJob.objects.all().delete()
+        QueuedJob.objects.bulk_create(
+            QueuedJob(name=name, payload={"n": n}) for n in range(jobs)
+        )
+        started = time.perf_counter()
+        processed = work("bench", concurrency, threading.Event(), poll=0.01, burst=True)
+        elapsed = time.perf_counter() - started
+        return (f"drain {name}", concurrency, processed, f"{processed / elapsed:,.0f}")
@@ -0,0 +1,122 @@
+"""Run the periodic jobs declared in the apps' ``scheduled`` modules.
+
+Any number of replicas can run the scheduler: each job run is claimed
+through a lease on its ``ScheduledJob`` row, so it happens on one of them.
+Every run is recorded (``JobRun``) with its duration, status and the rows
+it processed; ``--stats`` summarizes them per job.
+
+Usage::
+
+    python manage.py run_scheduler
+    python manage.py run_scheduler --once
+    python manage.py run_scheduler --run mark_overdue_tasks
+    python manage.py run_scheduler --stats --days 7
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core.benchmarks import format_table
+from jobs.models import JobRun, ScheduledJob
+from jobs.registry import registry
+from jobs.scheduler import job_stats, run_now, run_pending, sync_jobs, worker_id
+
+
+class Command(BaseCommand):
+    help = "Run scheduled jobs (streak resets, overdue tasks, cleanups, rollups)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--once", action="store_true", help="Run the due jobs once and exit."
+        )
+        parser.add_argument(
+            "--run", metavar="NAME", help="Run this job now, whatever its schedule."
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print per-job run metrics and exit.",
+        )
+        parser.add_argument(
+            "--days", type=int, default=1, help="Window of --stats, in days."
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=settings.SCHEDULER_POLL_SECONDS,
+            help="Seconds between checks for due jobs.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        if options["stats"]:
+            self.print_stats(options["days"])
+            return
+
+        sync_jobs()
+        owner = worker_id()
+        if options["run"]:
+            if options["run"] not in registry:
+                msg = f"Unknown job {options['run']!r}."
+                raise CommandError(msg)
+            run = run_now(options["run"], owner)
+            if run is None:
+                msg = f"Job {options['run']!r} is disabled or running elsewhere."
+                raise CommandError(msg)
+            self.report(run)
+            return
+        if options["once"]:
+            for run in run_pending(owner):
+                self.report(run)
+            return
+
+        stopping = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stopping.set())
+        self.stdout.write(f"Scheduler {owner} running {len(registry)} job(s).")
+        while not stopping.is_set():
+            close_old_connections()
+            for run in run_pending(owner):
+                self.report(run)
+            stopping.wait(options["poll"])
+        self.stdout.write("Scheduler stopped.")
+
+    def report(self, run: JobRun) -> None:
+        line = f"{run.job.name}: {run.status} in {run.duration_ms} ms"
+        if run.processed is not None:
+            line += f", {run.processed:,} row(s)"
+        style = self.style.SUCCESS if run.status == "succeeded" else self.style.ERROR
+        self.stdout.write(style(line))
+
+    def print_stats(self, days: int) -> None:
+        stats = {
+            row["name"]: row for row in job_stats(timezone.now() - timedelta(days=days))
+        }
+        rows = []
+        for job in ScheduledJob.objects.all():
+            row = stats.get(job.name, {})
+            rows.append(
+                (
+                    job.name,
+                    "yes" if job.enabled else "no",
+                    row.get("runs", 0),
+                    row.get("failures", 0),
+                    f"{row['avg_ms']:.0f}" if row else "-",
+                    row.get("max_ms", "-"),
+                    f"{job.next_run_at:%Y-%m-%d %H:%M}",
+                )
+            )
+        self.stdout.write(
+            format_table(
+                ("job", "enabled", "runs", "failed", "avg ms", "max ms", "next run"),
+                rows,
+            )
+        )
@@ -0,0 +1,65 @@
+"""Work the database task queue (``jobs.queue``).
+
+The worker claims ready jobs in batches, runs them on a thread pool of
+``--concurrency`` threads, and periodically requeues jobs whose worker
+died.  Run as many worker processes as needed: claims skip rows locked by
+other workers, so they share the queue without a broker.
+
+Usage::
+
+    python manage.py run_worker
+    python manage.py run_worker --concurrency 8
+    python manage.py run_worker --burst
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from jobs.queue import work
+from jobs.scheduler import worker_id
+
+
+class Command(BaseCommand):
+    help = "Run queued jobs (emails, badge awards and other deferred work)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.JOB_QUEUE_CONCURRENCY,
+            help="Jobs run at once, each on its own thread.",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=settings.JOB_QUEUE_POLL_SECONDS,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue has no ready jobs left.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        owner = worker_id()
+        stopping = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *_: stopping.set())
+
+        self.stdout.write(f"Worker {owner} running {options['concurrency']} thread(s).")
+        processed = work(
+            owner,
+            options["concurrency"],
+            stopping,
+            poll=options["poll"],
+            burst=options["burst"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Worker stopped: {processed:,} job(s)."))
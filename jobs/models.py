@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from django.db import models
+from django.utils import timezone
+
+
+class ScheduledJob(models.Model):
+    """
+    The schedule and lease of a job declared with ``jobs.registry.scheduled``.
+
+    A scheduler claims a due job by taking its lease with one conditional
+    ``UPDATE``, so with several replicas running ``run_scheduler`` each run
+    happens once.  A lease left by a crashed scheduler expires after
+    ``SCHEDULER_LEASE_SECONDS``.
+    """
+
+    STATUS_CHOICES = [
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    name = models.CharField(max_length=100, unique=True)
+    description = models.CharField(max_length=255, blank=True)
+    enabled = models.BooleanField(default=True)
+    interval = models.DurationField(help_text="Time between runs.")
+    run_at = models.TimeField(
+        null=True, blank=True, help_text="Run daily at this time (UTC) instead."
+    )
+    next_run_at = models.DateTimeField()
+
+    lease_owner = models.CharField(max_length=255, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
+    last_started_at = models.DateTimeField(null=True, blank=True)
+    last_duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    last_status = models.CharField(max_length=20, choices=STATUS_CHOICES, blank=True)
+    run_count = models.PositiveIntegerField(default=0)
+    failure_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["name"]
+        indexes = [
+            models.Index(fields=["next_run_at"], name="job_next_run_idx"),
+        ]
+
+    def next_run_after(self, moment: datetime) -> datetime:
+        """Return when the job is next due after *moment*."""
+        if self.run_at is None:
+            return moment + self.interval
+        candidate = datetime.combine(moment.date(), self.run_at, tzinfo=UTC)
+        if candidate <= moment:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class JobRun(models.Model):
+    """One execution of a job, kept for duration metrics and failures."""
+
+    job = models.ForeignKey(ScheduledJob, on_delete=models.CASCADE, related_name="runs")
+    worker = models.CharField(max_length=255)
+    started_at = models.DateTimeField()
+    duration_ms = models.PositiveIntegerField()
+    status = models.CharField(max_length=20, choices=ScheduledJob.STATUS_CHOICES)
+    processed = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["job", "started_at"], name="jobrun_job_started_idx"),
+            models.Index(fields=["started_at"], name="jobrun_started_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.job} at {self.started_at:%Y-%m-%d %H:%M} ({self.status})"
+
+
+class QueuedJob(models.Model):
+    """
+    Deferred work for ``manage.py run_worker``, handled by ``jobs.queue``.
+
+    Workers claim ready rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` and
+    lease them for ``JOB_QUEUE_LEASE_SECONDS``; a job whose worker died is
+    queued again once its lease expires.  Finished rows are kept (and
+    pruned later) so an ``idempotency_key`` also dedupes late duplicates.
+    """
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    idempotency_key = models.CharField(
+        max_length=255, null=True, blank=True, unique=True
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="queued")
+    priority = models.SmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # The claim query: ready jobs by priority, then age.
+            models.Index(
+                fields=["-priority", "run_after"],
+                condition=models.Q(status="queued"),
+                name="queuedjob_ready_idx",
+            ),
+            models.Index(
+                fields=["locked_until"],
+                condition=models.Q(status="running"),
+                name="queuedjob_lease_idx",
+            ),
+            models.Index(
+                fields=["finished_at"],
+                condition=models.Q(status__in=["succeeded", "failed"]),
+                name="queuedjob_finished_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
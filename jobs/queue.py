@@ -0,0 +1,263 @@
+"""A task queue in the database, worked by ``manage.py run_worker``.
+
+:func:`enqueue` inserts a ``QueuedJob`` row, usually inside the request's
+transaction, so the job exists exactly when the data it refers to was
+committed.  Workers :func:`claim` batches of ready jobs with ``SELECT ...
+FOR UPDATE SKIP LOCKED`` (concurrent workers never wait on or take each
+other's rows), lease them, and :func:`run_job` calls the handler
+registered with ``jobs.registry.deferred``.
+
+Delivery is at least once: a failed job is retried with exponential
+backoff up to its ``max_attempts``, and the job of a worker that died is
+queued again when its lease expires (:func:`requeue_expired`).  Enqueueing
+with an ``idempotency_key`` creates at most one job per key.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.models import QueuedJob
+from jobs.registry import handlers
+
+logger = logging.getLogger(__name__)
+
+RETRY_BASE_SECONDS = 10
+RETRY_MAX_SECONDS = 3600
+
+
+def _job_fields(
+    name: str,
+    payload: dict[str, Any] | None,
+    priority: int,
+    delay: timedelta | None,
+    max_attempts: int,
+) -> dict[str, Any]:
+    if name not in handlers:
+        msg = f"No handler is registered for job {name!r}."
+        raise LookupError(msg)
+    return {
+        "name": name,
+        "payload": payload or {},
+        "priority": priority,
+        "run_after": timezone.now() + (delay or timedelta()),
+        "max_attempts": max_attempts,
+    }
+
+
+def enqueue(
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    key: str | None = None,
+    priority: int = 0,
+    delay: timedelta | None = None,
+    max_attempts: int = 5,
+) -> QueuedJob:
+    """
+    Queue the job *name* with a JSON-serializable *payload*.
+
+    With an idempotency *key*, the job already queued (or run) under it is
+    returned instead of queueing another.
+    """
+    fields = _job_fields(name, payload, priority, delay, max_attempts)
+    if key is None:
+        return QueuedJob.objects.create(**fields)
+    job, _ = QueuedJob.objects.get_or_create(idempotency_key=key, defaults=fields)
+    return job
+
+
+async def aenqueue(
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    key: str | None = None,
+    priority: int = 0,
+    delay: timedelta | None = None,
+    max_attempts: int = 5,
+) -> QueuedJob:
+    """Async variant of :func:`enqueue`."""
+    fields = _job_fields(name, payload, priority, delay, max_attempts)
+    if key is None:
+        return await QueuedJob.objects.acreate(**fields)
+    job, _ = await QueuedJob.objects.aget_or_create(
+        idempotency_key=key, defaults=fields
+    )
+    return job
+
+
+def claim(owner: str, limit: int) -> list[QueuedJob]:
+    """Lease up to *limit* ready jobs to *owner*, highest priority first."""
+    now = timezone.now()
+    locked_until = now + timedelta(seconds=settings.JOB_QUEUE_LEASE_SECONDS)
+    # Without row locks (SQLite) the conditional UPDATE alone settles races;
+    # a transaction there would only fail concurrent claims as "locked".
+    locks = connections[QueuedJob.objects.db].features.has_select_for_update_skip_locked
+    with transaction.atomic() if locks else nullcontext():
+        jobs = list(
+            QueuedJob.objects.select_for_update(skip_locked=True)
+            .filter(status="queued", run_after__lte=now)
+            .order_by("-priority", "run_after")[:limit]
+        )
+        if not jobs:
+            return []
+        claimed = QueuedJob.objects.filter(
+            pk__in=[job.pk for job in jobs], status="queued"
+        ).update(
+            status="running",
+            locked_by=owner,
+            locked_until=locked_until,
+            attempts=F("attempts") + 1,
+        )
+    if claimed != len(jobs):
+        # Another worker took some (only possible without row locks).
+        return list(
+            QueuedJob.objects.filter(
+                pk__in=[job.pk for job in jobs], status="running", locked_by=owner
+            )
+        )
+    for job in jobs:
+        job.status = "running"
+        job.locked_by = owner
+        job.locked_until = locked_until
+        job.attempts += 1
+    return jobs
+
+
+def run_job(job: QueuedJob) -> bool:
+    """Run the claimed *job* and record the outcome; ``True`` on success."""
+    handler = handlers.get(job.name)
+    try:
+        if handler is None:
+            msg = f"No handler is registered for job {job.name!r}."
+            raise LookupError(msg)
+        handler(job.payload)
+    except Exception:
+        logger.exception("Queued job %s (%s) failed", job.name, job.pk)
+        outcome = _failure(job, traceback.format_exc())
+    else:
+        outcome = {"status": "succeeded", "finished_at": timezone.now()}
+    # Recorded only while the lease is ours: once it expired the job may
+    # have been claimed (and run) again by another worker.
+    QueuedJob.objects.filter(
+        pk=job.pk, status="running", locked_by=job.locked_by
+    ).update(locked_by="", locked_until=None, **outcome)
+    return outcome["status"] == "succeeded"
+
+
+def _failure(job: QueuedJob, error: str) -> dict[str, Any]:
+    now = timezone.now()
+    if job.attempts >= job.max_attempts:
+        return {"status": "failed", "finished_at": now, "last_error": error}
+    backoff = min(RETRY_BASE_SECONDS * 2 ** (job.attempts - 1), RETRY_MAX_SECONDS)
+    return {
+        "status": "queued",
+        "run_after": now + timedelta(seconds=backoff),
+        "last_error": error,
+    }
+
+
+def requeue_expired() -> int:
+    """Queue again the jobs whose worker's lease expired; returns how many."""
+    now = timezone.now()
+    expired = QueuedJob.objects.filter(status="running", locked_until__lt=now)
+    exhausted = expired.filter(attempts__gte=F("max_attempts")).update(
+        status="failed",
+        locked_by="",
+        locked_until=None,
+        finished_at=now,
+        last_error="Lease expired on the last attempt.",
+    )
+    return exhausted + expired.update(
+        status="queued", locked_by="", locked_until=None, run_after=now
+    )
+
+
+def run_pending_jobs(owner: str = "inline", limit: int = 100) -> int:
+    """Claim and run ready jobs in this thread until none is left."""
+    done = 0
+    while jobs := claim(owner, limit):
+        for job in jobs:
+            run_job(job)
+            done += 1
+    return done
+
+
+def work(
+    owner: str,
+    concurrency: int,
+    stopping: threading.Event,
+    *,
+    poll: float = 1.0,
+    burst: bool = False,
+) -> int:
+    """Run jobs on *concurrency* threads until *stopping* is set."""
+    slots = threading.BoundedSemaphore(concurrency)
+    processed = 0
+    lock = threading.Lock()
+
+    def process(job: QueuedJob) -> None:
+        nonlocal processed
+        try:
+            run_job(job)
+            with lock:
+                processed += 1
+        finally:
+            # As after a request: drop the thread's connection if it is
+            # broken or past CONN_MAX_AGE.
+            close_old_connections()
+            slots.release()
+
+    requeued_at = 0.0
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="job") as pool:
+        while not stopping.is_set():
+            if time.monotonic() - requeued_at > settings.JOB_QUEUE_LEASE_SECONDS / 2:
+                requeue_expired()
+                requeued_at = time.monotonic()
+
+            # Claim only as many jobs as there are idle threads.
+            free = _acquire_idle(slots, concurrency)
+            jobs = claim(owner, free)
+            for _ in range(free - len(jobs)):
+                slots.release()
+            for job in jobs:
+                pool.submit(process, job)
+            if jobs:
+                continue
+            if burst and _drained(slots, concurrency):
+                break
+            stopping.wait(poll)
+    close_old_connections()
+    return processed
+
+
+def _acquire_idle(slots: threading.BoundedSemaphore, concurrency: int) -> int:
+    """Wait for an idle thread, then take every other idle one; return the count."""
+    slots.acquire()
+    free = 1
+    while free < concurrency and slots.acquire(blocking=False):
+        free += 1
+    return free
+
+
+def _drained(slots: threading.BoundedSemaphore, concurrency: int) -> bool:
+    """Wait for the running jobs, then tell whether none is ready to run."""
+    for _ in range(concurrency):
+        slots.acquire()
+    for _ in range(concurrency):
+        slots.release()
+    return not QueuedJob.objects.filter(
+        status="queued", run_after__lte=timezone.now()
+    ).exists()
@@ -0,0 +1,81 @@
+"""Job definitions, declared in code with :func:`scheduled` and :func:`deferred`.
+
+Apps register their periodic jobs in a ``scheduled`` module, imported by
+``JobsConfig.ready()``::
+
+    @scheduled("mark_overdue_tasks", every=timedelta(hours=1))
+    def mark_overdue_tasks(batch_size: int) -> int: ...
+
+A job receives the batch size to work in (``JOB_BATCH_SIZE``) and returns
+the number of rows it processed.  The definition only seeds the schedule:
+once synced, the ``ScheduledJob`` row (editable in the admin) decides when
+the job runs.  Jobs may run again after a crash or an expired lease, so
+they must be idempotent.
+
+Handlers of queued work (``jobs.queue``) are registered with
+:func:`deferred` in a ``deferred`` module and receive the JSON payload they
+were enqueued with.  Delivery is at least once, so they must be
+idempotent too.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import time, timedelta
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+JobFunc = Callable[[int], int | None]
+Handler = Callable[[dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    """A job named *name*, run every *every* or daily at *at* (UTC)."""
+
+    name: str
+    func: JobFunc
+    every: timedelta = timedelta(days=1)
+    at: time | None = None
+    description: str = ""
+
+
+registry: dict[str, JobDefinition] = {}
+handlers: dict[str, Handler] = {}
+
+
+def scheduled(
+    name: str, *, every: timedelta = timedelta(days=1), at: time | None = None
+) -> Callable[[JobFunc], JobFunc]:
+    """Register the decorated function as the job *name*."""
+
+    def register(func: JobFunc) -> JobFunc:
+        if name in registry and registry[name].func is not func:
+            msg = f"Job {name!r} is already registered."
+            raise ImproperlyConfigured(msg)
+        description = (func.__doc__ or "").strip().splitlines()
+        registry[name] = JobDefinition(
+            name=name,
+            func=func,
+            every=every,
+            at=at,
+            description=description[0] if description else "",
+        )
+        return func
+
+    return register
+
+
+def deferred(name: str) -> Callable[[Handler], Handler]:
+    """Register the decorated function as the handler of queued jobs *name*."""
+
+    def register(func: Handler) -> Handler:
+        if handlers.get(name, func) is not func:
+            msg = f"Handler {name!r} is already registered."
+            raise ImproperlyConfigured(msg)
+        handlers[name] = func
+        return func
+
+    return register
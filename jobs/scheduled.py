@@ -0,0 +1,40 @@
+"""Housekeeping of the scheduler and the task queue."""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+
+from django.utils import timezone
+
+from jobs.batches import pk_chunks
+from jobs.models import JobRun, QueuedJob
+from jobs.registry import scheduled
+
+RUN_HISTORY_DAYS = 30
+# Finished queued jobs, and so their idempotency keys, are kept this long.
+QUEUE_HISTORY_DAYS = 7
+
+
+@scheduled("prune_job_runs", every=timedelta(days=1), at=time(4, 30))
+def prune_job_runs(batch_size: int) -> int:
+    """Delete job run records older than 30 days."""
+    old = JobRun.objects.filter(
+        started_at__lt=timezone.now() - timedelta(days=RUN_HISTORY_DAYS)
+    )
+    deleted = 0
+    for chunk in pk_chunks(old, batch_size):
+        deleted += JobRun.objects.filter(pk__in=chunk).delete()[0]
+    return deleted
+
+
+@scheduled("prune_queued_jobs", every=timedelta(days=1), at=time(4, 45))
+def prune_queued_jobs(batch_size: int) -> int:
+    """Delete queued jobs that finished more than 7 days ago."""
+    old = QueuedJob.objects.filter(
+        status__in=["succeeded", "failed"],
+        finished_at__lt=timezone.now() - timedelta(days=QUEUE_HISTORY_DAYS),
+    )
+    deleted = 0
+    for chunk in pk_chunks(old, batch_size):
+        deleted += QueuedJob.objects.filter(pk__in=chunk).delete()[0]
+    return deleted
@@ -0,0 +1,149 @@
+"""Run due jobs under a lease and record how long they took.
+
+:func:`run_pending` is one scheduler tick: every enabled job whose
+``next_run_at`` has passed is claimed with a conditional ``UPDATE`` (only
+one replica's succeeds), run, and released with its next run time and the
+metrics of the run.  ``manage.py run_scheduler`` calls it in a loop.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, Max, Q
+from django.utils import timezone
+
+from jobs.models import JobRun, ScheduledJob
+from jobs.registry import registry
+
+logger = logging.getLogger(__name__)
+
+
+def worker_id() -> str:
+    """Identify this process in job leases."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def sync_jobs(now: datetime | None = None) -> list[ScheduledJob]:
+    """Create the rows of newly declared jobs; existing schedules are kept."""
+    now = now or timezone.now()
+    existing = set(ScheduledJob.objects.values_list("name", flat=True))
+    created = []
+    for definition in registry.values():
+        if definition.name in existing:
+            continue
+        job = ScheduledJob(
+            name=definition.name,
+            description=definition.description,
+            interval=definition.every,
+            run_at=definition.at,
+        )
+        job.next_run_at = job.next_run_after(now)
+        created.append(job)
+    # ignore_conflicts: another replica may be syncing the same jobs.
+    ScheduledJob.objects.bulk_create(created, ignore_conflicts=True)
+    return created
+
+
+def claim(job: ScheduledJob, owner: str, now: datetime) -> bool:
+    """Take *job*'s lease if it is due at *now* and nobody else holds it."""
+    current = timezone.now()
+    claimed = (
+        ScheduledJob.objects.filter(pk=job.pk, enabled=True, next_run_at__lte=now)
+        .filter(Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=current))
+        .update(
+            lease_owner=owner,
+            lease_expires_at=current
+            + timedelta(seconds=settings.SCHEDULER_LEASE_SECONDS),
+        )
+    )
+    return claimed == 1
+
+
+def execute(job: ScheduledJob, owner: str) -> JobRun:
+    """Run the claimed *job*, then release it and record the run."""
+    definition = registry.get(job.name)
+    started_at = timezone.now()
+    started = time.perf_counter()
+    processed = None
+    error = ""
+    try:
+        if definition is None:
+            msg = f"Job {job.name!r} is not declared by any installed app."
+            raise LookupError(msg)
+        processed = definition.func(settings.JOB_BATCH_SIZE)
+    except Exception:
+        logger.exception("Job %s failed", job.name)
+        error = traceback.format_exc()
+    duration_ms = round((time.perf_counter() - started) * 1000)
+    status = "failed" if error else "succeeded"
+    logger.info("Job %s %s in %d ms", job.name, status, duration_ms)
+
+    finished_at = timezone.now()
+    # Released only if the lease is still ours; past its expiry another
+    # scheduler may have run the job and moved it on already.
+    ScheduledJob.objects.filter(pk=job.pk, lease_owner=owner).update(
+        lease_owner="",
+        lease_expires_at=None,
+        next_run_at=job.next_run_after(finished_at),
+        last_started_at=started_at,
+        last_duration_ms=duration_ms,
+        last_status=status,
+        run_count=F("run_count") + 1,
+        failure_count=F("failure_count") + (1 if error else 0),
+    )
+    return JobRun.objects.create(
+        job=job,
+        worker=owner,
+        started_at=started_at,
+        duration_ms=duration_ms,
+        status=status,
+        processed=processed,
+        error=error,
+    )
+
+
+def run_pending(owner: str | None = None, now: datetime | None = None) -> list[JobRun]:
+    """Run every due job this scheduler manages to claim, oldest first."""
+    owner = owner or worker_id()
+    now = now or timezone.now()
+    due = ScheduledJob.objects.filter(enabled=True, next_run_at__lte=now).order_by(
+        "next_run_at"
+    )
+    return [execute(job, owner) for job in due if claim(job, owner, now)]
+
+
+def run_now(name: str, owner: str | None = None) -> JobRun | None:
+    """Run the job *name* regardless of its schedule, unless disabled or leased."""
+    owner = owner or worker_id()
+    now = timezone.now()
+    job = ScheduledJob.objects.get(name=name)
+    ScheduledJob.objects.filter(pk=job.pk).filter(
+        Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
+    ).update(next_run_at=now)
+    job.refresh_from_db()
+    if job.next_run_at > now or not claim(job, owner, now):
+        return None
+    return execute(job, owner)
+
+
+def job_stats(since: datetime) -> list[dict[str, Any]]:
+    """Per-job run count, failures and durations of the runs since *since*."""
+    return list(
+        JobRun.objects.filter(started_at__gte=since)
+        .values(name=F("job__name"))
+        .annotate(
+            runs=Count("pk"),
+            failures=Count("pk", filter=Q(status="failed")),
+            avg_ms=Avg("duration_ms"),
+            max_ms=Max("duration_ms"),
+        )
+        .order_by("name")
+    )
@@ -0,0 +1,132 @@
+"""Tests for the database task queue."""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.test import (
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+    skipUnlessDBFeature,
+)
+from django.utils import timezone
+
+from jobs.models import QueuedJob
+from jobs.queue import claim, enqueue, requeue_expired, run_job, run_pending_jobs, work
+from jobs.registry import handlers
+
+seen: list[dict] = []
+
+
+def recording_handler(payload: dict) -> None:
+    seen.append(payload)
+
+
+def flaky_handler(payload: dict) -> None:
+    msg = "temporarily unavailable"
+    raise ConnectionError(msg)
+
+
+TEST_HANDLERS = {"record": recording_handler, "flaky": flaky_handler}
+
+
+class QueueTestMixin:
+    def setUp(self) -> None:
+        seen.clear()
+        patcher = mock.patch.dict(handlers, TEST_HANDLERS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@override_settings(JOB_QUEUE_LEASE_SECONDS=60)
+class QueueTests(QueueTestMixin, TestCase):
+    def test_unknown_job_is_rejected(self) -> None:
+        with self.assertRaises(LookupError):
+            enqueue("nope")
+
+    def test_idempotency_key_queues_one_job(self) -> None:
+        first = enqueue("record", {"n": 1}, key="once")
+        second = enqueue("record", {"n": 2}, key="once")
+        assert first.pk == second.pk
+        assert run_pending_jobs() == 1
+        assert seen == [{"n": 1}]
+        # Still deduplicated after the job ran.
+        enqueue("record", {"n": 3}, key="once")
+        assert run_pending_jobs() == 0
+
+    def test_claim_orders_by_priority_and_leases(self) -> None:
+        low = enqueue("record", {"n": "low"})
+        high = enqueue("record", {"n": "high"}, priority=5)
+        enqueue("record", {"n": "later"}, delay=timedelta(hours=1))
+
+        jobs = claim("worker-a", 10)
+        assert [job.pk for job in jobs] == [high.pk, low.pk]
+        assert all(job.attempts == 1 for job in jobs)
+        assert claim("worker-b", 10) == []
+        row = QueuedJob.objects.get(pk=high.pk)
+        assert row.status == "running"
+        assert row.locked_by == "worker-a"
+
+    def test_success_is_recorded(self) -> None:
+        job = enqueue("record", {"n": 1})
+        [claimed] = claim("worker-a", 1)
+        assert run_job(claimed)
+        job.refresh_from_db()
+        assert job.status == "succeeded"
+        assert job.finished_at is not None
+        assert job.locked_by == ""
+
+    def test_failures_back_off_then_give_up(self) -> None:
+        job = enqueue("flaky", max_attempts=2)
+        [claimed] = claim("worker-a", 1)
+        assert not run_job(claimed)
+        job.refresh_from_db()
+        assert job.status == "queued"
+        assert job.run_after > timezone.now()
+        assert "temporarily unavailable" in job.last_error
+
+        QueuedJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        [claimed] = claim("worker-a", 1)
+        run_job(claimed)
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert job.attempts == 2
+
+    def test_expired_lease_is_requeued_and_late_result_ignored(self) -> None:
+        job = enqueue("record", {"n": 1})
+        [stale] = claim("crashed", 1)
+        QueuedJob.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+        assert requeue_expired() == 1
+
+        [claimed] = claim("worker-b", 1)
+        assert claimed.attempts == 2
+        run_job(stale)  # the first worker finishing late changes nothing
+        assert QueuedJob.objects.get(pk=job.pk).locked_by == "worker-b"
+        run_job(claimed)
+        assert QueuedJob.objects.get(pk=job.pk).status == "succeeded"
+
+
+class WorkerTests(QueueTestMixin, TransactionTestCase):
+    def test_burst_worker_runs_every_job(self) -> None:
+        for n in range(5):
+            enqueue("record", {"n": n})
+        processed = work("worker-a", 1, threading.Event(), poll=0.01, burst=True)
+        assert processed == 5
+        assert sorted(payload["n"] for payload in seen) == list(range(5))
+        assert set(QueuedJob.objects.values_list("status", flat=True)) == {"succeeded"}
+
+    # SQLite locks the whole file for a write, so concurrent jobs there fail
+    # with "database is locked" now and then.
+    @skipUnlessDBFeature("has_select_for_update_skip_locked")
+    def test_burst_worker_runs_every_job_on_threads(self) -> None:
+        for n in range(25):
+            enqueue("record", {"n": n})
+        processed = work("worker-a", 4, threading.Event(), poll=0.01, burst=True)
+        assert processed == 25
+        assert sorted(payload["n"] for payload in seen) == list(range(25))
+        assert set(QueuedJob.objects.values_list("status", flat=True)) == {"succeeded"}
@@ -0,0 +1,128 @@
+"""Tests for the job scheduler: schedules, leases and run metrics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, time, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import JobRun, ScheduledJob
+from jobs.registry import JobDefinition, registry
+from jobs.scheduler import claim, run_now, run_pending, sync_jobs
+
+calls: list[int] = []
+
+
+def counting_job(batch_size: int) -> int:
+    calls.append(batch_size)
+    return 7
+
+
+def failing_job(batch_size: int) -> int:
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+TEST_JOBS = {
+    "counting": JobDefinition("counting", counting_job, every=timedelta(minutes=5)),
+    "failing": JobDefinition("failing", failing_job, every=timedelta(hours=1)),
+}
+
+
+@override_settings(JOB_BATCH_SIZE=50, SCHEDULER_LEASE_SECONDS=60)
+class SchedulerTests(TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        patcher = mock.patch.dict(registry, TEST_JOBS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sync_jobs()
+        ScheduledJob.objects.update(next_run_at=timezone.now() - timedelta(seconds=1))
+
+    def test_next_run_after_interval_and_daily_time(self) -> None:
+        moment = datetime(2026, 3, 1, 10, 30, tzinfo=UTC)
+        hourly = ScheduledJob(interval=timedelta(hours=1))
+        assert hourly.next_run_after(moment) == moment + timedelta(hours=1)
+        nightly = ScheduledJob(interval=timedelta(days=1), run_at=time(3, 0))
+        assert nightly.next_run_after(moment) == datetime(2026, 3, 2, 3, tzinfo=UTC)
+        morning = ScheduledJob(interval=timedelta(days=1), run_at=time(11, 0))
+        assert morning.next_run_after(moment) == datetime(2026, 3, 1, 11, tzinfo=UTC)
+
+    def test_sync_keeps_existing_schedules(self) -> None:
+        ScheduledJob.objects.filter(name="counting").update(
+            interval=timedelta(hours=2), enabled=False
+        )
+        assert sync_jobs() == []
+        job = ScheduledJob.objects.get(name="counting")
+        assert job.interval == timedelta(hours=2)
+        assert not job.enabled
+
+    def test_run_pending_records_metrics_and_reschedules(self) -> None:
+        before = timezone.now()
+        runs = {run.job.name: run for run in run_pending("worker-a")}
+
+        assert calls == [50]
+        assert runs["counting"].status == "succeeded"
+        assert runs["counting"].processed == 7
+        assert runs["failing"].status == "failed"
+        assert "boom" in runs["failing"].error
+        job = ScheduledJob.objects.get(name="counting")
+        assert job.lease_owner == ""
+        assert job.lease_expires_at is None
+        assert job.last_status == "succeeded"
+        assert job.last_duration_ms is not None
+        assert job.run_count == 1
+        assert job.next_run_at >= before + timedelta(minutes=5)
+        assert ScheduledJob.objects.get(name="failing").failure_count == 1
+
+        assert run_pending("worker-a") == []
+        assert calls == [50]
+
+    def test_leased_job_is_not_run_twice(self) -> None:
+        job = ScheduledJob.objects.get(name="counting")
+        now = timezone.now()
+        assert claim(job, "worker-a", now)
+        assert not claim(job, "worker-b", now)
+
+        runs = run_pending("worker-b")
+        assert [run.job.name for run in runs] == ["failing"]
+        assert calls == []
+
+    def test_expired_lease_is_taken_over(self) -> None:
+        job = ScheduledJob.objects.get(name="counting")
+        ScheduledJob.objects.filter(pk=job.pk).update(
+            lease_owner="crashed",
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        assert claim(job, "worker-b", timezone.now())
+        assert ScheduledJob.objects.get(pk=job.pk).lease_owner == "worker-b"
+
+    def test_disabled_job_is_skipped(self) -> None:
+        ScheduledJob.objects.filter(name="counting").update(enabled=False)
+        run_pending("worker-a")
+        assert calls == []
+        assert run_now("counting", "worker-a") is None
+
+    def test_run_now_ignores_the_schedule(self) -> None:
+        ScheduledJob.objects.update(next_run_at=timezone.now() + timedelta(days=1))
+        run = run_now("counting", "worker-a")
+        assert run is not None
+        assert run.status == "succeeded"
+        assert calls == [50]
+
+    def test_command_runs_once_and_prints_stats(self) -> None:
+        out = StringIO()
+        call_command("run_scheduler", "--once", stdout=out)
+        assert "counting: succeeded" in out.getvalue()
+        assert "failing: failed" in out.getvalue()
+        assert JobRun.objects.count() == 2
+
+        out = StringIO()
+        call_command("run_scheduler", "--stats", stdout=out)
+        lines = out.getvalue().splitlines()
+        assert lines[0].split()[:3] == ["job", "enabled", "runs"]
+        assert any(line.split()[:4] == ["failing", "yes", "1", "1"] for line in lines)
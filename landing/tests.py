@@ -1,2 +1,27 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+
+class LandingPageCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_repeat_hits_skip_template_rendering(self) -> None:
+        with self.assertTemplateUsed("landing/page.html"):
+            first = self.client.get(reverse("landing"))
+        with self.assertTemplateNotUsed("landing/page.html"):
+            second = self.client.get(reverse("landing"))
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert "max-age" in second["Cache-Control"]
+
+    def test_gzip_variant_is_cached_separately(self) -> None:
+        plain = self.client.get(reverse("landing"))
+        with self.assertTemplateUsed("landing/page.html"):
+            gzipped = self.client.get(reverse("landing"), HTTP_ACCEPT_ENCODING="gzip")
+        assert "Content-Encoding" not in plain
+        assert gzipped["Content-Encoding"] == "gzip"
+        with self.assertTemplateNotUsed("landing/page.html"):
+            again = self.client.get(reverse("landing"), HTTP_ACCEPT_ENCODING="gzip")
+        assert again.content == gzipped.content
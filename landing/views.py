@@ -1,5 +1,21 @@
+from django.conf import settings
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.gzip import gzip_page
 from django.views.generic import TemplateView
 
 
+# The page is anonymous and identical for every visitor, so whole responses
+# are cached (the key includes the active language).  gzip runs inside the
+# cache: hits are stored compressed per Accept-Encoding and GZipMiddleware
+# leaves them alone.
+@method_decorator(
+    cache_page(
+        settings.LANDING_CACHE_SECONDS,
+        key_prefix=f"landing:{settings.RELEASE_VERSION}",
+    ),
+    name="dispatch",
+)
+@method_decorator(gzip_page, name="dispatch")
 class LandingPageView(TemplateView):
     template_name = "landing/page.html"
@@ -0,0 +1,115 @@
+"""Request latency per connection strategy: per-request, persistent, pooled.
+
+Serves a throwaway PostgreSQL database three times with the same gunicorn
+worker layout and drives an authenticated endpoint with concurrent clients:
+
+* ``per-request``: ``CONN_MAX_AGE=0``, a new connection for every request;
+* ``persistent``: ``CONN_MAX_AGE=60``, one connection per worker thread;
+* ``pooled``: the psycopg pool shared by the threads of each worker.
+
+Usage::
+
+    python manage.py bench_db_connections
+    python manage.py bench_db_connections --threads 8 --pool-max-size 4
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.benchmarks import bench_database, format_table, run_http_load, serve_process
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare request latency of per-request, persistent and pooled connections"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--threads", type=int, default=4)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--duration", type=float, default=10.0)
+        parser.add_argument("--pool-max-size", type=int, default=4)
+        parser.add_argument("--path", default="/api/auth/users/me/")
+
+    def handle(self, *args: object, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            msg = "Connection strategies only differ on PostgreSQL (DB_ENGINE)."
+            raise CommandError(msg)
+
+        strategies = (
+            ("per-request", {"DB_POOL": "0", "DB_CONN_MAX_AGE": "0"}),
+            ("persistent", {"DB_POOL": "0", "DB_CONN_MAX_AGE": "60"}),
+            (
+                "pooled",
+                {
+                    "DB_POOL": "1",
+                    "DB_POOL_MIN_SIZE": "1",
+                    "DB_POOL_MAX_SIZE": str(options["pool_max_size"]),
+                },
+            ),
+        )
+        serve_args = [
+            "--workers",
+            str(options["workers"]),
+            "--threads",
+            str(options["threads"]),
+        ]
+
+        rows = []
+        with bench_database() as db_env:
+            user = User.objects.create_user(
+                username="bench-conn", email="bench-conn@example.com", password="x"
+            )
+            headers = {
+                "Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"
+            }
+            for label, strategy_env in strategies:
+                self.stdout.write(f"Running {label}...")
+                with serve_process(
+                    serve_args,
+                    env={**db_env, **strategy_env, "SECURE_SSL_REDIRECT": "0"},
+                ) as base_url:
+                    result = run_http_load(
+                        base_url + options["path"],
+                        concurrency=options["concurrency"],
+                        duration=options["duration"],
+                        headers=headers,
+                    )
+                rows.append(
+                    (
+                        label,
+                        result.requests,
+                        result.errors,
+                        f"{result.throughput:.1f}",
+                        f"{result.mean_ms:.1f}",
+                        f"{result.percentile(50):.1f}",
+                        f"{result.percentile(99):.1f}",
+                    )
+                )
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{options['workers']} worker(s) x {options['threads']} thread(s), "
+            f"{options['concurrency']} concurrent clients, GET {options['path']}"
+        )
+        self.stdout.write(
+            format_table(
+                (
+                    "strategy",
+                    "requests",
+                    "errors",
+                    "req/s",
+                    "mean ms",
+                    "p50 ms",
+                    "p99 ms",
+                ),
+                rows,
+            )
+        )
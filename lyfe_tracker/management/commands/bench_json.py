@@ -0,0 +1,123 @@
+"""Benchmark the API JSON renderer and parser backends.
+
+Serializes ``--rows`` tasks and goals from a throwaway database with the
+regular serializers (UUIDs, decimals, datetimes included), then renders the
+list response and parses it back with DRF's stdlib-based classes and with
+the orjson ones, verifying that both renderers emit the same bytes.
+
+Usage::
+
+    python manage.py bench_json
+    python manage.py bench_json --rows 50000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.benchmarks import bench_database, format_table
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from productivity.models import Goal, Task
+from productivity.serializers import GoalSerializer, TaskSerializer
+from users.models import CustomUser
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class Command(BaseCommand):
+    help = "Compare stdlib and orjson rendering/parsing of large list responses"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        count, repeat = options["rows"], options["repeat"]
+        with bench_database():
+            user = CustomUser.objects.create_user(
+                username="bench-json", email="bench-json@example.com", password="x"
+            )
+            goals = Goal.objects.bulk_create(
+                Goal(
+                    user=user,
+                    name=f"Goal {n}",
+                    target_value=Decimal(n) / 4,
+                    target_date=timezone.localdate(),
+                )
+                for n in range(count)
+            )
+            Task.objects.bulk_create(
+                Task(
+                    user=user,
+                    title=f"Task {n} - ação",
+                    due_date=timezone.now(),
+                    goal=goals[n],
+                )
+                for n in range(count)
+            )
+            payloads = (
+                ("tasks", TaskSerializer(Task.objects.all(), many=True).data),
+                ("goals", GoalSerializer(Goal.objects.all(), many=True).data),
+            )
+
+        rows = []
+        for label, data in payloads:
+            body = JSONRenderer().render(data)
+            if ORJSONRenderer().render(data) != body:
+                msg = f"{label}: orjson output differs from the stdlib renderer"
+                raise CommandError(msg)
+            timings = [
+                best_of(repeat, lambda r=renderer, d=data: r.render(d))
+                for renderer in (JSONRenderer(), ORJSONRenderer())
+            ] + [
+                best_of(repeat, lambda p=parser, b=body: p.parse(io.BytesIO(b)))
+                for parser in (JSONParser(), ORJSONParser())
+            ]
+            render_std, render_fast, parse_std, parse_fast = timings
+            rows.append(
+                (
+                    label,
+                    count,
+                    f"{len(body) / 1024 / 1024:.1f}",
+                    f"{render_std * 1000:.1f}",
+                    f"{render_fast * 1000:.1f}",
+                    f"{render_std / render_fast:.1f}x",
+                    f"{parse_std * 1000:.1f}",
+                    f"{parse_fast * 1000:.1f}",
+                    f"{parse_std / parse_fast:.1f}x",
+                )
+            )
+
+        self.stdout.write(
+            format_table(
+                (
+                    "payload",
+                    "rows",
+                    "MiB",
+                    "render std ms",
+                    "render orjson ms",
+                    "speedup",
+                    "parse std ms",
+                    "parse orjson ms",
+                    "speedup",
+                ),
+                rows,
+            )
+        )
@@ -0,0 +1,114 @@
+"""Microbenchmark: DRF ModelSerializer vs the compiled fast path.
+
+Creates ``--rows`` users and as many tasks (each with a goal and a tag) in a
+throwaway database, then serializes and renders them to JSON with the
+regular serializer and with ``FastSerializer``, checks that both produce the
+same bytes and reports the best of ``--repeat`` runs.
+
+Usage::
+
+    python manage.py bench_serializers
+    python manage.py bench_serializers --rows 50000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rest_framework.renderers import JSONRenderer
+
+from authentication.serializers.user_serializer import CustomUserSerializer
+from core.benchmarks import bench_database, format_table
+from core.serializers.fast import FastSerializer
+from productivity.models import Goal, Tag, Task
+from productivity.serializers import TaskSerializer
+from users.models import CustomUser
+
+
+def best_of(repeat: int, func: Callable[[], bytes]) -> tuple[float, bytes]:
+    """Return the fastest wall time of *func* and its last output."""
+    best = float("inf")
+    output = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started)
+    return best, output
+
+
+class Command(BaseCommand):
+    help = "Compare ModelSerializer and FastSerializer on large querysets"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        rows = []
+        renderer = JSONRenderer()
+        with bench_database():
+            self.populate(options["rows"])
+            cases = (
+                ("users", CustomUserSerializer, CustomUser.objects.order_by("pk")),
+                # Prefetch so the standard path is not measured with N+1 queries.
+                (
+                    "tasks",
+                    TaskSerializer,
+                    Task.objects.order_by("pk").prefetch_related("tags"),
+                ),
+            )
+            for label, serializer_class, queryset in cases:
+                fast = FastSerializer.compile(serializer_class)
+                if fast is None:
+                    msg = f"{serializer_class.__name__} cannot use the fast path"
+                    raise CommandError(msg)
+                standard_time, standard = best_of(
+                    options["repeat"],
+                    lambda s=serializer_class, q=queryset: renderer.render(
+                        s(q.all(), many=True).data
+                    ),
+                )
+                fast_time, fast_output = best_of(
+                    options["repeat"],
+                    lambda f=fast, q=queryset: renderer.render(
+                        f.serialize(f.project(q))
+                    ),
+                )
+                if fast_output != standard:
+                    msg = f"{label}: fast path JSON differs from the serializer"
+                    raise CommandError(msg)
+                rows.append(
+                    (
+                        label,
+                        options["rows"],
+                        f"{standard_time * 1000:.0f}",
+                        f"{fast_time * 1000:.0f}",
+                        f"{standard_time / fast_time:.1f}x",
+                    )
+                )
+
+        self.stdout.write(
+            format_table(("objects", "rows", "standard ms", "fast ms", "speedup"), rows)
+        )
+
+    def populate(self, count: int) -> None:
+        password = make_password("bench-password-123")
+        users = CustomUser.objects.bulk_create(
+            CustomUser(
+                username=f"user{n}", email=f"user{n}@example.com", password=password
+            )
+            for n in range(count)
+        )
+        goal = Goal.objects.create(user=users[0], name="Bench")
+        tag = Tag.objects.create(user=users[0], name="bench")
+        tasks = Task.objects.bulk_create(
+            Task(user=users[n % len(users)], title=f"Task {n}", goal=goal)
+            for n in range(count)
+        )
+        Task.tags.through.objects.bulk_create(
+            Task.tags.through(task_id=task.pk, tag_id=tag.pk) for task in tasks
+        )
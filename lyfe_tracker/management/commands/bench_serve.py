@@ -0,0 +1,74 @@
+"""Load test showing throughput scaling with gunicorn worker count.
+
+Starts ``manage.py serve`` once per worker count, drives it with a fixed
+number of concurrent keep-alive clients and prints requests/second and
+latency percentiles for each run.
+
+Usage::
+
+    python manage.py bench_serve
+    python manage.py bench_serve --workers 1 2 4 8 --concurrency 32 --path /
+    python manage.py bench_serve --asgi --threads 1
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.benchmarks import format_table, run_http_load, serve_process
+
+
+class Command(BaseCommand):
+    help = "Measure request throughput of `manage.py serve` per worker count"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+        parser.add_argument("--threads", type=int, default=1)
+        parser.add_argument("--asgi", action="store_true")
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--duration", type=float, default=10.0)
+        parser.add_argument("--path", default="/")
+
+    def handle(self, *args: object, **options: Any) -> None:
+        serve_args = ["--threads", str(options["threads"])]
+        if options["asgi"]:
+            serve_args.append("--asgi")
+        # The benchmark talks plain HTTP to localhost.
+        env = {"SECURE_SSL_REDIRECT": "0"}
+
+        rows = []
+        baseline = None
+        for workers in options["workers"]:
+            self.stdout.write(f"Running with {workers} worker(s)...")
+            with serve_process(
+                [*serve_args, "--workers", str(workers)],
+                env=env,
+                ready_path=options["path"],
+            ) as base_url:
+                result = run_http_load(
+                    base_url + options["path"],
+                    concurrency=options["concurrency"],
+                    duration=options["duration"],
+                )
+            baseline = baseline or result.throughput
+            rows.append(
+                (
+                    workers,
+                    result.requests,
+                    result.errors,
+                    f"{result.throughput:.1f}",
+                    f"{result.throughput / baseline:.2f}x" if baseline else "-",
+                    f"{result.percentile(50):.1f}",
+                    f"{result.percentile(99):.1f}",
+                )
+            )
+
+        self.stdout.write("")
+        self.stdout.write(
+            format_table(
+                ("workers", "requests", "errors", "req/s", "scale", "p50 ms", "p99 ms"),
+                rows,
+            )
+        )
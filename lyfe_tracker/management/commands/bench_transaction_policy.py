@@ -0,0 +1,79 @@
+"""Round-trips per request with ATOMIC_REQUESTS vs the per-view policy.
+
+Replays authenticated read requests against a throwaway database twice:
+once with ``ATOMIC_REQUESTS`` switched back on for the connection, once
+with the per-view ``TransactionPolicyMixin`` alone, and reports queries,
+transaction statements and wall time per request.
+
+Usage::
+
+    python manage.py bench_transaction_policy
+    python manage.py bench_transaction_policy --requests 300
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.benchmarks import bench_database, count_round_trips, format_table
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare database round-trips of read requests per transaction policy"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        count = options["requests"]
+        paths = ("/api/auth/users/me/", "/api/auth/users/")
+        rows = []
+
+        with bench_database():
+            user = User.objects.create_user(
+                username="bench-tx", email="bench-tx@example.com", password="x"
+            )
+            client = APIClient(HTTP_HOST="localhost")
+            client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}"
+            )
+
+            for path in paths:
+                for label, atomic in (("ATOMIC_REQUESTS", True), ("per-view", False)):
+                    connection.settings_dict["ATOMIC_REQUESTS"] = atomic
+                    response = client.get(path, secure=True)  # warm up
+                    if response.status_code != 200:
+                        msg = f"GET {path} returned {response.status_code}"
+                        raise CommandError(msg)
+                    with count_round_trips(connection) as trips:
+                        started = time.perf_counter()
+                        for _ in range(count):
+                            client.get(path, secure=True)
+                        elapsed = time.perf_counter() - started
+                    rows.append(
+                        (
+                            f"GET {path}",
+                            label,
+                            f"{trips.queries / count:.1f}",
+                            f"{(trips.total - trips.queries) / count:.1f}",
+                            f"{trips.total / count:.1f}",
+                            f"{elapsed / count * 1000:.2f}",
+                        )
+                    )
+            connection.settings_dict["ATOMIC_REQUESTS"] = False
+
+        self.stdout.write(
+            format_table(
+                ("request", "policy", "queries", "tx stmts", "round-trips", "ms/req"),
+                rows,
+            )
+        )
@@ -0,0 +1,118 @@
+"""Management command to run the application under gunicorn.
+
+Replaces the development ``runserver`` in production images.  Options are
+exported as environment variables consumed by ``core/gunicorn_conf.py`` and
+the process is then replaced by the gunicorn master, so signals sent to the
+container (``TERM``, ``HUP``, ``USR2``) reach gunicorn directly.
+
+Static files are collected first: outside DEBUG the hashed-name storage
+needs the manifest ``collectstatic`` writes, and ``STATIC_ROOT`` is usually
+a volume, so files collected while building the image would be hidden.
+
+Usage::
+
+    python manage.py serve
+    python manage.py serve --asgi --workers 4
+    python manage.py serve --workers 2 --threads 8 --max-requests 2000
+    python manage.py serve --skip-collectstatic
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+
+# Command-line option -> environment variable read by core.gunicorn_conf.
+OPTION_ENV = {
+    "bind": "GUNICORN_BIND",
+    "workers": "WEB_CONCURRENCY",
+    "threads": "GUNICORN_THREADS",
+    "max_requests": "GUNICORN_MAX_REQUESTS",
+    "max_requests_jitter": "GUNICORN_MAX_REQUESTS_JITTER",
+    "timeout": "GUNICORN_TIMEOUT",
+    "graceful_timeout": "GUNICORN_GRACEFUL_TIMEOUT",
+}
+
+
+def build_server_env(options: dict[str, Any]) -> dict[str, str]:
+    """Return the environment overrides for the given command options."""
+    env = {
+        env_name: str(options[option])
+        for option, env_name in OPTION_ENV.items()
+        if options.get(option) is not None
+    }
+    if options.get("asgi"):
+        env["SERVER_INTERFACE"] = "asgi"
+    if options.get("reload"):
+        # Reloading re-imports code in the workers, which preloading defeats.
+        env["GUNICORN_RELOAD"] = "1"
+        env["GUNICORN_PRELOAD"] = "0"
+    elif options.get("no_preload"):
+        env["GUNICORN_PRELOAD"] = "0"
+    return env
+
+
+class Command(BaseCommand):
+    help = "Serve core.wsgi / core.asgi with a multi-worker gunicorn server"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--asgi",
+            action="store_true",
+            help="Serve core.asgi with uvicorn workers instead of core.wsgi.",
+        )
+        parser.add_argument("--bind", help="Socket to bind, e.g. 0.0.0.0:8000.")
+        parser.add_argument("--workers", type=int, help="Worker processes.")
+        parser.add_argument(
+            "--threads", type=int, help="Threads per WSGI worker (gthread)."
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            help="Recycle a worker after this many requests (0 disables).",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            help="Random jitter added to --max-requests.",
+        )
+        parser.add_argument("--timeout", type=int, help="Worker timeout (s).")
+        parser.add_argument(
+            "--graceful-timeout",
+            type=int,
+            help="Time given to workers to finish requests on restart (s).",
+        )
+        parser.add_argument(
+            "--no-preload",
+            action="store_true",
+            help="Import the application in each worker instead of the master.",
+        )
+        parser.add_argument(
+            "--reload",
+            action="store_true",
+            help="Restart workers on code changes (development only).",
+        )
+        parser.add_argument(
+            "--skip-collectstatic",
+            action="store_true",
+            help="Do not run collectstatic before starting (already collected).",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        if not options["skip_collectstatic"]:
+            call_command("collectstatic", interactive=False, verbosity=0)
+        env = {**os.environ, **build_server_env(options)}
+        argv = [sys.executable, "-m", "gunicorn", "-c", "python:core.gunicorn_conf"]
+
+        self.stdout.write(
+            "Starting gunicorn "
+            f"({env.get('SERVER_INTERFACE', 'wsgi')}, "
+            f"workers={env.get('WEB_CONCURRENCY', 'auto')}, "
+            f"threads={env.get('GUNICORN_THREADS', '1')})..."
+        )
+        sys.stdout.flush()
+        os.execvpe(argv[0], argv, env)
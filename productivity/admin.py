@@ -1,3 +1,60 @@
 from django.contrib import admin
 
-# Register your models here.
+from core.admin import PrefixSearchMixin, SoftDeleteAdmin
+from productivity.models import Goal, Habit, HabitEntry, JournalEntry, Tag, Task
+
+
+@admin.register(Tag)
+class TagAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("name", "user", "color", "usage_count", "is_deleted")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
+    search_fields = ("name",)
+    ordering = ("name",)
+
+
+@admin.register(Goal)
+class GoalAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("name", "user", "status", "target_date", "is_deleted")
+    list_filter = ("status", "is_deleted")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
+    search_fields = ("name",)
+
+
+@admin.register(Task)
+class TaskAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("title", "user", "status", "due_date", "goal", "is_deleted")
+    list_filter = ("status", "is_deleted")
+    list_select_related = ("user", "goal")
+    autocomplete_fields = ("user", "goal", "tags")
+    search_fields = ("title",)
+    ordering = ("-created_at",)
+
+
+@admin.register(Habit)
+class HabitAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("name", "user", "frequency", "streak", "last_completed")
+    list_filter = ("frequency", "is_deleted")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user", "goal")
+    search_fields = ("name",)
+    ordering = ("-created_at",)
+
+
+@admin.register(HabitEntry)
+class HabitEntryAdmin(SoftDeleteAdmin):
+    list_display = ("habit", "date", "completed", "is_deleted")
+    list_filter = ("completed", "is_deleted")
+    list_select_related = ("habit",)
+    autocomplete_fields = ("habit",)
+    ordering = ("-date",)
+
+
+@admin.register(JournalEntry)
+class JournalEntryAdmin(PrefixSearchMixin, SoftDeleteAdmin):
+    list_display = ("entry_date", "title", "user", "mood_rating", "is_deleted")
+    list_filter = ("mood_rating", "is_deleted")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user", "tags")
+    search_fields = ("title",)
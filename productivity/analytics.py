@@ -0,0 +1,96 @@
+"""Pre-aggregated mood statistics (``MoodRollup`` / ``MoodTagRollup``).
+
+Rollups are recomputed per bucket, a (user, period, period start) triple,
+from the journal entries in it with one ``GROUP BY`` per period, never by
+adjusting counters (``min``/``max`` cannot be decremented).  Journal
+writes refresh just the buckets around the dates they touch
+(:func:`refresh_mood_rollups`); :func:`rebuild_mood_rollups` recomputes
+whole users, e.g. after bulk ``update()`` calls that bypass ``save()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Count, F, Func, Max, Min, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth, TruncWeek
+
+from productivity.models import JournalEntry, MoodRollup, MoodTagRollup
+
+PERIODS: dict[str, type[Func]] = {"week": TruncWeek, "month": TruncMonth}
+
+
+def period_bounds(period: str, day: date) -> tuple[date, date]:
+    """Return the ``[start, end)`` dates of the *period* containing *day*."""
+    if period == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    start = day.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1)
+
+
+def _mood_stats(entries: QuerySet, period: str) -> list[MoodRollup]:
+    rows = (
+        entries.annotate(period_start=PERIODS[period]("entry_date"))
+        .values("user_id", "period_start")
+        .annotate(
+            entry_count=Count("pk"),
+            mood_count=Count("mood_rating"),
+            mood_sum=Coalesce(Sum("mood_rating"), Value(0)),
+            mood_min=Min("mood_rating"),
+            mood_max=Max("mood_rating"),
+        )
+        .order_by()
+    )
+    return [MoodRollup(period=period, **row) for row in rows]
+
+
+def _tag_stats(entries: QuerySet, period: str) -> list[MoodTagRollup]:
+    rows = (
+        entries.filter(tags__isnull=False, tags__is_deleted=False)
+        .annotate(period_start=PERIODS[period]("entry_date"), tag_id=F("tags"))
+        .values("user_id", "period_start", "tag_id")
+        .annotate(
+            entry_count=Count("pk"),
+            mood_count=Count("mood_rating"),
+            mood_sum=Coalesce(Sum("mood_rating"), Value(0)),
+        )
+        .order_by()
+    )
+    return [MoodTagRollup(period=period, **row) for row in rows]
+
+
+def _recompute(entries: QuerySet, rollups: Q, period: str) -> None:
+    MoodRollup.objects.filter(rollups, period=period).delete()
+    MoodTagRollup.objects.filter(rollups, period=period).delete()
+    MoodRollup.objects.bulk_create(_mood_stats(entries, period))
+    MoodTagRollup.objects.bulk_create(_tag_stats(entries, period))
+
+
+@transaction.atomic
+def refresh_mood_rollups(user_id: Any, days: Iterable[date]) -> None:
+    """Recompute *user_id*'s week and month buckets containing *days*."""
+    days = set(days)
+    for period in PERIODS:
+        bounds = {period_bounds(period, day) for day in days}
+        in_buckets = Q()
+        for start, end in bounds:
+            in_buckets |= Q(entry_date__gte=start, entry_date__lt=end)
+        entries = JournalEntry.objects.filter(in_buckets, user_id=user_id)
+        _recompute(
+            entries,
+            Q(user_id=user_id, period_start__in=[start for start, _ in bounds]),
+            period,
+        )
+
+
+def rebuild_mood_rollups(user_ids: Iterable[Any]) -> None:
+    """Recompute every bucket of *user_ids* in one transaction."""
+    user_ids = list(user_ids)
+    entries = JournalEntry.objects.filter(user_id__in=user_ids)
+    with transaction.atomic():
+        for period in PERIODS:
+            _recompute(entries, Q(user_id__in=user_ids), period)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProductivityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "productivity"
+
+    def ready(self) -> None:
+        from productivity import signals  # noqa: F401
@@ -0,0 +1,25 @@
+"""Domain events of the productivity app (see ``core.events``)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from core.events import Event
+
+
+@dataclass(frozen=True)
+class TaskCompleted(Event):
+    task_id: Any
+
+
+@dataclass(frozen=True)
+class HabitCompleted(Event):
+    habit_id: Any
+    date: date
+
+
+@dataclass(frozen=True)
+class GoalCompleted(Event):
+    goal_id: Any
@@ -0,0 +1,41 @@
+from django.db.models import QuerySet
+from django_filters import rest_framework as filters
+
+from productivity.models import JournalEntry, Task
+from productivity.tags import with_all_tags
+
+
+class UUIDInFilter(filters.BaseInFilter, filters.UUIDFilter):
+    """Comma-separated list of UUIDs."""
+
+
+class TaggedFilterSet(filters.FilterSet):
+    """
+    ``tags=<id>,<id>`` keeps the items carrying every listed tag, one
+    indexed semi-join per tag (see ``productivity.tags``).
+    """
+
+    tags = UUIDInFilter(method="filter_tags")
+
+    def filter_tags(self, queryset: QuerySet, name: str, value: list) -> QuerySet:
+        return with_all_tags(queryset, value)
+
+
+class TaskFilter(TaggedFilterSet):
+    """
+    Adds ``status`` and a ``due_after``/``due_before`` range, which the
+    ``(user, status, due_date)`` index answers with one range scan.
+    """
+
+    due_after = filters.IsoDateTimeFilter(field_name="due_date", lookup_expr="gte")
+    due_before = filters.IsoDateTimeFilter(field_name="due_date", lookup_expr="lt")
+
+    class Meta:
+        model = Task
+        fields = ("tags", "status")
+
+
+class JournalEntryFilter(TaggedFilterSet):
+    class Meta:
+        model = JournalEntry
+        fields = ("tags",)
@@ -0,0 +1,155 @@
+"""Benchmark journal full-text search for a long-time user.
+
+Fills a throwaway database with ``--years`` of daily journal entries for one
+user (10 years by default) plus the same for ``--other-users`` users, then
+times the search endpoint for a frequent word, a rare word and a two-word
+query.  For contrast it also times the naive ``icontains`` scan over title
+and content that a search without an index would run.
+
+Usage::
+
+    python manage.py bench_journal_search
+    python manage.py bench_journal_search --years 20 --other-users 50 --repeat 50
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.db.models import Q
+from rest_framework.test import APIClient
+
+from core.benchmarks import bench_database, count_round_trips, format_table
+from productivity.models import JournalEntry
+from users.models import CustomUser
+
+COMMON_WORDS = ("today", "work", "walk", "tired", "family", "coffee", "read")
+RARE_WORD = "kilimanjaro"
+WORDS_PER_ENTRY = 120
+
+
+class Command(BaseCommand):
+    help = "Time journal full-text search over years of daily entries"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--years", type=int, default=10)
+        parser.add_argument("--other-users", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args: object, **options: Any) -> None:
+        with bench_database():
+            rng = random.Random(42)
+            vocabulary = [
+                "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 9)))
+                for _ in range(5000)
+            ]
+            days = options["years"] * 365
+            users = [
+                CustomUser.objects.create_user(
+                    username=f"writer{n}", email=f"writer{n}@example.com"
+                )
+                for n in range(options["other_users"] + 1)
+            ]
+            self.stdout.write(
+                f"Creating {days:,} entries for each of {len(users)} users..."
+            )
+            for user in users:
+                self.populate(user, days, rng, vocabulary)
+            connection.cursor().execute("ANALYZE")
+
+            user = users[0]
+            client = APIClient(HTTP_HOST="localhost")
+            client.force_authenticate(user)
+            cases = (
+                (f"q={COMMON_WORDS[0]}", COMMON_WORDS[0]),
+                (f"q={RARE_WORD}", RARE_WORD),
+                (f"q={COMMON_WORDS[1]} {COMMON_WORDS[2]}", " ".join(COMMON_WORDS[1:3])),
+            )
+            rows = [
+                self.time_search(client, label, query, options["repeat"])
+                for label, query in cases
+            ]
+            rows.extend(
+                self.time_scan(user, label, query, options["repeat"])
+                for label, query in cases
+            )
+
+        self.stdout.write("")
+        self.stdout.write(
+            f"{connection.vendor}, {days:,} entries per user, {len(users)} users"
+        )
+        self.stdout.write(format_table(("search", "queries", "rows", "ms/req"), rows))
+
+    def populate(
+        self,
+        user: CustomUser,
+        days: int,
+        rng: random.Random,
+        vocabulary: list[str],
+    ) -> None:
+        first_day = date.today() - timedelta(days=days)
+        entries = []
+        for offset in range(days):
+            words = rng.choices(vocabulary, k=WORDS_PER_ENTRY)
+            words.extend(rng.sample(COMMON_WORDS, k=3))
+            if offset % 365 == 0:
+                words.append(RARE_WORD)
+            rng.shuffle(words)
+            entries.append(
+                JournalEntry(
+                    user=user,
+                    entry_date=first_day + timedelta(days=offset),
+                    title=" ".join(words[:4]),
+                    content=" ".join(words[4:]),
+                )
+            )
+        # Saved one by one: the save hook (SQLite) or the trigger
+        # (PostgreSQL) builds the search index as in production.
+        for entry in entries:
+            entry.save()
+
+    def time_search(
+        self, client: APIClient, label: str, query: str, repeat: int
+    ) -> tuple[object, ...]:
+        path = "/api/productivity/journal/search/"
+        response = client.get(path, {"q": query}, secure=True)
+        if response.status_code != 200:
+            msg = f"GET {path}?q={query} returned {response.status_code}"
+            raise CommandError(msg)
+        with count_round_trips(connection) as trips:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                client.get(path, {"q": query}, secure=True)
+            elapsed = time.perf_counter() - started
+        return (
+            f"API {label}",
+            f"{trips.queries / repeat:.0f}",
+            len(response.data["results"]),
+            f"{elapsed / repeat * 1000:.2f}",
+        )
+
+    def time_scan(
+        self, user: CustomUser, label: str, query: str, repeat: int
+    ) -> tuple[object, ...]:
+        """Time the unindexed ``icontains`` scan returning the same page size."""
+        condition = Q()
+        for word in query.split():
+            condition &= Q(title__icontains=word) | Q(content__icontains=word)
+        queryset = JournalEntry.objects.filter(condition, user=user).order_by(
+            "-entry_date"
+        )
+        started = time.perf_counter()
+        for _ in range(repeat):
+            found = len(queryset.all()[:20])
+        elapsed = time.perf_counter() - started
+        return (
+            f"icontains {label} (unranked)",
+            1,
+            found,
+            f"{elapsed / repeat * 1000:.2f}",
+        )
@@ -0,0 +1,55 @@
+"""Create the upcoming occurrences of recurring tasks.
+
+Saving a recurring task materializes its first window; run this
+periodically (daily is enough) to slide every series' window forward.
+Series are processed in chunks, each locked and extended with one
+``bulk_create`` in its own transaction.
+
+Usage::
+
+    python manage.py materialize_recurring_tasks
+    python manage.py materialize_recurring_tasks --days 30 --chunk-size 200
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from productivity.recurrence import extend_all_series
+
+
+class Command(BaseCommand):
+    help = "Materialize the upcoming occurrences of recurring tasks"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.RECURRENCE_WINDOW_DAYS,
+            help="Window to materialize, in days from now.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Series extended per transaction.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        horizon = timezone.now() + timedelta(days=options["days"])
+        series = created = 0
+        for chunk_series, chunk_created in extend_all_series(
+            horizon, options["chunk_size"]
+        ):
+            series += chunk_series
+            created += chunk_created
+            self.stdout.write(f"Extended {series:,} series...")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Done: {created:,} task(s) in {series:,} series.")
+        )
@@ -0,0 +1,53 @@
+"""Recount the progress of auto-progress goals.
+
+Task, habit and habit-entry saves keep auto goals current; run this after
+bulk changes that bypass ``save()`` (``queryset.update()``, raw SQL, data
+imports).  Goals are recounted in chunks, one annotated query per chunk.
+
+Usage::
+
+    python manage.py rebuild_goal_progress
+    python manage.py rebuild_goal_progress --chunk-size 200
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from productivity.models import Goal
+from productivity.progress import refresh_goal_progress
+
+
+class Command(BaseCommand):
+    help = "Recount the progress of goals in auto progress mode"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Goals recounted per transaction.",
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        goals = Goal.objects.filter(progress_mode=Goal.PROGRESS_AUTO).order_by("pk")
+        ids = goals.values_list("pk", flat=True)
+
+        done = 0
+        last = None
+        while True:
+            chunk = list(
+                (ids.filter(pk__gt=last) if last else ids)[: options["chunk_size"]]
+            )
+            if not chunk:
+                break
+            with transaction.atomic():
+                refresh_goal_progress(goals.filter(pk__in=chunk))
+            done += len(chunk)
+            last = chunk[-1]
+            self.stdout.write(f"Recounted {done:,} goal(s)...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {done:,} goal(s)."))
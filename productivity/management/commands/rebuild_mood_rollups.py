@@ -0,0 +1,60 @@
+"""Recompute mood rollups from journal entries.
+
+Journal writes keep rollups current through ``JournalEntry.save()``; run
+this after bulk changes that bypass it (``queryset.update()``, raw SQL,
+data imports) or to backfill.  Users are processed in chunks, each with one
+``GROUP BY`` query per period and table, in its own transaction.
+
+Usage::
+
+    python manage.py rebuild_mood_rollups
+    python manage.py rebuild_mood_rollups --chunk-size 200
+    python manage.py rebuild_mood_rollups --user <uuid>
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandParser
+
+from productivity.analytics import rebuild_mood_rollups
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Recompute weekly and monthly mood rollups from journal entries"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Users recomputed per transaction.",
+        )
+        parser.add_argument(
+            "--user", action="append", help="Only this user id (repeatable)."
+        )
+
+    def handle(self, *args: object, **options: Any) -> None:
+        users = User.all_objects.order_by("pk").values_list("pk", flat=True)
+        if options["user"]:
+            users = users.filter(pk__in=options["user"])
+
+        done = 0
+        last = None
+        while True:
+            # Keyset chunks: stable even while users are being added.
+            chunk = list(
+                (users.filter(pk__gt=last) if last else users)[: options["chunk_size"]]
+            )
+            if not chunk:
+                break
+            rebuild_mood_rollups(chunk)
+            done += len(chunk)
+            last = chunk[-1]
+            self.stdout.write(f"Rebuilt mood rollups for {done:,} user(s)...")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {done:,} user(s)."))
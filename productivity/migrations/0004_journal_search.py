@@ -0,0 +1,89 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:26
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# PostgreSQL: a trigger keeps search_vector current on every insert and
+# update (bulk writes included) and a GIN index serves @@ queries.  The
+# text search configuration must match productivity.search.SEARCH_CONFIG.
+POSTGRES_FORWARD = [
+    '''
+    CREATE OR REPLACE FUNCTION productivity_journalentry_search_vector()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE TRIGGER journalentry_search_vector_update
+    BEFORE INSERT OR UPDATE ON productivity_journalentry
+    FOR EACH ROW EXECUTE FUNCTION productivity_journalentry_search_vector()
+    ''',
+    '''
+    UPDATE productivity_journalentry SET search_vector =
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B')
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS journal_search_vector_idx
+    ON productivity_journalentry USING gin (search_vector)
+    ''',
+]
+POSTGRES_REVERSE = [
+    'DROP INDEX IF EXISTS journal_search_vector_idx',
+    'DROP TRIGGER IF EXISTS journalentry_search_vector_update ON productivity_journalentry',
+    'DROP FUNCTION IF EXISTS productivity_journalentry_search_vector()',
+]
+
+# SQLite (local development and tests): a standalone FTS5 table keyed by
+# entry id, refreshed on save (productivity.search.index_journal_entry).
+# It is not tied to the table's rowid, which SQLite table rebuilds in later
+# migrations would change.
+SQLITE_FORWARD = [
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS productivity_journalentry_fts
+    USING fts5(entry_id UNINDEXED, title, content, tokenize='porter unicode61')
+    ''',
+    '''
+    INSERT INTO productivity_journalentry_fts (entry_id, title, content)
+    SELECT id, title, content FROM productivity_journalentry WHERE NOT is_deleted
+    ''',
+]
+SQLITE_REVERSE = ['DROP TABLE IF EXISTS productivity_journalentry_fts']
+
+
+def run_for_vendor(vendor, statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != vendor:
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0003_sync_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalentry',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            run_for_vendor('postgresql', POSTGRES_FORWARD),
+            run_for_vendor('postgresql', POSTGRES_REVERSE),
+        ),
+        migrations.RunPython(
+            run_for_vendor('sqlite', SQLITE_FORWARD),
+            run_for_vendor('sqlite', SQLITE_REVERSE),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0004_journal_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MoodRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('period_start', models.DateField()),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('mood_count', models.PositiveIntegerField(default=0)),
+                ('mood_sum', models.PositiveIntegerField(default=0)),
+                ('mood_min', models.PositiveSmallIntegerField(null=True)),
+                ('mood_max', models.PositiveSmallIntegerField(null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Mood Rollup',
+                'verbose_name_plural': 'Mood Rollups',
+                'constraints': [models.UniqueConstraint(fields=('user', 'period', 'period_start'), name='moodrollup_user_period_start_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MoodTagRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('period_start', models.DateField()),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('mood_count', models.PositiveIntegerField(default=0)),
+                ('mood_sum', models.PositiveIntegerField(default=0)),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='productivity.tag')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Mood Tag Rollup',
+                'verbose_name_plural': 'Mood Tag Rollups',
+                'constraints': [models.UniqueConstraint(fields=('user', 'period', 'period_start', 'tag'), name='moodtagrollup_user_period_tag_uniq')],
+            },
+        ),
+    ]
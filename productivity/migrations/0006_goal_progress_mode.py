@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0005_mood_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='progress_mode',
+            field=models.CharField(choices=[('manual', 'Manual'), ('auto', 'From linked tasks and habits')], default='manual', max_length=10),
+        ),
+    ]
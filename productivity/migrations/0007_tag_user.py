@@ -0,0 +1,133 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def tag_links(apps):
+    """(through model, item field) of each tagged model."""
+    for model_name, item in (('Task', 'task'), ('JournalEntry', 'journalentry')):
+        model = apps.get_model('productivity', model_name)
+        yield model._meta.get_field('tags').remote_field.through, item
+
+
+def move_links(links, item, source, target, user_id):
+    rows = links.objects.filter(tag_id=source, **{f'{item}__user_id': user_id})
+    # An item already carrying the target would break the (item, tag) unique.
+    rows.filter(
+        **{f'{item}_id__in': links.objects.filter(tag_id=target).values(f'{item}_id')}
+    ).delete()
+    rows.update(tag_id=target)
+
+
+def tag_user_ids(tag, links, MoodTagRollup):
+    """Ids of the users whose items or rollups carry *tag*."""
+    user_ids = set(
+        MoodTagRollup.objects.filter(tag_id=tag.pk).values_list('user_id', flat=True)
+    )
+    for through, item in links:
+        user_ids.update(
+            through.objects.filter(tag_id=tag.pk).values_list(
+                f'{item}__user_id', flat=True
+            )
+        )
+    return user_ids
+
+
+def own_tag(Tag, tag, user_id):
+    """The pk of *user_id*'s copy of *tag*: the tag itself if nobody owns it yet."""
+    if tag.user_id is None:
+        tag.user_id = user_id
+        tag.save(update_fields=['user'])
+        return tag.pk
+    return Tag.objects.create(
+        user_id=user_id,
+        name=tag.name,
+        color=tag.color,
+        is_active=tag.is_active,
+        is_deleted=tag.is_deleted,
+        deleted_at=tag.deleted_at,
+    ).pk
+
+
+def split_shared_tags(apps, schema_editor):
+    """
+    Give every user their own copy of the shared tags they use.
+
+    The oldest user of a tag keeps it; others get a copy, and their task,
+    journal and rollup links are moved to it.  Names differing only in case
+    are merged per user; their mood tag rollups are dropped, so run
+    ``manage.py rebuild_mood_rollups`` after migrating if any were merged.
+    Tags nobody uses are deleted.
+    """
+    Tag = apps.get_model('productivity', 'Tag')
+    MoodTagRollup = apps.get_model('productivity', 'MoodTagRollup')
+    links = list(tag_links(apps))
+
+    owned = {}
+    for tag in Tag.objects.order_by('created_at', 'pk'):
+        for user_id in sorted(tag_user_ids(tag, links, MoodTagRollup), key=str):
+            key = (user_id, tag.name.lower())
+            merged = key in owned
+            if not merged:
+                owned[key] = own_tag(Tag, tag, user_id)
+            target = owned[key]
+            if target == tag.pk:
+                continue
+            for through, item in links:
+                move_links(through, item, tag.pk, target, user_id)
+            rollups = MoodTagRollup.objects.filter(tag_id=tag.pk, user_id=user_id)
+            if merged:
+                rollups.delete()
+            else:
+                rollups.update(tag_id=target)
+        if tag.user_id is None:
+            tag.delete()
+
+    usage = None
+    for through, item in links:
+        count = Coalesce(
+            Subquery(
+                through.objects.filter(
+                    tag_id=OuterRef('pk'), **{f'{item}__is_deleted': False}
+                )
+                .order_by()
+                .values('tag_id')
+                .annotate(count=Count('pk'))
+                .values('count'),
+                output_field=models.IntegerField(),
+            ),
+            0,
+        )
+        usage = count if usage is None else usage + count
+    Tag.objects.update(usage_count=usage)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0006_goal_progress_mode'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tags', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='usage_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='tag',
+            name='name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.RunPython(split_shared_tags, migrations.RunPython.noop),
+    ]
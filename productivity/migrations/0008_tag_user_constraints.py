@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:58
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+# Tag filters read the many-to-many tables by tag (id IN (SELECT task_id ...
+# WHERE tag_id = %s)); the auto-created tables only have a unique index
+# leading on the item and a single-column one on tag_id.  These cover it.
+TAG_LINK_INDEXES = [
+    ('task_tags_tag_task_idx', 'productivity_task_tags', 'tag_id, task_id'),
+    ('journal_tags_tag_entry_idx', 'productivity_journalentry_tags', 'tag_id, journalentry_id'),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0007_tag_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tag',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tags', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RemoveIndex(
+            model_name='tag',
+            name='tag_updated_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['user', 'updated_at'], name='tag_user_updated_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='tag',
+            constraint=models.UniqueConstraint(models.F('user'), django.db.models.functions.text.Lower('name'), name='tag_user_lower_name_uniq'),
+        ),
+    ] + [
+        migrations.RunSQL(
+            f'CREATE INDEX {name} ON {table} ({columns})',
+            f'DROP INDEX IF EXISTS {name}',
+        )
+        for name, table, columns in TAG_LINK_INDEXES
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# The admin searches these columns by prefix, as LOWER(column) LIKE 'term%'
+# (core.admin.PrefixSearchMixin), over every row, soft-deleted ones
+# included.  Only a text_pattern_ops btree index on the expression serves
+# that outside the C collation; opclasses on expressions are PostgreSQL
+# syntax, so the indexes are created only there.
+INDEXES = {
+    'tag_name_prefix_idx': ('productivity_tag', 'name'),
+    'goal_name_prefix_idx': ('productivity_goal', 'name'),
+    'task_title_prefix_idx': ('productivity_task', 'title'),
+    'habit_name_prefix_idx': ('productivity_habit', 'name'),
+    'journal_title_prefix_idx': ('productivity_journalentry', 'title'),
+}
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, (table, column) in INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'(LOWER({column}) text_pattern_ops)'
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productivity', '0010_task_is_overdue'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -1,35 +1,90 @@
+from __future__ import annotations
+
 from datetime import date
 from decimal import Decimal
+from typing import Any
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Coalesce, Lower
 from django.utils import timezone
 
-from core.models.base import BaseModel
+from core.models.base import BaseModel, SoftDeleteManager
 
 User = settings.AUTH_USER_MODEL
 
 
 class Tag(BaseModel):
     """
-    Tags used to categorize Tasks, Goals, or Journal Entries.
+    A user's label for categorizing Tasks and Journal Entries.
+
+    Names are unique per user, ignoring case.  ``usage_count`` is the number
+    of the user's non-deleted tasks and entries carrying the tag, kept
+    current by ``productivity.tags``.
     """
 
     class Meta(BaseModel.Meta):
         verbose_name = "Tag"
         verbose_name_plural = "Tags"
-
-    name = models.CharField(max_length=50, unique=True)
+        constraints = [
+            models.UniqueConstraint(
+                "user", Lower("name"), name="tag_user_lower_name_uniq"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="tag_user_updated_idx")
+        ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tags")
+    name = models.CharField(max_length=50)
     color = models.CharField(max_length=20, default="#3b82f6")
+    usage_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self) -> str:
         return self.name
 
 
+class GoalQuerySet(models.QuerySet["Goal"]):
+    def with_progress(self) -> GoalQuerySet:
+        """
+        Annotate ``progress``: the goal's done tasks plus completed entries of
+        its habits (soft-deleted rows excluded), as two correlated counts in
+        the same query however many goals are listed.
+        """
+        done_tasks = (
+            Task.objects.filter(goal=models.OuterRef("pk"), status="done")
+            .order_by()
+            .values("goal")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        completed_entries = (
+            HabitEntry.objects.filter(
+                habit__goal=models.OuterRef("pk"),
+                habit__is_deleted=False,
+                completed=True,
+            )
+            .order_by()
+            .values("habit__goal")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return self.annotate(
+            progress=Coalesce(models.Subquery(done_tasks), 0)
+            + Coalesce(models.Subquery(completed_entries), 0)
+        )
+
+
 class Goal(BaseModel):
     """
     Long-term objective that can group related Tasks and Habits.
+
+    In ``auto`` progress mode ``current_value`` counts the done linked tasks
+    and completed linked habit entries, refreshed whenever one of them is
+    saved (``productivity.progress``); crossing ``target_value`` completes
+    the goal.
     """
 
     STATUS_CHOICES: list[tuple[str, str]] = [
@@ -53,12 +108,39 @@ class Goal(BaseModel):
     target_date = models.DateField(null=True, blank=True)
     completion_xp_reward = models.PositiveIntegerField(default=50)
 
-    def mark_completed(self) -> None:
+    PROGRESS_MANUAL = "manual"
+    PROGRESS_AUTO = "auto"
+    PROGRESS_MODE_CHOICES: list[tuple[str, str]] = [
+        (PROGRESS_MANUAL, "Manual"),
+        (PROGRESS_AUTO, "From linked tasks and habits"),
+    ]
+    progress_mode = models.CharField(
+        max_length=10, choices=PROGRESS_MODE_CHOICES, default=PROGRESS_MANUAL
+    )
+
+    objects = SoftDeleteManager.from_queryset(GoalQuerySet)()
+    all_objects = models.Manager.from_queryset(GoalQuerySet)()
+
+    # Saving any of these may change an auto goal's progress or completion.
+    PROGRESS_FIELDS = frozenset({"progress_mode", "current_value", "target_value"})
+
+    def mark_completed(self, user: Any = None) -> bool:
         """Sets the goal to completed and awards a large XP bonus."""
-        if self.status != "completed":
-            self.status = "completed"
-            self.save()
-            self.user.add_xp(self.completion_xp_reward)
+        from productivity.services import complete_goal
+
+        return complete_goal(self, user=user)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if self.progress_mode == self.PROGRESS_AUTO and (
+            update_fields is None or self.PROGRESS_FIELDS & set(update_fields)
+        ):
+            from productivity.progress import refresh_goal_progress
+
+            for goal in refresh_goal_progress(Goal.objects.filter(pk=self.pk)):
+                self.current_value = goal.current_value
+                self.status = goal.status
 
     def __str__(self) -> str:
         return f"Goal: {self.name} ({self.status})"
@@ -67,16 +149,51 @@ class Goal(BaseModel):
         verbose_name = "Goal"
         verbose_name_plural = "Goals"
         ordering: list[str] = ["target_date"]
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="goal_user_updated_idx")
+        ]
 
 
 class Task(BaseModel):
     """
     Short-term, actionable items for the user.
+
+    A task with a ``recurrence`` is the template, and first occurrence, of
+    a series; the following occurrences are tasks pointing at it through
+    ``series``, materialized a window ahead by ``productivity.recurrence``.
     """
 
     class Meta(BaseModel.Meta):
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="task_user_updated_idx"),
+            models.Index(
+                fields=["user", "status", "due_date"], name="task_user_status_due_idx"
+            ),
+            # Scanned by the mark_overdue_tasks job (productivity.scheduled).
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(
+                    is_overdue=False,
+                    is_deleted=False,
+                    status__in=["pending", "in_progress"],
+                ),
+                name="task_becoming_overdue_idx",
+            ),
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(is_overdue=True),
+                name="task_overdue_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["series", "due_date"],
+                condition=models.Q(is_deleted=False),
+                name="task_series_due_uniq",
+            )
+        ]
 
     STATUS_CHOICES = [
         ("pending", "Pending"),
@@ -85,11 +202,21 @@ class Task(BaseModel):
         ("archived", "Archived"),
     ]
 
+    RECURRENCE_CHOICES = [
+        ("", "Does not repeat"),
+        ("daily", "Daily"),
+        ("weekly", "Weekly"),
+        ("monthly", "Monthly"),
+    ]
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tasks")
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     due_date = models.DateTimeField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    # An open task past its due date; set on save and by the
+    # mark_overdue_tasks job as due dates pass.
+    is_overdue = models.BooleanField(default=False, editable=False)
     tags = models.ManyToManyField(Tag, blank=True)
 
     goal = models.ForeignKey(
@@ -100,12 +227,77 @@ class Task(BaseModel):
         related_name="related_tasks",
     )
 
-    def mark_done(self) -> None:
+    # ----- Recurrence (RRULE-like: FREQ, INTERVAL, BYDAY, UNTIL, COUNT) -----
+    recurrence = models.CharField(
+        max_length=10, choices=RECURRENCE_CHOICES, blank=True, default=""
+    )
+    recurrence_interval = models.PositiveSmallIntegerField(
+        default=1, validators=[MinValueValidator(1)]
+    )
+    # Weekdays (Monday = 0) of weekly rules; the due date's weekday if empty.
+    recurrence_weekdays = models.JSONField(default=list, blank=True)
+    recurrence_until = models.DateField(null=True, blank=True)
+    recurrence_count = models.PositiveIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1)]
+    )
+    series = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="occurrences",
+    )
+    # Occurrences due up to here exist as rows.
+    materialized_until = models.DateTimeField(null=True, blank=True, editable=False)
+
+    OPEN_STATUSES = ("pending", "in_progress")
+    PROGRESS_FIELDS = ("status", "goal_id", "is_deleted")
+    RECURRENCE_FIELDS = (
+        "due_date",
+        "recurrence",
+        "recurrence_interval",
+        "recurrence_weekdays",
+        "recurrence_until",
+        "recurrence_count",
+        "is_deleted",
+    )
+    tracked_fields = tuple(dict.fromkeys(PROGRESS_FIELDS + RECURRENCE_FIELDS))
+
+    def mark_done(self, user: Any = None) -> bool:
         """Marks task as done and awards XP."""
-        if self.status != "done":
-            self.status = "done"
-            self.save()
-            self.user.add_xp(10)
+        from productivity.services import complete_task
+
+        return complete_task(self, user=user)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        goal_ids = {self.goal_id, self.stored_value("goal_id")} - {None}
+        progress_changed = self.tracked_changed(*self.PROGRESS_FIELDS)
+        deleted_changed = not self._state.adding and (
+            self.is_deleted != self.stored_value("is_deleted")
+        )
+        rule_changed = bool(
+            self.recurrence or self.stored_value("recurrence")
+        ) and self.tracked_changed(*self.RECURRENCE_FIELDS)
+        if kwargs.get("update_fields") is None:
+            self.is_overdue = (
+                self.status in self.OPEN_STATUSES
+                and self.due_date is not None
+                and self.due_date < timezone.now()
+            )
+        super().save(*args, **kwargs)
+        if goal_ids and progress_changed:
+            from productivity.progress import refresh_goal_progress
+
+            refresh_goal_progress(Goal.objects.filter(pk__in=goal_ids))
+        if deleted_changed:
+            from productivity.tags import refresh_tag_usage
+
+            refresh_tag_usage(self.tags.all())
+        if rule_changed:
+            from productivity.recurrence import reschedule_series
+
+            reschedule_series(self)
 
     def __str__(self) -> str:
         return f"{self.title} ({self.status})"
@@ -119,6 +311,9 @@ class Habit(BaseModel):
     class Meta(BaseModel.Meta):
         verbose_name = "Habit"
         verbose_name_plural = "Habits"
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="habit_user_updated_idx")
+        ]
 
     FREQUENCY_CHOICES = [
         ("daily", "Daily"),
@@ -142,23 +337,22 @@ class Habit(BaseModel):
         related_name="related_habits",
     )
 
-    def complete(self, date: date | None = None) -> None:
+    tracked_fields = ("goal_id", "is_deleted")
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        goal_ids = {self.goal_id, self.stored_value("goal_id")} - {None}
+        changed = not self._state.adding and self.tracked_changed()
+        super().save(*args, **kwargs)
+        if goal_ids and changed:
+            from productivity.progress import refresh_goal_progress
+
+            refresh_goal_progress(Goal.objects.filter(pk__in=goal_ids))
+
+    def complete(self, date: date | None = None, user: Any = None) -> bool:
         """Mark habit as complete for a given day and update streak."""
-        if date is None:
-            date = timezone.localdate()
-
-        if self.last_completed:
-            delta = date - self.last_completed
-            if delta.days == 1:
-                self.streak += 1
-            elif delta.days > 1:
-                self.streak = 1
-        else:
-            self.streak = 1
-
-        self.last_completed = date
-        self.save()
-        self.user.add_xp(5)
+        from productivity.services import complete_habit
+
+        return complete_habit(self, date, user=user)
 
     def __str__(self) -> str:
         return f"{self.name} (Streak: {self.streak})"
@@ -194,6 +388,30 @@ class JournalEntry(BaseModel):
 
     tags = models.ManyToManyField(Tag, blank=True)
 
+    # Weighted title + content document, maintained by a database trigger on
+    # PostgreSQL (see migration 0004); unused on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # The stored date too, so a moved entry refreshes both buckets.
+    tracked_fields = ("entry_date", "is_deleted")
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        days = {self.entry_date, self.stored_value("entry_date")}
+        deleted_changed = not self._state.adding and (
+            self.is_deleted != self.stored_value("is_deleted")
+        )
+        super().save(*args, **kwargs)
+        from productivity import analytics, search, tags
+
+        if deleted_changed:
+            tags.refresh_tag_usage(self.tags.all())
+
+        search.index_journal_entry(self, using=kwargs.get("using") or self._state.db)
+        to_date = self._meta.get_field("entry_date").to_python
+        analytics.refresh_mood_rollups(
+            self.user_id, {to_date(day) for day in days if day is not None}
+        )
+
     def __str__(self) -> str:
         return f"Journal on {self.entry_date} by {self.user.username}"
 
@@ -202,6 +420,9 @@ class JournalEntry(BaseModel):
         verbose_name_plural = "Journal Entries"
         unique_together = ("user", "entry_date")
         ordering = ["-entry_date"]
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="journal_user_updated_idx")
+        ]
 
 
 class HabitEntry(BaseModel):
@@ -242,7 +463,98 @@ class HabitEntry(BaseModel):
         ordering = ["date"]
         verbose_name = "Habit Log Entry"
         verbose_name_plural = "Habit Log Entries"
+        indexes = [
+            models.Index(
+                fields=["habit", "updated_at"], name="habitentry_habit_updated_idx"
+            )
+        ]
+
+    tracked_fields = ("habit_id", "completed", "is_deleted")
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        habit_ids = {self.habit_id, self.stored_value("habit_id")} - {None}
+        changed = self.tracked_changed()
+        super().save(*args, **kwargs)
+        if changed:
+            from productivity.progress import refresh_goal_progress
+
+            refresh_goal_progress(
+                Goal.objects.filter(
+                    pk__in=Habit.all_objects.filter(pk__in=habit_ids).values("goal")
+                )
+            )
 
     def __str__(self) -> str:
         status = "Completed" if self.completed else "Missed"
         return f"[{self.date}] {self.habit.name}: {status}"
+
+
+class MoodRollup(models.Model):
+    """
+    Mood statistics of one user's journal entries over a week or a month.
+
+    Derived data: kept current by ``productivity.analytics`` on journal
+    writes and recomputable with ``manage.py rebuild_mood_rollups``.
+    """
+
+    PERIOD_CHOICES = [
+        ("week", "Week"),
+        ("month", "Month"),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES)
+    period_start = models.DateField()
+    entry_count = models.PositiveIntegerField(default=0)
+    mood_count = models.PositiveIntegerField(default=0)
+    mood_sum = models.PositiveIntegerField(default=0)
+    mood_min = models.PositiveSmallIntegerField(null=True)
+    mood_max = models.PositiveSmallIntegerField(null=True)
+
+    class Meta:
+        verbose_name = "Mood Rollup"
+        verbose_name_plural = "Mood Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period", "period_start"],
+                name="moodrollup_user_period_start_uniq",
+            )
+        ]
+
+    @property
+    def mood_average(self) -> float | None:
+        return self.mood_sum / self.mood_count if self.mood_count else None
+
+    def __str__(self) -> str:
+        return f"{self.period} of {self.period_start}: {self.mood_average}"
+
+
+class MoodTagRollup(models.Model):
+    """
+    Mood of the entries carrying one tag, per user and week or month.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    period = models.CharField(max_length=5, choices=MoodRollup.PERIOD_CHOICES)
+    period_start = models.DateField()
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="+")
+    entry_count = models.PositiveIntegerField(default=0)
+    mood_count = models.PositiveIntegerField(default=0)
+    mood_sum = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Mood Tag Rollup"
+        verbose_name_plural = "Mood Tag Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period", "period_start", "tag"],
+                name="moodtagrollup_user_period_tag_uniq",
+            )
+        ]
+
+    @property
+    def mood_average(self) -> float | None:
+        return self.mood_sum / self.mood_count if self.mood_count else None
+
+    def __str__(self) -> str:
+        return f"{self.tag_id} in {self.period} of {self.period_start}"
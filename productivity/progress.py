@@ -0,0 +1,45 @@
+"""Automatic goal progress (``Goal.progress_mode == "auto"``).
+
+An auto goal's ``current_value`` is the number of its done tasks plus the
+completed entries of its habits.  Saving a task, habit or habit entry that
+can move that number calls :func:`refresh_goal_progress` for the goals
+involved, which recounts them with ``Goal.objects.with_progress()`` (one
+query however many goals) rather than adjusting a counter, so deletes,
+reassignments and un-completions stay exact.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from productivity.models import Goal
+
+
+def refresh_goal_progress(goals: QuerySet[Goal]) -> list[Goal]:
+    """
+    Recount the auto-progress goals among *goals*.
+
+    Changed values are written with ``update()`` (``updated_at`` included,
+    for the sync feed) and goals that reach their ``target_value`` are
+    completed through ``Goal.mark_completed``.  Returns the auto goals with
+    their refreshed values.
+    """
+    refreshed = list(
+        goals.filter(progress_mode=Goal.PROGRESS_AUTO)
+        .with_progress()
+        .select_related("user")
+    )
+    for goal in refreshed:
+        value = Decimal(goal.progress)
+        if goal.current_value != value:
+            goal.current_value = value
+            goal.updated_at = timezone.now()
+            Goal.all_objects.filter(pk=goal.pk).update(
+                current_value=value, updated_at=goal.updated_at
+            )
+        if goal.target_value is not None and value >= goal.target_value:
+            goal.mark_completed()
+    return refreshed
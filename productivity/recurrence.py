@@ -0,0 +1,233 @@
+"""Recurring tasks.
+
+A task with a ``recurrence`` rule is the template, and first occurrence, of
+a series.  Only the occurrences due within ``RECURRENCE_WINDOW_DAYS`` exist
+as rows: :func:`materialize_occurrences` extends the window of any number
+of series with one ``bulk_create``, so an open-ended rule never means
+unbounded rows.  It runs when a rule is saved (:func:`reschedule_series`)
+and periodically (:func:`extend_all_series`) through the
+``materialize_recurring_tasks`` job and management command.
+
+Rules follow RFC 5545 where they overlap: the template's due date is the
+first instance and counts towards ``recurrence_count``, ``recurrence_until``
+is an inclusive date, and monthly rules skip months without the day.  The
+wall-clock time is kept in the user's time zone across DST changes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from productivity.models import Tag, Task
+from productivity.tags import refresh_tag_usage
+
+BATCH_SIZE = 1000
+
+
+def _add_months(day: date, months: int) -> date | None:
+    index = day.month - 1 + months
+    try:
+        return day.replace(year=day.year + index // 12, month=index % 12 + 1)
+    except ValueError:  # the 31st of a 30-day month, and so on
+        return None
+
+
+def _rule_days(task: Task, first: date) -> Iterator[date]:
+    interval = task.recurrence_interval or 1
+    yield first
+    if task.recurrence == "daily":
+        step = 1
+        while True:
+            yield first + timedelta(days=step * interval)
+            step += 1
+    elif task.recurrence == "weekly":
+        weekdays = sorted(set(task.recurrence_weekdays)) or [first.weekday()]
+        week = first - timedelta(days=first.weekday())
+        while True:
+            for weekday in weekdays:
+                day = week + timedelta(days=weekday)
+                if day > first:
+                    yield day
+            week += timedelta(weeks=interval)
+    elif task.recurrence == "monthly":
+        step = 1
+        while True:
+            day = _add_months(first, step * interval)
+            if day is not None:
+                yield day
+            step += 1
+
+
+def occurrence_dates(task: Task) -> Iterator[datetime]:
+    """Yield the due dates of *task*'s series in order, its own first."""
+    try:
+        zone = ZoneInfo(task.user.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        zone = ZoneInfo("UTC")
+    start = task.due_date.astimezone(zone)
+    for index, day in enumerate(_rule_days(task, start.date())):
+        if task.recurrence_count is not None and index >= task.recurrence_count:
+            return
+        if task.recurrence_until is not None and day > task.recurrence_until:
+            return
+        yield datetime.combine(day, start.time(), tzinfo=zone)
+
+
+def materialize_occurrences(
+    templates: Iterable[Task], horizon: datetime | None = None
+) -> int:
+    """
+    Create the occurrences of *templates* due up to *horizon*.
+
+    Templates should be locked (``select_for_update``) by the caller when
+    several processes may materialize at once.  Each template's window
+    starts at its ``materialized_until`` (or now); occurrences already
+    present are skipped, so the call is idempotent.  Returns the number of
+    tasks created.
+    """
+    if horizon is None:
+        horizon = timezone.now() + timedelta(days=settings.RECURRENCE_WINDOW_DAYS)
+    now = timezone.now()
+    templates = [
+        task
+        for task in templates
+        if task.recurrence
+        and task.due_date is not None
+        and not task.is_deleted
+        and (task.materialized_until is None or task.materialized_until < horizon)
+    ]
+    if not templates:
+        return 0
+    existing = set(
+        Task.objects.filter(
+            series__in=templates, due_date__gt=now, due_date__lte=horizon
+        ).values_list("series_id", "due_date")
+    )
+
+    occurrences: list[Task] = []
+    links = []
+    for template in templates:
+        after = max(template.materialized_until or template.due_date, now)
+        tag_ids = [tag.pk for tag in template.tags.all()]
+        for due in occurrence_dates(template):
+            if due > horizon:
+                break
+            if due <= after or (template.pk, due) in existing:
+                continue
+            occurrence = Task(
+                user_id=template.user_id,
+                title=template.title,
+                description=template.description,
+                goal_id=template.goal_id,
+                due_date=due,
+                series=template,
+            )
+            occurrences.append(occurrence)
+            links.extend(
+                Task.tags.through(task_id=occurrence.pk, tag_id=tag_id)
+                for tag_id in tag_ids
+            )
+        template.materialized_until = horizon
+
+    with transaction.atomic():
+        Task.objects.bulk_create(occurrences, batch_size=BATCH_SIZE)
+        Task.tags.through.objects.bulk_create(links, batch_size=BATCH_SIZE)
+        Task.all_objects.bulk_update(
+            templates, ["materialized_until"], batch_size=BATCH_SIZE
+        )
+        if links:
+            refresh_tag_usage(
+                Tag.objects.filter(pk__in={link.tag_id for link in links})
+            )
+    return len(occurrences)
+
+
+def extend_all_series(
+    horizon: datetime | None = None, chunk_size: int = BATCH_SIZE
+) -> Iterator[tuple[int, int]]:
+    """
+    Materialize every series up to *horizon*, *chunk_size* series at a time.
+
+    Each chunk is locked and extended in its own transaction; yields the
+    number of series and of tasks created per chunk.
+    """
+    if horizon is None:
+        horizon = timezone.now() + timedelta(days=settings.RECURRENCE_WINDOW_DAYS)
+    templates = (
+        Task.objects.exclude(recurrence="")
+        .filter(due_date__isnull=False)
+        .filter(Q(materialized_until__isnull=True) | Q(materialized_until__lt=horizon))
+        .order_by("pk")
+    )
+    ids = templates.values_list("pk", flat=True)
+    last = None
+    while True:
+        chunk = list((ids.filter(pk__gt=last) if last else ids)[:chunk_size])
+        if not chunk:
+            return
+        with transaction.atomic():
+            locked = (
+                templates.filter(pk__in=chunk)
+                .select_related("user")
+                .prefetch_related("tags")
+                .select_for_update(of=("self",))
+            )
+            created = materialize_occurrences(locked, horizon)
+        yield len(chunk), created
+        last = chunk[-1]
+
+
+def reschedule_series(template: Task) -> int:
+    """
+    Rebuild the upcoming occurrences of *template* after its rule changed.
+
+    Pending future occurrences are soft deleted and regenerated from the
+    new rule (none if the rule was removed or the template deleted);
+    started, finished and past occurrences are kept.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        Task.objects.filter(series=template, status="pending", due_date__gt=now).update(
+            is_deleted=True, deleted_at=now, updated_at=now
+        )
+        # Occurrences carry the template's tags (sync_occurrence_tags).
+        refresh_tag_usage(template.tags.all())
+        template.materialized_until = None
+        Task.all_objects.filter(pk=template.pk).update(materialized_until=None)
+        return materialize_occurrences([template])
+
+
+def sync_occurrence_tags(template: Task) -> None:
+    """Give the pending upcoming occurrences of *template* its current tags."""
+    links = Task.tags.through.objects
+    upcoming = list(
+        Task.objects.filter(
+            series=template, status="pending", due_date__gt=timezone.now()
+        ).values_list("pk", flat=True)
+    )
+    if not upcoming:
+        return
+    tag_ids = list(template.tags.values_list("pk", flat=True))
+    with transaction.atomic():
+        removed = set(
+            links.filter(task_id__in=upcoming).values_list("tag_id", flat=True)
+        )
+        links.filter(task_id__in=upcoming).delete()
+        # Tags are part of the occurrences: move them up the sync feed.
+        Task.all_objects.filter(pk__in=upcoming).update(updated_at=timezone.now())
+        links.bulk_create(
+            (
+                Task.tags.through(task_id=task_id, tag_id=tag_id)
+                for task_id in upcoming
+                for tag_id in tag_ids
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        refresh_tag_usage(Tag.all_objects.filter(pk__in=removed | set(tag_ids)))
@@ -0,0 +1,96 @@
+"""Periodic productivity jobs, run by ``manage.py run_scheduler``.
+
+Each job works in keyset chunks of ``batch_size`` rows, one ``UPDATE`` per
+chunk, and bumps ``updated_at`` on the rows it changes so offline clients
+pick the change up through the sync feed.
+"""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.batches import pk_chunks
+from jobs.registry import scheduled
+from productivity.analytics import rebuild_mood_rollups
+from productivity.models import Habit, JournalEntry, Task
+from productivity.recurrence import extend_all_series
+
+User = get_user_model()
+
+
+@scheduled("break_missed_streaks", every=timedelta(hours=1))
+def break_missed_streaks(batch_size: int) -> int:
+    """Reset the streaks of habits not completed yesterday (user's time)."""
+    now = timezone.now()
+    # Hourly, so each user's streaks break soon after their own midnight.
+    zones = (
+        User.objects.filter(habits__streak__gt=0, habits__is_deleted=False)
+        .values_list("timezone", flat=True)
+        .distinct()
+    )
+    broken = 0
+    for name in zones:
+        try:
+            today = now.astimezone(ZoneInfo(name)).date()
+        except (ZoneInfoNotFoundError, ValueError):
+            today = now.date()
+        stale = Habit.objects.filter(
+            user__timezone=name,
+            streak__gt=0,
+            last_completed__lt=today - timedelta(days=1),
+        )
+        for chunk in pk_chunks(stale, batch_size):
+            broken += Habit.objects.filter(pk__in=chunk).update(
+                streak=0, updated_at=now
+            )
+    return broken
+
+
+@scheduled("mark_overdue_tasks", every=timedelta(minutes=15))
+def mark_overdue_tasks(batch_size: int) -> int:
+    """Flag open tasks whose due date passed; clear tasks no longer overdue."""
+    now = timezone.now()
+    # Same predicates as the partial indexes on Task.
+    becoming = Task.objects.filter(
+        is_overdue=False, status__in=Task.OPEN_STATUSES, due_date__lt=now
+    )
+    resolved = Task.all_objects.filter(is_overdue=True).filter(
+        ~Q(status__in=Task.OPEN_STATUSES)
+        | Q(due_date__isnull=True)
+        | Q(due_date__gte=now)
+        | Q(is_deleted=True)
+    )
+    changed = 0
+    for queryset, overdue in ((becoming, True), (resolved, False)):
+        for chunk in pk_chunks(queryset, batch_size):
+            changed += Task.all_objects.filter(pk__in=chunk).update(
+                is_overdue=overdue, updated_at=now
+            )
+    return changed
+
+
+@scheduled("materialize_recurring_tasks", every=timedelta(days=1), at=time(2, 0))
+def materialize_recurring_tasks(batch_size: int) -> int:
+    """Slide the window of materialized recurring task occurrences."""
+    return sum(created for _, created in extend_all_series(chunk_size=batch_size))
+
+
+@scheduled("refresh_mood_rollups", every=timedelta(days=1), at=time(3, 0))
+def refresh_mood_rollups(batch_size: int) -> int:
+    """Rebuild the mood rollups of users whose journal changed in a day."""
+    # Journal saves refresh their buckets already; this catches the bulk
+    # writes that bypass save(). The overlap covers a late or missed run.
+    since = timezone.now() - timedelta(days=1, hours=6)
+    users = User.all_objects.filter(
+        pk__in=JournalEntry.all_objects.filter(updated_at__gte=since).values("user_id")
+    )
+    rebuilt = 0
+    for chunk in pk_chunks(users, batch_size):
+        rebuild_mood_rollups(chunk)
+        rebuilt += len(chunk)
+    return rebuilt
@@ -0,0 +1,157 @@
+"""Full-text search over journal entries.
+
+PostgreSQL keeps a weighted ``tsvector`` (title ``A``, content ``B``) in
+``JournalEntry.search_vector``, filled by a trigger and indexed with GIN;
+queries use ``websearch_to_tsquery`` syntax and ``ts_rank`` ordering.
+
+SQLite, used for local development and tests, falls back to an FTS5 table
+(``productivity_journalentry_fts``) that :func:`index_journal_entry`
+refreshes on every save, ranked with ``bm25``.  Both backends return the
+best matches first, each with a ``rank`` (higher is better) and a
+``headline``: an HTML excerpt of the content, escaped, with matches wrapped
+in ``<mark>``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import F
+from django.utils.html import escape
+
+from productivity.models import JournalEntry
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+SEARCH_CONFIG = "english"
+FTS_TABLE = "productivity_journalentry_fts"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+# The database delimits matches with these private-use characters, which
+# survive escaping the excerpt and are then turned into the tags above.
+MATCH_START = "\ue000"
+MATCH_STOP = "\ue001"
+
+
+def index_journal_entry(entry: JournalEntry, using: str | None = None) -> None:
+    """Refresh the FTS5 row of *entry* (SQLite only; PostgreSQL uses a trigger)."""
+    connection = connections[using or DEFAULT_DB_ALIAS]
+    if connection.vendor != "sqlite":
+        return
+    entry_id = _db_value(connection, "id", entry.pk)
+    with connection.cursor() as cursor:
+        # FTS_TABLE is a constant; values are always bound parameters.
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE entry_id = %s", [entry_id])  # noqa: S608
+        if not entry.is_deleted:
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (entry_id, title, content) "  # noqa: S608
+                "VALUES (%s, %s, %s)",
+                [entry_id, entry.title, entry.content],
+            )
+
+
+def search_journal(user: Any, query: str, limit: int) -> list[JournalEntry]:
+    """Return *user*'s entries matching *query*, best first.
+
+    Each entry carries ``rank`` and ``headline`` attributes.
+    """
+    queryset = JournalEntry.objects.filter(user=user).defer("search_vector")
+    connection = connections[queryset.db]
+    if connection.vendor == "sqlite":
+        return _search_fts5(connection, queryset, user, query, limit)
+    search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+    entries = list(
+        queryset.filter(search_vector=search_query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), search_query),
+            headline=SearchHeadline(
+                "content",
+                search_query,
+                config=SEARCH_CONFIG,
+                start_sel=MATCH_START,
+                stop_sel=MATCH_STOP,
+                max_words=35,
+                min_words=15,
+            ),
+        )
+        .prefetch_related("tags")
+        .order_by("-rank", "-entry_date")[:limit]
+    )
+    for entry in entries:
+        entry.headline = _highlight(entry.headline)
+    return entries
+
+
+def _db_value(connection: BaseDatabaseWrapper, field_name: str, value: Any) -> Any:
+    field = JournalEntry._meta.get_field(field_name)
+    return field.get_db_prep_value(value, connection)
+
+
+def _highlight(excerpt: str) -> str:
+    """Escape the user's text of *excerpt*, then mark its matches in HTML."""
+    return (
+        escape(excerpt)
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_STOP, HIGHLIGHT_STOP)
+    )
+
+
+def _fts5_query(query: str) -> str:
+    # Every word must match; quoting keeps FTS5 operators and punctuation
+    # in user input from being parsed as query syntax.
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in query.split())
+
+
+def _search_fts5(
+    connection: BaseDatabaseWrapper,
+    queryset: Any,
+    user: Any,
+    query: str,
+    limit: int,
+) -> list[JournalEntry]:
+    match = _fts5_query(query)
+    if not match:
+        return []
+    table = JournalEntry._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            # Rank every match but build snippets for the returned page only;
+            # bm25() is lower for better matches and the title weighs double.
+            # Only FTS_TABLE and the model's table name are interpolated.
+            f"WITH top AS ("  # noqa: S608
+            f"  SELECT f.rowid AS fts_rowid, -bm25({FTS_TABLE}, 0, 2.0, 1.0) AS score,"
+            f"    j.entry_date"
+            f"  FROM {FTS_TABLE} AS f JOIN {table} AS j ON j.id = f.entry_id"
+            f"  WHERE {FTS_TABLE} MATCH %s AND j.user_id = %s AND NOT j.is_deleted"
+            f"  ORDER BY score DESC, j.entry_date DESC LIMIT %s"
+            f") "
+            f"SELECT f.entry_id, top.score, "
+            f"  snippet({FTS_TABLE}, 2, %s, %s, '…', 24) "
+            f"FROM top JOIN {FTS_TABLE} AS f ON f.rowid = top.fts_rowid "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            "ORDER BY top.score DESC, top.entry_date DESC",
+            [
+                match,
+                _db_value(connection, "user", user.pk),
+                limit,
+                MATCH_START,
+                MATCH_STOP,
+                match,
+            ],
+        )
+        hits = cursor.fetchall()
+    id_field = JournalEntry._meta.pk
+    entries = queryset.prefetch_related("tags").in_bulk(
+        [id_field.to_python(entry_id) for entry_id, _score, _headline in hits]
+    )
+    results = []
+    for entry_id, score, headline in hits:
+        entry = entries.get(id_field.to_python(entry_id))
+        if entry is not None:
+            entry.rank = score
+            entry.headline = _highlight(headline)
+            results.append(entry)
+    return results
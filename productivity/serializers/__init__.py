@@ -0,0 +1,25 @@
+from productivity.serializers.goal_serializer import GoalSerializer
+from productivity.serializers.habit_entry_serializer import HabitEntrySerializer
+from productivity.serializers.habit_serializer import HabitSerializer
+from productivity.serializers.journal_entry_search_serializer import (
+    JournalEntrySearchSerializer,
+)
+from productivity.serializers.journal_entry_serializer import JournalEntrySerializer
+from productivity.serializers.mood_rollup_serializer import (
+    MoodRollupSerializer,
+    MoodTagRollupSerializer,
+)
+from productivity.serializers.tag_serializer import TagSerializer
+from productivity.serializers.task_serializer import TaskSerializer
+
+__all__ = [
+    "GoalSerializer",
+    "HabitEntrySerializer",
+    "HabitSerializer",
+    "JournalEntrySearchSerializer",
+    "JournalEntrySerializer",
+    "MoodRollupSerializer",
+    "MoodTagRollupSerializer",
+    "TagSerializer",
+    "TaskSerializer",
+]
@@ -0,0 +1,40 @@
+from typing import ClassVar
+
+from rest_framework import serializers
+
+from core.serializers.sparse_fieldsets import SparseFieldsetSerializerMixin
+
+
+class OwnedRelationsSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
+    """
+    Base serializer whose relations listed in ``owned_relations`` only
+    accept records of the requesting user.
+    """
+
+    owned_relations: ClassVar[tuple[str, ...]] = ()
+
+    def get_fields(self) -> dict[str, serializers.Field]:
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None:
+            return fields
+        for name in self.owned_relations:
+            field = fields.get(name)
+            if field is None or field.read_only:
+                continue
+            if isinstance(field, serializers.ManyRelatedField):
+                field = field.child_relation
+            field.queryset = field.queryset.filter(user=request.user)
+        return fields
+
+
+class OwnedModelSerializer(OwnedRelationsSerializer):
+    """
+    Base serializer for records that belong to the requesting user.
+
+    ``user`` is filled from the request and never exposed.
+    """
+
+    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
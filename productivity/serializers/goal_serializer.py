@@ -0,0 +1,22 @@
+from productivity.models import Goal
+from productivity.serializers.base import OwnedModelSerializer
+
+
+class GoalSerializer(OwnedModelSerializer):
+    class Meta:
+        model = Goal
+        fields = (
+            "id",
+            "user",
+            "name",
+            "description",
+            "status",
+            "target_value",
+            "current_value",
+            "progress_mode",
+            "target_date",
+            "completion_xp_reward",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("id", "created_at", "updated_at")
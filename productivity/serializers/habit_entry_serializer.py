@@ -0,0 +1,11 @@
+from productivity.models import HabitEntry
+from productivity.serializers.base import OwnedRelationsSerializer
+
+
+class HabitEntrySerializer(OwnedRelationsSerializer):
+    owned_relations = ("habit",)
+
+    class Meta:
+        model = HabitEntry
+        fields = ("id", "habit", "date", "completed", "created_at", "updated_at")
+        read_only_fields = ("id", "created_at", "updated_at")
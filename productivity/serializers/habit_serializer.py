@@ -0,0 +1,27 @@
+from productivity.models import Habit
+from productivity.serializers.base import OwnedModelSerializer
+
+
+class HabitSerializer(OwnedModelSerializer):
+    owned_relations = ("goal",)
+
+    class Meta:
+        model = Habit
+        fields = (
+            "id",
+            "user",
+            "name",
+            "frequency",
+            "streak",
+            "last_completed",
+            "goal",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = (
+            "id",
+            "streak",
+            "last_completed",
+            "created_at",
+            "updated_at",
+        )
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from productivity.serializers.journal_entry_serializer import JournalEntrySerializer
+
+
+class JournalEntrySearchSerializer(JournalEntrySerializer):
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(
+        read_only=True,
+        help_text="HTML excerpt of the content: the text is escaped and "
+        "matches are wrapped in `<mark>`.",
+    )
+
+    class Meta(JournalEntrySerializer.Meta):
+        fields = (*JournalEntrySerializer.Meta.fields, "rank", "headline")
@@ -0,0 +1,21 @@
+from productivity.models import JournalEntry
+from productivity.serializers.base import OwnedModelSerializer
+
+
+class JournalEntrySerializer(OwnedModelSerializer):
+    owned_relations = ("tags",)
+
+    class Meta:
+        model = JournalEntry
+        fields = (
+            "id",
+            "user",
+            "entry_date",
+            "title",
+            "content",
+            "mood_rating",
+            "tags",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("id", "created_at", "updated_at")
@@ -0,0 +1,36 @@
+from rest_framework import serializers
+
+from productivity.models import MoodRollup, MoodTagRollup
+
+
+class MoodTagRollupSerializer(serializers.ModelSerializer):
+    name = serializers.CharField(source="tag.name", read_only=True)
+    mood_average = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = MoodTagRollup
+        fields = ("tag", "name", "entry_count", "mood_count", "mood_average")
+        read_only_fields = fields
+
+
+class MoodRollupSerializer(serializers.ModelSerializer):
+    mood_average = serializers.FloatField(read_only=True)
+    mood_change = serializers.FloatField(
+        read_only=True,
+        help_text="Average minus the previous listed period's average.",
+    )
+    tags = MoodTagRollupSerializer(many=True, read_only=True, source="tag_rollups")
+
+    class Meta:
+        model = MoodRollup
+        fields = (
+            "period_start",
+            "entry_count",
+            "mood_count",
+            "mood_average",
+            "mood_min",
+            "mood_max",
+            "mood_change",
+            "tags",
+        )
+        read_only_fields = fields
@@ -0,0 +1,34 @@
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from productivity.models import Tag
+from productivity.serializers.base import OwnedModelSerializer
+
+
+class TagSerializer(OwnedModelSerializer):
+    class Meta:
+        model = Tag
+        fields = (
+            "id",
+            "user",
+            "name",
+            "color",
+            "usage_count",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("id", "usage_count", "created_at", "updated_at")
+
+    def validate_name(self, value: str) -> str:
+        # Mirrors the (user, lower(name)) unique constraint, which
+        # ModelSerializer does not turn into a validator, in the form its
+        # index serves.
+        others = Tag.all_objects.alias(name_lower=Lower("name")).filter(
+            user=self.context["request"].user, name_lower=value.lower()
+        )
+        if self.instance is not None:
+            others = others.exclude(pk=self.instance.pk)
+        if others.exists():
+            msg = "You already have a tag with this name."
+            raise serializers.ValidationError(msg)
+        return value
@@ -0,0 +1,61 @@
+from typing import Any
+
+from rest_framework import serializers
+
+from productivity.models import Task
+from productivity.serializers.base import OwnedModelSerializer
+
+
+class TaskSerializer(OwnedModelSerializer):
+    owned_relations = ("goal", "tags")
+
+    class Meta:
+        model = Task
+        fields = (
+            "id",
+            "user",
+            "title",
+            "description",
+            "due_date",
+            "status",
+            "is_overdue",
+            "tags",
+            "goal",
+            "recurrence",
+            "recurrence_interval",
+            "recurrence_weekdays",
+            "recurrence_until",
+            "recurrence_count",
+            "series",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("id", "is_overdue", "series", "created_at", "updated_at")
+
+    def validate_recurrence_weekdays(self, value: Any) -> list[int]:
+        if not isinstance(value, list) or not all(
+            isinstance(day, int) and 0 <= day <= 6 for day in value
+        ):
+            msg = "Expected a list of weekdays from 0 (Monday) to 6 (Sunday)."
+            raise serializers.ValidationError(msg)
+        return sorted(set(value))
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        def current(name: str) -> Any:
+            if name in attrs:
+                return attrs[name]
+            return getattr(
+                self.instance, name, Task._meta.get_field(name).get_default()
+            )
+
+        recurrence = current("recurrence")
+        if recurrence and self.instance is not None and self.instance.series_id:
+            msg = "Occurrences of a recurring task cannot repeat themselves."
+            raise serializers.ValidationError({"recurrence": msg})
+        if recurrence and current("due_date") is None:
+            msg = "A recurring task needs a due date."
+            raise serializers.ValidationError({"due_date": msg})
+        if current("recurrence_weekdays") and recurrence != "weekly":
+            msg = "Weekdays only apply to weekly recurrence."
+            raise serializers.ValidationError({"recurrence_weekdays": msg})
+        return attrs
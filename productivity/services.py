@@ -0,0 +1,201 @@
+"""Completing tasks, habits and goals, and the XP they award.
+
+``Task.mark_done``, ``Habit.complete`` and ``Goal.mark_completed`` delegate
+here.  Each completion writes only the columns it changes and credits the
+XP without loading the user: pass the ``user`` when the caller has it (it
+is updated in memory too), else the owner row is updated by id, so
+completing objects in a loop costs the same few statements for each of
+them and never a lazy ``.user`` fetch.  Linked auto goals are refreshed as
+before, which adds their own queries for objects that have one.
+
+Completions are idempotent.  The write that completes an object is
+conditional on it not being completed yet (a task's or goal's status, the
+habit entry of the day under its ``(habit, date)`` unique constraint), so
+of a retried or concurrent request only the one whose statement changed
+a row awards XP; the others stop after that single statement.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from django.db import connections, router, transaction
+from django.db.models import Case, F, Q, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.events import emit
+from productivity.events import GoalCompleted, HabitCompleted, TaskCompleted
+from productivity.models import Goal, Habit, HabitEntry, Task
+from productivity.progress import refresh_goal_progress
+from users.events import XPAwarded
+from users.models import CustomUser
+
+TASK_XP = 10
+HABIT_XP = 5
+
+
+def award_xp(user: CustomUser | Any, amount: int) -> None:
+    """
+    Credit *amount* XP to *user*, a loaded user or a user id.
+
+    A loaded user goes through ``CustomUser.add_xp``.  For an id, one
+    UPDATE adds the XP and raises the level in the database, and the new
+    total is read back for the ``XPAwarded`` event.
+    """
+    if isinstance(user, CustomUser):
+        user.add_xp(amount)
+        return
+    xp = F("xp") + amount
+    with transaction.atomic():
+        CustomUser.all_objects.filter(pk=user).update(
+            xp=xp,
+            # Same rule as add_xp: a level per 100 XP, never lowered.
+            level=Greatest(F("level"), xp / 100 + 1),
+            updated_at=timezone.now(),
+        )
+        total = CustomUser.all_objects.values_list("xp", flat=True).get(pk=user)
+    emit(XPAwarded(user_id=user, amount=amount, previous_xp=total - amount, xp=total))
+
+
+def _owner(obj: Task | Habit | Goal, user: CustomUser | None) -> CustomUser | Any:
+    """The user to credit: the given one, the loaded ``obj.user``, or the id."""
+    if user is not None:
+        return user
+    if type(obj).user.is_cached(obj):
+        return obj.user
+    return obj.user_id
+
+
+def complete_task(task: Task, user: CustomUser | None = None) -> bool:
+    """Mark *task* done and award its XP; False if it already was done."""
+    now = timezone.now()
+    if not (
+        Task.all_objects.filter(pk=task.pk)
+        .exclude(status="done")
+        .update(status="done", is_overdue=False, updated_at=now)
+    ):
+        task.status, task.is_overdue = "done", False
+        return False
+    task.status, task.is_overdue, task.updated_at = "done", False, now
+    task._remember_tracked()
+    if task.goal_id is not None:
+        refresh_goal_progress(Goal.objects.filter(pk=task.goal_id))
+    award_xp(_owner(task, user), TASK_XP)
+    emit(TaskCompleted(user_id=task.user_id, task_id=task.pk))
+    return True
+
+
+def complete_habit(
+    habit: Habit, day: date | None = None, user: CustomUser | None = None
+) -> bool:
+    """
+    Log *habit* as completed on *day* (default today), update its streak.
+
+    Returns False, changing nothing else, if the day was already logged.
+    Only a day after ``last_completed`` moves it; an earlier day can only
+    lengthen the streak, by filling the gap before the current run.
+    """
+    if day is None:
+        day = timezone.localdate()
+    if not _log_completed_entry(habit, day):
+        return False
+
+    # Computed in the UPDATE, not from the (possibly stale) loaded habit, so
+    # concurrent completions of different days do not lose each other's.
+    if not (
+        Habit.all_objects.filter(pk=habit.pk)
+        .filter(Q(last_completed__isnull=True) | Q(last_completed__lt=day))
+        .update(
+            streak=Case(
+                When(last_completed=day - timedelta(days=1), then=F("streak") + 1),
+                default=1,
+            ),
+            last_completed=day,
+            updated_at=timezone.now(),
+        )
+    ):
+        # A day before the last completion: it may join the current run to
+        # an earlier one, but never moves last_completed back.
+        _recount_streak(habit)
+    habit.refresh_from_db(fields=["streak", "last_completed", "updated_at"])
+    if habit.goal_id is not None:
+        refresh_goal_progress(Goal.objects.filter(pk=habit.goal_id))
+    award_xp(_owner(habit, user), HABIT_XP)
+    emit(HabitCompleted(user_id=habit.user_id, habit_id=habit.pk, date=day))
+    return True
+
+
+def _recount_streak(habit: Habit) -> None:
+    """Recount *habit*'s streak from its completed entries up to last_completed."""
+    with transaction.atomic():
+        last = (
+            Habit.all_objects.select_for_update()
+            .values_list("last_completed", flat=True)
+            .get(pk=habit.pk)
+        )
+        days = (
+            HabitEntry.objects.filter(habit=habit, completed=True, date__lte=last)
+            .order_by("-date")
+            .values_list("date", flat=True)
+        )
+        streak = 0
+        for day in days.iterator():
+            if day != last - timedelta(days=streak):
+                break
+            streak += 1
+        Habit.all_objects.filter(pk=habit.pk).update(
+            streak=streak, updated_at=timezone.now()
+        )
+
+
+def _log_completed_entry(habit: Habit, day: date) -> bool:
+    """
+    Insert *habit*'s completed entry for *day* in one statement.
+
+    An existing entry is revived if it was missed or deleted and left alone
+    if already completed: ``INSERT ... ON CONFLICT (habit, date) DO UPDATE
+    ... WHERE``, whose row count tells whether the day is newly completed.
+    (``bulk_create`` can upsert too, but does not report that.)
+    """
+    connection = connections[router.db_for_write(HabitEntry)]
+    quote = connection.ops.quote_name
+    entry = HabitEntry(habit=habit, date=day, completed=True)
+    entry.created_at = entry.updated_at = timezone.now()
+    fields = HabitEntry._meta.concrete_fields
+    table = quote(HabitEntry._meta.db_table)
+    unique = ", ".join(
+        quote(HabitEntry._meta.get_field(name).column) for name in ("habit", "date")
+    )
+    with connection.cursor() as cursor:
+        # Only quoted names from the model's metadata are interpolated.
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(quote(f.column) for f in fields)}) "  # noqa: S608
+            f"VALUES ({', '.join(['%s'] * len(fields))}) "
+            f"ON CONFLICT ({unique}) DO UPDATE SET "
+            f"completed = excluded.completed, is_deleted = excluded.is_deleted, "
+            f"deleted_at = NULL, updated_at = excluded.updated_at "
+            f"WHERE NOT {table}.completed OR {table}.is_deleted",
+            [
+                field.get_db_prep_save(getattr(entry, field.attname), connection)
+                for field in fields
+            ],
+        )
+        return cursor.rowcount == 1
+
+
+def complete_goal(goal: Goal, user: CustomUser | None = None) -> bool:
+    """Mark *goal* completed and award its XP; False if it already was."""
+    now = timezone.now()
+    if not (
+        Goal.all_objects.filter(pk=goal.pk)
+        .exclude(status="completed")
+        .update(status="completed", updated_at=now)
+    ):
+        goal.status = "completed"
+        return False
+    goal.status, goal.updated_at = "completed", now
+    award_xp(_owner(goal, user), goal.completion_xp_reward)
+    emit(GoalCompleted(user_id=goal.user_id, goal_id=goal.pk))
+    return True
@@ -0,0 +1,124 @@
+"""Signal receivers of the productivity app, connected in ``ready()``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from productivity.analytics import refresh_mood_rollups
+from productivity.models import JournalEntry, Tag, Task
+from productivity.recurrence import sync_occurrence_tags
+from productivity.tags import refresh_tag_usage, touch_tagged
+
+
+@receiver(m2m_changed, sender=JournalEntry.tags.through)
+def refresh_rollups_on_tag_change(
+    sender: type, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Keep tag rollups current; tags are set after the entry is saved."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_mood_rollups(instance.user_id, [instance.entry_date])
+        return
+    # Changed from the tag's side (tag.journalentry_set): every linked
+    # entry's buckets.  A clear is resolved before the links are gone.
+    if action == "pre_clear":
+        instance._cleared_entries = list(
+            JournalEntry.objects.filter(tags=instance).values_list(
+                "user_id", "entry_date"
+            )
+        )
+        return
+    if action == "post_clear":
+        rows = instance.__dict__.pop("_cleared_entries", [])
+    elif action in ("post_add", "post_remove"):
+        rows = JournalEntry.objects.filter(pk__in=kwargs["pk_set"]).values_list(
+            "user_id", "entry_date"
+        )
+    else:
+        return
+    by_user: dict[Any, set] = {}
+    for user_id, entry_date in rows:
+        by_user.setdefault(user_id, set()).add(entry_date)
+    for user_id, days in by_user.items():
+        refresh_mood_rollups(user_id, days)
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+@receiver(m2m_changed, sender=JournalEntry.tags.through)
+def refresh_usage_on_tag_change(
+    sender: type, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Recount the usage of the tags whose links changed."""
+    if reverse:
+        # Changed from the tag's side: only that tag is affected.
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_tag_usage(Tag.all_objects.filter(pk=instance.pk))
+        return
+    if action == "pre_clear":
+        instance._cleared_tag_ids = list(instance.tags.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        tag_ids = instance.__dict__.pop("_cleared_tag_ids", [])
+    elif action in ("post_add", "post_remove"):
+        tag_ids = kwargs["pk_set"]
+    else:
+        return
+    if tag_ids:
+        refresh_tag_usage(Tag.all_objects.filter(pk__in=tag_ids))
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+@receiver(m2m_changed, sender=JournalEntry.tags.through)
+def touch_items_on_tag_change(
+    sender: type, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """A tag change is an edit of the item: ETags and the sync feed follow."""
+    model = kwargs["model"]
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            instance.updated_at = timezone.now()
+            type(instance).all_objects.filter(pk=instance.pk).update(
+                updated_at=instance.updated_at
+            )
+        return
+    # Changed from the tag's side: the linked items of *model*.
+    cleared = f"_cleared_{model._meta.model_name}_ids"
+    if action == "pre_clear":
+        instance.__dict__[cleared] = list(
+            model.all_objects.filter(tags=instance).values_list("pk", flat=True)
+        )
+        return
+    if action == "post_clear":
+        item_ids = instance.__dict__.pop(cleared, [])
+    elif action in ("post_add", "post_remove"):
+        item_ids = kwargs["pk_set"]
+    else:
+        return
+    if item_ids:
+        model.all_objects.filter(pk__in=item_ids).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Tag)
+def touch_items_on_tag_delete(
+    sender: type, instance: Tag, update_fields: Any, **kwargs: Any
+) -> None:
+    """Soft deleting or restoring a tag changes the items that carry it."""
+    if update_fields and "is_deleted" in update_fields:
+        touch_tagged(Tag.all_objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def sync_occurrence_tags_on_change(
+    sender: type, instance: Any, action: str, reverse: bool, **kwargs: Any
+) -> None:
+    """Upcoming occurrences of a recurring task follow its tags."""
+    if (
+        not reverse
+        and instance.recurrence
+        and action in ("post_add", "post_remove", "post_clear")
+    ):
+        sync_occurrence_tags(instance)
@@ -0,0 +1,70 @@
+"""Per-user tags: the usage counter and tag filters.
+
+``Tag.usage_count`` is recounted, not incremented, for the tags a change
+touches: one ``UPDATE`` with a correlated count per tagged model.  Adding a
+link twice, removing a missing one or soft deleting a tagged item therefore
+cannot make it drift.
+
+Tag filters add one semi-join per tag, ``id IN (SELECT <item>_id FROM
+<links> WHERE tag_id = %s)``, read from the covering ``(tag_id, <item>_id)``
+indexes of migration 0008, instead of one join per tag followed by
+``DISTINCT``.  PostgreSQL plans it exactly like ``EXISTS``; SQLite runs a
+correlated ``EXISTS`` once per candidate row but drives ``IN`` from the
+index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db.models import Count, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from productivity.models import JournalEntry, Tag, Task
+
+
+def _usage(model: type[Task | JournalEntry]) -> Coalesce:
+    field = model._meta.get_field("tags")
+    links = (
+        field.remote_field.through.objects.filter(
+            tag=OuterRef("pk"), **{f"{field.m2m_field_name()}__is_deleted": False}
+        )
+        .order_by()
+        .values("tag")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(links, output_field=IntegerField()), 0)
+
+
+def refresh_tag_usage(tags: QuerySet[Tag]) -> int:
+    """Recount ``usage_count`` of *tags*; returns the number of tags updated."""
+    return Tag.all_objects.filter(pk__in=tags.values("pk")).update(
+        usage_count=_usage(Task) + _usage(JournalEntry), updated_at=timezone.now()
+    )
+
+
+def touch_tagged(tags: QuerySet[Tag]) -> None:
+    """Bump ``updated_at`` of the tasks and journal entries carrying *tags*."""
+    now = timezone.now()
+    for model in (Task, JournalEntry):
+        model.all_objects.filter(pk__in=_tagged(model, tags)).update(updated_at=now)
+
+
+def _tagged(model: type[Task | JournalEntry], tags: QuerySet[Tag]) -> QuerySet:
+    field = model._meta.get_field("tags")
+    return field.remote_field.through.objects.filter(tag__in=tags.values("pk")).values(
+        f"{field.m2m_field_name()}_id"
+    )
+
+
+def with_all_tags(queryset: QuerySet, tag_ids: Iterable[Any]) -> QuerySet:
+    """Narrow *queryset* (tasks or journal entries) to items carrying every tag."""
+    field = queryset.model._meta.get_field("tags")
+    links = field.remote_field.through.objects
+    item = f"{field.m2m_field_name()}_id"
+    for tag_id in set(tag_ids):
+        queryset = queryset.filter(pk__in=links.filter(tag_id=tag_id).values(item))
+    return queryset
@@ -0,0 +1,81 @@
+"""Tests for the productivity API."""
+
+from __future__ import annotations
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import Goal, JournalEntry, Tag, Task
+from users.models import CustomUser
+
+
+class ProductivityApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+        cls.goal = Goal.objects.create(user=cls.user, name="Ship it")
+        cls.other_goal = Goal.objects.create(user=cls.other, name="Not yours")
+        cls.tag = Tag.objects.create(user=cls.user, name="work")
+        cls.task = Task.objects.create(user=cls.user, title="Mine")
+        cls.other_task = Task.objects.create(user=cls.other, title="Theirs")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    # ─── Tasks ─────────────────────────────────────────────────────────
+
+    def test_list_shows_only_own_tasks(self) -> None:
+        response = self.client.get(reverse("productivity:task-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert [task["title"] for task in response.data["results"]] == ["Mine"]
+        assert "user" not in response.data["results"][0]
+
+    def test_list_honours_fields(self) -> None:
+        response = self.client.get(
+            reverse("productivity:task-list"), {"fields": "id,title"}
+        )
+        assert response.data["results"] == [{"id": str(self.task.pk), "title": "Mine"}]
+
+    def test_create_task_with_own_goal_and_tags(self) -> None:
+        payload = {"title": "New", "goal": self.goal.pk, "tags": [self.tag.pk]}
+        response = self.client.post(
+            reverse("productivity:task-list"), payload, format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        task = Task.objects.get(pk=response.data["id"])
+        assert task.user == self.user
+        assert list(task.tags.all()) == [self.tag]
+
+    def test_create_task_rejects_foreign_goal(self) -> None:
+        payload = {"title": "Sneaky", "goal": self.other_goal.pk}
+        response = self.client.post(
+            reverse("productivity:task-list"), payload, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "goal" in response.data
+
+    def test_detail_hides_other_users_tasks(self) -> None:
+        url = reverse("productivity:task-detail", args=[self.other_task.pk])
+        assert self.client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_delete_is_soft(self) -> None:
+        url = reverse("productivity:task-detail", args=[self.task.pk])
+        assert self.client.delete(url).status_code == status.HTTP_204_NO_CONTENT
+        assert Task.all_objects.get(pk=self.task.pk).is_deleted
+        assert self.client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    # ─── Journal ───────────────────────────────────────────────────────
+
+    def test_one_journal_entry_per_day(self) -> None:
+        url = reverse("productivity:journal-entry-list")
+        payload = {"entry_date": "2025-03-01", "content": "First"}
+        assert self.client.post(url, payload).status_code == status.HTTP_201_CREATED
+        response = self.client.post(url, payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert JournalEntry.objects.filter(user=self.user).count() == 1
@@ -0,0 +1,211 @@
+"""Tests for completing tasks, habits and goals (``productivity.services``)."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import Goal, Habit, HabitEntry, Task
+from productivity.services import award_xp, complete_goal, complete_habit, complete_task
+from users.models import CustomUser
+
+
+class CompletionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="doer", email="doer@example.com", password="x"
+        )
+
+    def xp(self) -> tuple[int, int]:
+        self.user.refresh_from_db()
+        return self.user.xp, self.user.level
+
+    # ─── Statements ───
+
+    def test_task_by_id_does_not_load_the_user(self) -> None:
+        Task.objects.create(user=self.user, title="t", description="long " * 100)
+        task = Task.objects.get()
+        # UPDATE task, then UPDATE user and read back its XP in a savepoint.
+        with self.assertNumQueries(5):
+            assert complete_task(task)
+        assert self.xp() == (10, 1)
+
+    def test_task_with_loaded_user(self) -> None:
+        task = Task.objects.create(user=self.user, title="t")
+        with self.assertNumQueries(2):
+            complete_task(task, user=self.user)
+        assert self.user.xp == 10
+
+    def test_repeats_stop_after_one_statement(self) -> None:
+        task = Task.objects.create(user=self.user, title="t")
+        goal = Goal.objects.create(user=self.user, name="g")
+        habit = Habit.objects.create(user=self.user, name="h")
+        complete_task(task)
+        complete_goal(goal)
+        complete_habit(habit)
+        xp = self.xp()
+        # Stale copies, as a retried request would load them.
+        stale_task = Task.objects.get(pk=task.pk)
+        stale_task.status = "pending"
+        stale_goal = Goal.objects.get(pk=goal.pk)
+        stale_goal.status = "active"
+        with self.assertNumQueries(3):
+            assert not complete_task(stale_task)
+            assert not complete_goal(stale_goal)
+            assert not complete_habit(habit)
+        assert self.xp() == xp
+        assert stale_task.status == "done"
+
+    def test_completing_in_a_loop_costs_the_same_per_object(self) -> None:
+        for n in range(4):
+            Task.objects.create(user=self.user, title=f"t{n}")
+            Habit.objects.create(user=self.user, name=f"h{n}")
+        tasks = list(Task.objects.all())
+        habits = list(Habit.objects.all())
+        with self.assertNumQueries(2 * 4):
+            for task in tasks:
+                complete_task(task, user=self.user)
+        # Entry upsert, streak UPDATE, streak read back, XP.
+        with self.assertNumQueries(4 * 4):
+            for habit in habits:
+                complete_habit(habit, user=self.user)
+        assert self.xp() == (60, 1)
+
+    def test_only_the_changed_columns_are_written(self) -> None:
+        task = Task.objects.create(user=self.user, title="t")
+        stale = Task.objects.get(pk=task.pk)
+        task.title = "renamed elsewhere"
+        task.save()
+        complete_task(stale, user=self.user)
+        task.refresh_from_db()
+        assert (task.title, task.status) == ("renamed elsewhere", "done")
+
+    def test_goal(self) -> None:
+        goal = Goal.objects.create(user=self.user, name="g", completion_xp_reward=150)
+        with self.assertNumQueries(2):
+            assert complete_goal(goal, user=self.user)
+        assert not complete_goal(goal)
+        assert self.xp() == (150, 2)
+
+    # ─── Habits ───
+
+    def test_habit_streak_and_revived_entry(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="read")
+        today = timezone.localdate()
+        yesterday = today - timedelta(days=1)
+        complete_habit(habit, yesterday)
+        entry = HabitEntry.objects.create(habit=habit, date=today, completed=False)
+        entry.delete()
+
+        assert complete_habit(Habit.objects.get(pk=habit.pk), today)
+        habit.refresh_from_db()
+        assert (habit.streak, habit.last_completed) == (2, today)
+        entry = HabitEntry.objects.get(habit=habit, date=today)
+        assert entry.completed
+        assert HabitEntry.objects.filter(habit=habit).count() == 2
+
+    def test_backdated_habit_completion_keeps_the_streak(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="read")
+        day = date(2026, 3, 10)
+        for offset in (0, 1, 3):  # the 10th, 9th and 7th
+            complete_habit(habit, day - timedelta(days=offset))
+        assert (habit.streak, habit.last_completed) == (2, day)
+        # Next day as usual: the older day did not break the run.
+        complete_habit(habit, day + timedelta(days=1))
+        assert (habit.streak, habit.last_completed) == (3, day + timedelta(days=1))
+        # Filling the gap on the 8th joins the 7th to the run.
+        assert complete_habit(habit, day - timedelta(days=2))
+        assert (habit.streak, habit.last_completed) == (5, day + timedelta(days=1))
+        habit.refresh_from_db()
+        assert habit.streak == 5
+
+    def test_habit_streak_uses_the_stored_row(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="read")
+        stale = Habit.objects.get(pk=habit.pk)
+        complete_habit(habit, date(2026, 3, 1))
+        # A concurrent request loaded the habit before that completion.
+        complete_habit(stale, date(2026, 3, 2))
+        assert (stale.streak, stale.last_completed) == (2, date(2026, 3, 2))
+
+    def test_habit_entry_refreshes_its_auto_goal(self) -> None:
+        goal = Goal.objects.create(
+            user=self.user, name="g", progress_mode=Goal.PROGRESS_AUTO
+        )
+        habit = Habit.objects.create(user=self.user, name="run", goal=goal)
+        habit.complete(date(2026, 1, 1))
+        goal.refresh_from_db()
+        assert goal.current_value == 1
+
+    # ─── XP ───
+
+    def test_award_by_id_levels_up_like_add_xp(self) -> None:
+        award_xp(self.user.pk, 95)
+        award_xp(self.user.pk, 110)
+        assert self.xp() == (205, 3)
+        self.user.add_xp(100)
+        assert self.xp() == (305, 4)
+
+
+class CompletionApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="doer", email="doer@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def post_twice(self, url: str, payload: dict | None = None) -> list[int]:
+        return [
+            self.client.post(url, payload or {}, format="json").status_code
+            for _ in range(2)
+        ]
+
+    def test_retried_task_completion_awards_once(self) -> None:
+        task = Task.objects.create(user=self.user, title="t")
+        url = reverse("productivity:task-complete", args=[task.pk])
+        assert self.post_twice(url) == [status.HTTP_201_CREATED, status.HTTP_200_OK]
+        self.user.refresh_from_db()
+        assert self.user.xp == 10
+        assert self.client.post(url).data["status"] == "done"
+
+    def test_retried_habit_completion_counts_the_day_once(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="read")
+        url = reverse("productivity:habit-complete", args=[habit.pk])
+        payload = {"date": "2026-03-01"}
+        assert self.post_twice(url, payload) == [
+            status.HTTP_201_CREATED,
+            status.HTTP_200_OK,
+        ]
+        response = self.client.post(url, {"date": "2026-03-02"}, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["streak"] == 2
+        self.user.refresh_from_db()
+        assert self.user.xp == 10
+
+    def test_habit_completion_rejects_future_dates(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="read")
+        url = reverse("productivity:habit-complete", args=[habit.pk])
+        later = timezone.localdate() + timedelta(days=2)
+        response = self.client.post(url, {"date": str(later)}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "date" in response.data
+        assert not HabitEntry.objects.exists()
+
+    def test_goal_completion_and_ownership(self) -> None:
+        goal = Goal.objects.create(user=self.user, name="g")
+        url = reverse("productivity:goal-complete", args=[goal.pk])
+        assert self.post_twice(url) == [status.HTTP_201_CREATED, status.HTTP_200_OK]
+        theirs = Task.objects.create(user=self.other, title="t")
+        url = reverse("productivity:task-complete", args=[theirs.pk])
+        assert self.client.post(url).status_code == status.HTTP_404_NOT_FOUND
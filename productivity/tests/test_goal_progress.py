@@ -0,0 +1,119 @@
+"""Tests for goals whose progress is derived from linked tasks and habits."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import Goal, Habit, HabitEntry, Task
+from users.models import CustomUser
+
+
+class GoalProgressTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        self.goal = Goal.objects.create(
+            user=self.user,
+            name="Ship it",
+            progress_mode=Goal.PROGRESS_AUTO,
+            target_value=Decimal(4),
+        )
+        self.habit = Habit.objects.create(user=self.user, name="Run", goal=self.goal)
+
+    def task(self, **fields: object) -> Task:
+        return Task.objects.create(user=self.user, title="t", goal=self.goal, **fields)
+
+    def progress(self) -> Decimal:
+        self.goal.refresh_from_db()
+        return self.goal.current_value
+
+    def test_done_tasks_and_completed_entries_count(self) -> None:
+        task = self.task()
+        self.task(status="done")
+        HabitEntry.objects.create(habit=self.habit, date=date(2026, 1, 1))
+        HabitEntry.objects.create(
+            habit=self.habit, date=date(2026, 1, 2), completed=True
+        )
+        assert self.progress() == 2
+
+        task.mark_done()
+        assert self.progress() == 3
+
+        task.delete()
+        assert self.progress() == 2
+
+    def test_reassigning_a_task_refreshes_both_goals(self) -> None:
+        other = Goal.objects.create(
+            user=self.user, name="Other", progress_mode=Goal.PROGRESS_AUTO
+        )
+        task = self.task(status="done")
+        task.goal = other
+        task.save()
+        other.refresh_from_db()
+        assert (self.progress(), other.current_value) == (0, 1)
+
+    def test_habit_completion_logs_an_entry(self) -> None:
+        self.habit.complete(date(2026, 1, 1))
+        self.habit.complete(date(2026, 1, 2))
+        assert self.progress() == 2
+        assert HabitEntry.objects.filter(habit=self.habit, completed=True).count() == 2
+
+        self.habit.delete()
+        assert self.progress() == 0
+
+    def test_crossing_the_target_completes_the_goal_once(self) -> None:
+        for _ in range(4):
+            self.task(status="done")
+        self.task(status="done")
+        self.goal.refresh_from_db()
+        self.user.refresh_from_db()
+        assert self.goal.status == "completed"
+        assert self.user.xp == self.goal.completion_xp_reward
+
+    def test_manual_goals_are_left_alone(self) -> None:
+        self.goal.progress_mode = Goal.PROGRESS_MANUAL
+        self.goal.current_value = Decimal("1.5")
+        self.goal.save()
+        self.task(status="done")
+        assert self.progress() == Decimal("1.5")
+
+    def test_switching_to_auto_over_the_api_recounts(self) -> None:
+        manual = Goal.objects.create(user=self.user, name="Later")
+        Task.objects.create(user=self.user, title="t", goal=manual, status="done")
+        response = self.client.patch(
+            reverse("productivity:goal-detail", args=[manual.pk]),
+            {"progress_mode": "auto", "current_value": "7"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert Decimal(response.data["current_value"]) == 1
+
+    def test_with_progress_is_one_query_for_many_goals(self) -> None:
+        for n in range(5):
+            goal = Goal.objects.create(user=self.user, name=f"g{n}")
+            for _ in range(n):
+                Task.objects.create(user=self.user, title="t", goal=goal, status="done")
+        with CaptureQueriesContext(connection) as queries:
+            progress = {g.name: g.progress for g in Goal.objects.with_progress()}
+        assert len(queries) == 1
+        assert progress == {"Ship it": 0, "g0": 0, "g1": 1, "g2": 2, "g3": 3, "g4": 4}
+
+    def test_rebuild_command_recounts_after_bulk_updates(self) -> None:
+        self.task()
+        Task.objects.update(status="done")
+        call_command("rebuild_goal_progress", stdout=StringIO())
+        assert self.progress() == 1
@@ -0,0 +1,112 @@
+"""Tests for mood rollups and the mood analytics endpoint."""
+
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import JournalEntry, MoodRollup, MoodTagRollup, Tag
+from users.models import CustomUser
+
+
+def rollup_snapshot() -> tuple[list, list]:
+    fields = ("user_id", "period", "period_start", "entry_count", "mood_count")
+    return (
+        sorted(
+            MoodRollup.objects.values_list(*fields, "mood_sum", "mood_min", "mood_max")
+        ),
+        sorted(MoodTagRollup.objects.values_list(*fields, "tag_id", "mood_sum")),
+    )
+
+
+class MoodRollupTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.work = Tag.objects.create(user=cls.user, name="work")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        # Monday and Wednesday of one week, and the next Monday.
+        self.monday = self.entry(date(2026, 3, 2), 2)
+        self.wednesday = self.entry(date(2026, 3, 4), 4)
+        self.next_monday = self.entry(date(2026, 3, 9), None)
+
+    def entry(self, day: date, mood: int | None) -> JournalEntry:
+        return JournalEntry.objects.create(
+            user=self.user, entry_date=day, content="...", mood_rating=mood
+        )
+
+    def week(self, start: date) -> MoodRollup:
+        return MoodRollup.objects.get(user=self.user, period="week", period_start=start)
+
+    def test_writes_maintain_week_and_month_buckets(self) -> None:
+        week = self.week(date(2026, 3, 2))
+        assert (week.entry_count, week.mood_count, week.mood_sum) == (2, 2, 6)
+        assert (week.mood_min, week.mood_max) == (2, 4)
+        month = MoodRollup.objects.get(user=self.user, period="month")
+        assert (month.period_start, month.entry_count, month.mood_count) == (
+            date(2026, 3, 1),
+            3,
+            2,
+        )
+
+    def test_moving_an_entry_refreshes_both_buckets(self) -> None:
+        self.wednesday.entry_date = date(2026, 3, 10)
+        self.wednesday.save()
+        assert self.week(date(2026, 3, 2)).mood_max == 2
+        assert self.week(date(2026, 3, 9)).mood_sum == 4
+
+    def test_soft_delete_removes_entry_and_empty_buckets(self) -> None:
+        self.next_monday.delete()
+        assert not MoodRollup.objects.filter(period_start=date(2026, 3, 9)).exists()
+        self.monday.delete()
+        assert self.week(date(2026, 3, 2)).mood_min == 4
+
+    def test_tag_changes_maintain_tag_rollups(self) -> None:
+        self.monday.tags.add(self.work)
+        self.wednesday.tags.add(self.work)
+        tag_week = MoodTagRollup.objects.get(period="week", tag=self.work)
+        assert (tag_week.entry_count, tag_week.mood_sum) == (2, 6)
+        self.work.journalentry_set.remove(self.wednesday)
+        tag_week = MoodTagRollup.objects.get(period="week", tag=self.work)
+        assert tag_week.mood_sum == 2
+        self.work.journalentry_set.clear()
+        assert not MoodTagRollup.objects.exists()
+
+    def test_rebuild_matches_incremental_rollups(self) -> None:
+        self.monday.tags.add(self.work)
+        expected = rollup_snapshot()
+        MoodRollup.objects.all().delete()
+        MoodTagRollup.objects.all().delete()
+        call_command("rebuild_mood_rollups", chunk_size=1, stdout=StringIO())
+        assert rollup_snapshot() == expected
+
+    def test_endpoint_serves_rollups_with_change_and_tags(self) -> None:
+        self.next_monday.mood_rating = 5
+        self.next_monday.save()
+        self.monday.tags.add(self.work)
+        response = self.client.get(
+            reverse("productivity:journal-mood"),
+            {"period": "week", "start": "2026-01-01", "end": "2026-12-31"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        first, second = response.data["results"]
+        assert first["mood_average"] == 3.0
+        assert first["mood_change"] is None
+        assert first["tags"][0]["name"] == "work"
+        assert second["mood_change"] == 2.0
+
+    def test_endpoint_rejects_inverted_range(self) -> None:
+        response = self.client.get(
+            reverse("productivity:journal-mood"),
+            {"start": "2026-12-31", "end": "2026-01-01"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,167 @@
+"""Tests for recurring tasks and their materialization."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import Tag, Task
+from productivity.recurrence import occurrence_dates
+from users.models import CustomUser
+
+UTC = ZoneInfo("UTC")
+
+
+class OccurrenceDatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com"
+        )
+
+    def dates(self, due: datetime, limit: int = 10, **rule: object) -> list[datetime]:
+        task = Task(user=self.user, title="t", due_date=due, **rule)
+        found = []
+        for occurrence in occurrence_dates(task):
+            found.append(occurrence)
+            if len(found) == limit:
+                break
+        return found
+
+    def test_daily_with_interval_and_count(self) -> None:
+        start = datetime(2026, 3, 1, 8, tzinfo=UTC)
+        found = self.dates(
+            start, recurrence="daily", recurrence_interval=2, recurrence_count=3
+        )
+        assert [d.day for d in found] == [1, 3, 5]
+
+    def test_weekly_on_weekdays_until(self) -> None:
+        # Wednesday 4 March 2026, repeating on Mondays and Wednesdays.
+        found = self.dates(
+            datetime(2026, 3, 4, 8, tzinfo=UTC),
+            recurrence="weekly",
+            recurrence_weekdays=[0, 2],
+            recurrence_until=date(2026, 3, 16),
+        )
+        assert [d.day for d in found] == [4, 9, 11, 16]
+
+    def test_monthly_skips_short_months(self) -> None:
+        found = self.dates(
+            datetime(2026, 1, 31, 8, tzinfo=UTC), 4, recurrence="monthly"
+        )
+        assert [(d.month, d.day) for d in found] == [(1, 31), (3, 31), (5, 31), (7, 31)]
+
+    def test_wall_clock_time_survives_dst(self) -> None:
+        self.user.timezone = "America/New_York"
+        zone = ZoneInfo("America/New_York")
+        start = datetime(2026, 3, 7, 9, tzinfo=zone).astimezone(UTC)
+        found = self.dates(start, 3, recurrence="daily")
+        assert [d.astimezone(zone).time() for d in found] == [time(9)] * 3
+        # 8 March 2026 is 23 hours long in New York.
+        assert found[1].astimezone(UTC) - found[0].astimezone(UTC) == timedelta(
+            hours=23
+        )
+
+
+@override_settings(RECURRENCE_WINDOW_DAYS=10)
+class MaterializationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.tag = Tag.objects.create(user=cls.user, name="chores")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        self.start = timezone.now() + timedelta(hours=1)
+
+    def create(self, **rule: object) -> Task:
+        payload = {
+            "title": "Water plants",
+            "due_date": self.start.isoformat(),
+            "tags": [self.tag.pk],
+            **rule,
+        }
+        response = self.client.post(
+            reverse("productivity:task-list"), payload, format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+        return Task.objects.get(pk=response.data["id"])
+
+    def test_saving_a_rule_materializes_the_window(self) -> None:
+        template = self.create(recurrence="daily")
+        occurrences = Task.objects.filter(series=template).order_by("due_date")
+        # The template is due in an hour; the window ends in ten days.
+        assert occurrences.count() == 9
+        first = occurrences[0]
+        assert first.due_date == self.start + timedelta(days=1)
+        assert (first.title, list(first.tags.all())) == ("Water plants", [self.tag])
+        self.tag.refresh_from_db()
+        assert self.tag.usage_count == 10
+
+    def test_command_slides_the_window_idempotently(self) -> None:
+        template = self.create(recurrence="daily", recurrence_count=20)
+        call_command("materialize_recurring_tasks", "--days", "30", stdout=StringIO())
+        call_command("materialize_recurring_tasks", "--days", "30", stdout=StringIO())
+        assert Task.objects.filter(series=template).count() == 19
+
+    def test_changing_the_rule_reschedules_pending_occurrences(self) -> None:
+        template = self.create(recurrence="daily")
+        kept = Task.objects.filter(series=template).order_by("due_date").first()
+        kept.mark_done()
+
+        response = self.client.patch(
+            reverse("productivity:task-detail", args=[template.pk]),
+            {"recurrence": "weekly"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        upcoming = Task.objects.filter(series=template).order_by("due_date")
+        assert [task.pk == kept.pk for task in upcoming] == [True, False]
+        assert upcoming[1].due_date == self.start + timedelta(weeks=1)
+
+        self.client.patch(
+            reverse("productivity:task-detail", args=[template.pk]),
+            {"recurrence": ""},
+            format="json",
+        )
+        assert list(Task.objects.filter(series=template)) == [kept]
+
+    def test_rule_validation(self) -> None:
+        url = reverse("productivity:task-list")
+        response = self.client.post(
+            url, {"title": "t", "recurrence": "daily"}, format="json"
+        )
+        assert "due_date" in response.data
+        response = self.client.post(
+            url,
+            {
+                "title": "t",
+                "due_date": self.start.isoformat(),
+                "recurrence": "daily",
+                "recurrence_weekdays": [1],
+            },
+            format="json",
+        )
+        assert "recurrence_weekdays" in response.data
+
+    def test_due_range_filter(self) -> None:
+        self.create(recurrence="daily")
+        response = self.client.get(
+            reverse("productivity:task-list"),
+            {
+                "status": "pending",
+                "due_after": (self.start + timedelta(days=1)).isoformat(),
+                "due_before": (self.start + timedelta(days=3)).isoformat(),
+            },
+        )
+        assert len(response.data["results"]) == 2
@@ -0,0 +1,130 @@
+"""Tests for the periodic productivity jobs."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from productivity.models import Habit, JournalEntry, MoodRollup, Task
+from productivity.scheduled import (
+    break_missed_streaks,
+    mark_overdue_tasks,
+    materialize_recurring_tasks,
+    refresh_mood_rollups,
+)
+from users.models import CustomUser
+
+
+class BreakMissedStreaksTests(TestCase):
+    def test_streaks_break_after_the_users_own_midnight(self) -> None:
+        # 02:00 UTC on 10 March: already the 10th in Berlin, still the 9th
+        # in New York.
+        now = datetime(2026, 3, 10, 2, tzinfo=UTC)
+        berlin = CustomUser.objects.create_user(
+            username="berlin", email="berlin@example.com", timezone="Europe/Berlin"
+        )
+        new_york = CustomUser.objects.create_user(
+            username="ny", email="ny@example.com", timezone="America/New_York"
+        )
+        day = datetime(2026, 3, 8).date()
+        stale = Habit.objects.create(
+            user=berlin, name="read", streak=4, last_completed=day
+        )
+        pending = Habit.objects.create(
+            user=new_york, name="read", streak=4, last_completed=day
+        )
+        current = Habit.objects.create(
+            user=berlin, name="run", streak=2, last_completed=day.replace(day=9)
+        )
+
+        with mock.patch("django.utils.timezone.now", return_value=now):
+            assert break_missed_streaks(batch_size=1) == 1
+
+        stale.refresh_from_db()
+        pending.refresh_from_db()
+        current.refresh_from_db()
+        assert stale.streak == 0
+        assert stale.updated_at == now
+        assert pending.streak == 4
+        assert current.streak == 2
+
+
+class MarkOverdueTasksTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com"
+        )
+
+    def test_flags_open_past_due_tasks_and_clears_resolved_ones(self) -> None:
+        future = timezone.now() + timedelta(hours=1)
+        late = Task.objects.create(user=self.user, title="late", due_date=future)
+        started = Task.objects.create(
+            user=self.user, title="started", due_date=future, status="in_progress"
+        )
+        done = Task.objects.create(
+            user=self.user, title="done", due_date=future, status="done"
+        )
+        upcoming = Task.objects.create(
+            user=self.user, title="upcoming", due_date=future + timedelta(days=1)
+        )
+        # Due dates pass without the tasks being saved.
+        Task.objects.filter(pk__in=[late.pk, started.pk, done.pk]).update(
+            due_date=timezone.now() - timedelta(hours=1)
+        )
+
+        assert mark_overdue_tasks(batch_size=1) == 2
+        flagged = set(Task.objects.filter(is_overdue=True).values_list("pk", flat=True))
+        assert flagged == {late.pk, started.pk}
+        assert not Task.objects.get(pk=upcoming.pk).is_overdue
+        assert mark_overdue_tasks(batch_size=1) == 0
+
+        # Finished through bulk writes: the job clears the flag.
+        Task.objects.filter(pk=late.pk).update(status="done")
+        assert mark_overdue_tasks(batch_size=10) == 1
+        assert not Task.objects.get(pk=late.pk).is_overdue
+
+    def test_save_keeps_the_flag_current(self) -> None:
+        task = Task.objects.create(
+            user=self.user, title="t", due_date=timezone.now() - timedelta(hours=1)
+        )
+        assert task.is_overdue
+        task.mark_done()
+        assert not Task.objects.get(pk=task.pk).is_overdue
+
+
+class NightlyJobsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com"
+        )
+
+    def test_refresh_mood_rollups_rebuilds_recently_changed_users(self) -> None:
+        entry = JournalEntry.objects.create(
+            user=self.user, title="t", content="c", mood_rating=4
+        )
+        MoodRollup.objects.all().delete()
+        JournalEntry.objects.filter(pk=entry.pk).update(
+            mood_rating=2, updated_at=timezone.now()
+        )
+
+        assert refresh_mood_rollups(batch_size=10) == 1
+        rollup = MoodRollup.objects.get(user=self.user, period="week")
+        assert rollup.mood_sum == 2
+
+    def test_materialize_recurring_tasks_extends_series(self) -> None:
+        template = Task.objects.create(
+            user=self.user,
+            title="water plants",
+            due_date=timezone.now() + timedelta(hours=1),
+            recurrence="daily",
+        )
+        Task.objects.filter(series=template).delete()
+        Task.all_objects.filter(pk=template.pk).update(materialized_until=None)
+
+        assert materialize_recurring_tasks(batch_size=10) > 0
+        assert Task.objects.filter(series=template).exists()
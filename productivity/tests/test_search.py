@@ -0,0 +1,93 @@
+"""Tests for journal full-text search."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import JournalEntry
+from users.models import CustomUser
+
+
+class JournalSearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+        cls.hiking = JournalEntry.objects.create(
+            user=cls.user,
+            entry_date=date(2026, 1, 1),
+            title="Mountain hike",
+            content="Long walk up the ridge, legs sore but worth it.",
+        )
+        cls.reading = JournalEntry.objects.create(
+            user=cls.user,
+            entry_date=date(2026, 1, 2),
+            title="Quiet day",
+            content="Read by the window and planned the next hike.",
+        )
+        JournalEntry.objects.create(
+            user=cls.other,
+            entry_date=date(2026, 1, 1),
+            title="Hike",
+            content="Someone else's hike.",
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def search(self, q: str, **params: object) -> list[dict]:
+        response = self.client.get(
+            reverse("productivity:journal-entry-search"), {"q": q, **params}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.data["results"]
+
+    def test_title_matches_rank_first(self) -> None:
+        results = self.search("hike")
+        assert [r["id"] for r in results] == [str(self.hiking.pk), str(self.reading.pk)]
+        assert results[0]["rank"] > results[1]["rank"]
+
+    def test_headline_highlights_matches(self) -> None:
+        [result] = self.search("window")
+        assert "<mark>window</mark>" in result["headline"]
+
+    def test_headline_escapes_the_content(self) -> None:
+        JournalEntry.objects.create(
+            user=self.user,
+            entry_date=date(2026, 1, 3),
+            title="Notes",
+            content="<script>alert(1)</script> garden & <b>lemons</b>",
+        )
+        [result] = self.search("lemons")
+        assert "<script>" not in result["headline"]
+        assert "&lt;script&gt;" in result["headline"]
+        assert "&amp;" in result["headline"]
+        assert "&lt;b&gt;<mark>lemons</mark>&lt;/b&gt;" in result["headline"]
+
+    def test_all_words_must_match(self) -> None:
+        assert [r["id"] for r in self.search("ridge sore")] == [str(self.hiking.pk)]
+        assert self.search("ridge window") == []
+
+    def test_index_follows_edits_and_soft_deletes(self) -> None:
+        self.reading.content = "Baked bread all afternoon."
+        self.reading.save()
+        assert [r["id"] for r in self.search("bread")] == [str(self.reading.pk)]
+        self.reading.delete()
+        assert self.search("bread") == []
+
+    def test_query_syntax_in_input_is_treated_as_text(self) -> None:
+        assert self.search('hike" OR "x') == []
+        assert self.search("NEAR(") == []
+
+    def test_limit_and_required_query(self) -> None:
+        assert len(self.search("hike", limit=1)) == 1
+        response = self.client.get(reverse("productivity:journal-entry-search"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
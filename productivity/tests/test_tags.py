@@ -0,0 +1,115 @@
+"""Tests for per-user tags, tag filters and tag usage counts."""
+
+from __future__ import annotations
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from productivity.models import JournalEntry, Tag, Task
+from users.models import CustomUser
+
+
+class TagTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        self.work = Tag.objects.create(user=self.user, name="Work")
+        self.home = Tag.objects.create(user=self.user, name="home")
+        self.urgent = Tag.objects.create(user=self.user, name="urgent")
+
+    def usage(self, tag: Tag) -> int:
+        tag.refresh_from_db()
+        return tag.usage_count
+
+    # ─── Namespaces ────────────────────────────────────────────────────
+
+    def test_names_are_unique_per_user_ignoring_case(self) -> None:
+        url = reverse("productivity:tag-list")
+        response = self.client.post(url, {"name": "work"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "name" in response.data
+
+        self.client.force_authenticate(self.other)
+        response = self.client.post(url, {"name": "work"}, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Tag.objects.get(pk=response.data["id"]).user == self.other
+
+    def test_list_shows_only_own_tags(self) -> None:
+        Tag.objects.create(user=self.other, name="theirs")
+        response = self.client.get(reverse("productivity:tag-list"))
+        names = {tag["name"] for tag in response.data["results"]}
+        assert names == {"Work", "home", "urgent"}
+
+    def test_tasks_cannot_use_other_users_tags(self) -> None:
+        theirs = Tag.objects.create(user=self.other, name="theirs")
+        response = self.client.post(
+            reverse("productivity:task-list"),
+            {"title": "New", "tags": [theirs.pk]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "tags" in response.data
+
+    # ─── Filters ───────────────────────────────────────────────────────
+
+    def test_filter_keeps_items_carrying_every_tag(self) -> None:
+        both = Task.objects.create(user=self.user, title="both")
+        both.tags.add(self.work, self.urgent)
+        Task.objects.create(user=self.user, title="work only").tags.add(self.work)
+        Task.objects.create(user=self.user, title="untagged")
+        url = reverse("productivity:task-list")
+
+        response = self.client.get(url, {"tags": f"{self.work.pk},{self.urgent.pk}"})
+        assert [task["title"] for task in response.data["results"]] == ["both"]
+        response = self.client.get(url, {"tags": str(self.work.pk)})
+        assert {task["title"] for task in response.data["results"]} == {
+            "both",
+            "work only",
+        }
+
+    def test_journal_filter_and_bad_ids(self) -> None:
+        entry = JournalEntry.objects.create(user=self.user, content="...")
+        entry.tags.add(self.home)
+        url = reverse("productivity:journal-entry-list")
+        response = self.client.get(url, {"tags": str(self.home.pk)})
+        assert [row["id"] for row in response.data["results"]] == [str(entry.pk)]
+        assert self.client.get(url, {"tags": "nope"}).status_code == (
+            status.HTTP_400_BAD_REQUEST
+        )
+
+    # ─── Usage counts ──────────────────────────────────────────────────
+
+    def test_usage_follows_links_and_soft_deletes(self) -> None:
+        task = Task.objects.create(user=self.user, title="t")
+        entry = JournalEntry.objects.create(user=self.user, content="...")
+        task.tags.add(self.work, self.home)
+        entry.tags.add(self.work)
+        task.tags.add(self.work)
+        assert (self.usage(self.work), self.usage(self.home)) == (2, 1)
+
+        task.tags.remove(self.home)
+        assert self.usage(self.home) == 0
+
+        task.delete()
+        assert self.usage(self.work) == 1
+        task.restore()
+        assert self.usage(self.work) == 2
+
+        entry.tags.clear()
+        assert self.usage(self.work) == 1
+
+    def test_usage_from_the_tag_side(self) -> None:
+        tasks = [Task.objects.create(user=self.user, title=str(n)) for n in range(3)]
+        self.urgent.task_set.add(*tasks)
+        assert self.usage(self.urgent) == 3
+        self.urgent.task_set.clear()
+        assert self.usage(self.urgent) == 0
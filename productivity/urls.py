@@ -0,0 +1,45 @@
+from django.urls import path
+
+from productivity.views import (
+    GoalComplete,
+    GoalListCreate,
+    GoalRetrieveUpdateDestroy,
+    HabitComplete,
+    HabitListCreate,
+    HabitRetrieveUpdateDestroy,
+    JournalEntryListCreate,
+    JournalEntryRetrieveUpdateDestroy,
+    JournalEntrySearch,
+    MoodAnalytics,
+    TagListCreate,
+    TagRetrieveUpdateDestroy,
+    TaskComplete,
+    TaskListCreate,
+    TaskRetrieveUpdateDestroy,
+)
+
+app_name = "productivity"
+
+urlpatterns = [
+    path("tasks/", TaskListCreate.as_view(), name="task-list"),
+    path("tasks/<uuid:pk>/", TaskRetrieveUpdateDestroy.as_view(), name="task-detail"),
+    path("tasks/<uuid:pk>/complete/", TaskComplete.as_view(), name="task-complete"),
+    path("habits/", HabitListCreate.as_view(), name="habit-list"),
+    path(
+        "habits/<uuid:pk>/", HabitRetrieveUpdateDestroy.as_view(), name="habit-detail"
+    ),
+    path("habits/<uuid:pk>/complete/", HabitComplete.as_view(), name="habit-complete"),
+    path("goals/", GoalListCreate.as_view(), name="goal-list"),
+    path("goals/<uuid:pk>/", GoalRetrieveUpdateDestroy.as_view(), name="goal-detail"),
+    path("goals/<uuid:pk>/complete/", GoalComplete.as_view(), name="goal-complete"),
+    path("tags/", TagListCreate.as_view(), name="tag-list"),
+    path("tags/<uuid:pk>/", TagRetrieveUpdateDestroy.as_view(), name="tag-detail"),
+    path("journal/", JournalEntryListCreate.as_view(), name="journal-entry-list"),
+    path("journal/search/", JournalEntrySearch.as_view(), name="journal-entry-search"),
+    path("journal/mood/", MoodAnalytics.as_view(), name="journal-mood"),
+    path(
+        "journal/<uuid:pk>/",
+        JournalEntryRetrieveUpdateDestroy.as_view(),
+        name="journal-entry-detail",
+    ),
+]
@@ -0,0 +1,35 @@
+from productivity.views.goal_complete_view import GoalComplete
+from productivity.views.goal_detail_view import GoalRetrieveUpdateDestroy
+from productivity.views.goal_list_view import GoalListCreate
+from productivity.views.habit_complete_view import HabitComplete
+from productivity.views.habit_detail_view import HabitRetrieveUpdateDestroy
+from productivity.views.habit_list_view import HabitListCreate
+from productivity.views.journal_entry_detail_view import (
+    JournalEntryRetrieveUpdateDestroy,
+)
+from productivity.views.journal_entry_list_view import JournalEntryListCreate
+from productivity.views.journal_entry_search_view import JournalEntrySearch
+from productivity.views.mood_analytics_view import MoodAnalytics
+from productivity.views.tag_detail_view import TagRetrieveUpdateDestroy
+from productivity.views.tag_list_view import TagListCreate
+from productivity.views.task_complete_view import TaskComplete
+from productivity.views.task_detail_view import TaskRetrieveUpdateDestroy
+from productivity.views.task_list_view import TaskListCreate
+
+__all__ = [
+    "GoalComplete",
+    "GoalListCreate",
+    "GoalRetrieveUpdateDestroy",
+    "HabitComplete",
+    "HabitListCreate",
+    "HabitRetrieveUpdateDestroy",
+    "JournalEntryListCreate",
+    "JournalEntryRetrieveUpdateDestroy",
+    "JournalEntrySearch",
+    "MoodAnalytics",
+    "TagListCreate",
+    "TagRetrieveUpdateDestroy",
+    "TaskComplete",
+    "TaskListCreate",
+    "TaskRetrieveUpdateDestroy",
+]
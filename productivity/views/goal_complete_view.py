@@ -0,0 +1,41 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from core.views.mixins import UserOwnedQuerysetMixin
+from productivity.models import Goal
+from productivity.serializers.goal_serializer import GoalSerializer
+from productivity.services import complete_goal
+
+
+@extend_schema(
+    tags=["Goals"],
+    summary="Complete Goal",
+    description=(
+        "Mark one of the authenticated user's goals as completed and award its "
+        "XP bonus. Safe to retry: only the request that completed the goal "
+        "answers 201; repeats answer 200 and award nothing."
+    ),
+    request=None,
+    responses={201: GoalSerializer, 200: GoalSerializer},
+)
+class GoalComplete(UserOwnedQuerysetMixin, AuthenticatedGenericAPIView):
+    """
+    View to mark one of the user's goals as completed.
+
+    * Requires token authentication.
+    * Other users' goals answer 404.
+    """
+
+    queryset = Goal.objects.all()
+    serializer_class = GoalSerializer
+
+    def post(self, request: Request, *_args, **_kwargs) -> Response:
+        goal = self.get_object()
+        completed = complete_goal(goal)
+        return Response(
+            self.get_serializer(goal).data,
+            status=status.HTTP_201_CREATED if completed else status.HTTP_200_OK,
+        )
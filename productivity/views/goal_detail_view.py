@@ -0,0 +1,34 @@
+from drf_spectacular.utils import extend_schema
+
+from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin, UserOwnedQuerysetMixin
+from productivity.models import Goal
+from productivity.serializers.goal_serializer import GoalSerializer
+
+
+@extend_schema(
+    tags=["Goals"],
+    summary="Retrieve / Update / Delete Goal",
+    description=(
+        "Retrieve, update, or delete one of the authenticated user's goals. "
+        "Deletion is a soft delete."
+    ),
+    responses={
+        200: GoalSerializer,
+        204: {"description": "Goal deleted successfully."},
+    },
+)
+class GoalRetrieveUpdateDestroy(
+    ConditionalGetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedRetrieveUpdateDestroyAPIView,
+):
+    """
+    View to retrieve, update, or delete one of the user's goals.
+
+    * Requires token authentication.
+    * Other users' goals answer 404.
+    """
+
+    queryset = Goal.objects.all()
+    serializer_class = GoalSerializer
@@ -0,0 +1,43 @@
+from drf_spectacular.utils import extend_schema
+
+from core.pagination import DefaultCursorPagination
+from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import (
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+)
+from productivity.models import Goal
+from productivity.serializers.goal_serializer import GoalSerializer
+
+
+@extend_schema(
+    tags=["Goals"],
+    summary="List / Create Goals",
+    description=(
+        "List the authenticated user's goals, one cursor page at a time "
+        "(pick columns with `fields=a,b`), or create a new goal."
+    ),
+    responses={
+        200: GoalSerializer(many=True),
+        201: GoalSerializer,
+    },
+)
+class GoalListCreate(
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedListCreateAPIView,
+):
+    """
+    View to list the authenticated user's goals or create a new one.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted goals are listed.
+    """
+
+    queryset = Goal.objects.all()
+    serializer_class = GoalSerializer
+    pagination_class = DefaultCursorPagination
@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from core.views.mixins import UserOwnedQuerysetMixin
+from productivity.models import Habit
+from productivity.serializers.habit_serializer import HabitSerializer
+from productivity.services import complete_habit
+
+
+class HabitCompletionSerializer(serializers.Serializer):
+    date = serializers.DateField(required=False)
+
+    def validate_date(self, value: date) -> date:
+        if value > self.context["today"]:
+            msg = "Cannot complete a habit in the future."
+            raise serializers.ValidationError(msg)
+        return value
+
+
+@extend_schema(
+    tags=["Habits"],
+    summary="Complete Habit",
+    description=(
+        "Log one of the authenticated user's habits as completed on `date` "
+        "(default: today in the user's time zone; later dates are rejected), "
+        "updating its streak and awarding XP. Each day counts once: only the "
+        "request that logged it answers 201; repeats answer 200 and award "
+        "nothing. Clients retrying should send the `date` of the first "
+        "attempt. An earlier day than the last completion never moves "
+        "`last_completed` back; it lengthens the streak only when it fills "
+        "the gap before the current run."
+    ),
+    request=HabitCompletionSerializer,
+    responses={201: HabitSerializer, 200: HabitSerializer},
+)
+class HabitComplete(UserOwnedQuerysetMixin, AuthenticatedGenericAPIView):
+    """
+    View to log one of the user's habits as completed for a day.
+
+    * Requires token authentication.
+    * Other users' habits answer 404.
+    """
+
+    queryset = Habit.objects.all()
+    serializer_class = HabitSerializer
+
+    def post(self, request: Request, *_args, **_kwargs) -> Response:
+        today = self.user_today(request.user)
+        params = HabitCompletionSerializer(data=request.data, context={"today": today})
+        params.is_valid(raise_exception=True)
+        habit = self.get_object()
+        day = params.validated_data.get("date") or today
+        completed = complete_habit(habit, day)
+        return Response(
+            self.get_serializer(habit).data,
+            status=status.HTTP_201_CREATED if completed else status.HTTP_200_OK,
+        )
+
+    @staticmethod
+    def user_today(user: Any) -> date:
+        try:
+            return timezone.now().astimezone(ZoneInfo(user.timezone)).date()
+        except (ZoneInfoNotFoundError, ValueError):
+            return timezone.localdate()
@@ -0,0 +1,34 @@
+from drf_spectacular.utils import extend_schema
+
+from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin, UserOwnedQuerysetMixin
+from productivity.models import Habit
+from productivity.serializers.habit_serializer import HabitSerializer
+
+
+@extend_schema(
+    tags=["Habits"],
+    summary="Retrieve / Update / Delete Habit",
+    description=(
+        "Retrieve, update, or delete one of the authenticated user's habits. "
+        "Deletion is a soft delete."
+    ),
+    responses={
+        200: HabitSerializer,
+        204: {"description": "Habit deleted successfully."},
+    },
+)
+class HabitRetrieveUpdateDestroy(
+    ConditionalGetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedRetrieveUpdateDestroyAPIView,
+):
+    """
+    View to retrieve, update, or delete one of the user's habits.
+
+    * Requires token authentication.
+    * Other users' habits answer 404.
+    """
+
+    queryset = Habit.objects.all()
+    serializer_class = HabitSerializer
@@ -0,0 +1,43 @@
+from drf_spectacular.utils import extend_schema
+
+from core.pagination import DefaultCursorPagination
+from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import (
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+)
+from productivity.models import Habit
+from productivity.serializers.habit_serializer import HabitSerializer
+
+
+@extend_schema(
+    tags=["Habits"],
+    summary="List / Create Habits",
+    description=(
+        "List the authenticated user's habits, one cursor page at a time "
+        "(pick columns with `fields=a,b`), or create a new habit."
+    ),
+    responses={
+        200: HabitSerializer(many=True),
+        201: HabitSerializer,
+    },
+)
+class HabitListCreate(
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedListCreateAPIView,
+):
+    """
+    View to list the authenticated user's habits or create a new one.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted habits are listed.
+    """
+
+    queryset = Habit.objects.all()
+    serializer_class = HabitSerializer
+    pagination_class = DefaultCursorPagination
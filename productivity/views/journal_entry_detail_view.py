@@ -0,0 +1,34 @@
+from drf_spectacular.utils import extend_schema
+
+from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin, UserOwnedQuerysetMixin
+from productivity.models import JournalEntry
+from productivity.serializers.journal_entry_serializer import JournalEntrySerializer
+
+
+@extend_schema(
+    tags=["Journal"],
+    summary="Retrieve / Update / Delete Journal Entry",
+    description=(
+        "Retrieve, update, or delete one of the authenticated user's journal entries. "
+        "Deletion is a soft delete."
+    ),
+    responses={
+        200: JournalEntrySerializer,
+        204: {"description": "Journal entry deleted successfully."},
+    },
+)
+class JournalEntryRetrieveUpdateDestroy(
+    ConditionalGetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedRetrieveUpdateDestroyAPIView,
+):
+    """
+    View to retrieve, update, or delete one of the user's journal entries.
+
+    * Requires token authentication.
+    * Other users' journal entries answer 404.
+    """
+
+    queryset = JournalEntry.objects.defer("search_vector")
+    serializer_class = JournalEntrySerializer
@@ -0,0 +1,52 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
+
+from core.pagination import DefaultCursorPagination
+from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import (
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+)
+from productivity.filters import JournalEntryFilter
+from productivity.models import JournalEntry
+from productivity.serializers.journal_entry_serializer import JournalEntrySerializer
+
+
+class JournalEntryCursorPagination(DefaultCursorPagination):
+    ordering = "-entry_date"
+
+
+@extend_schema(
+    tags=["Journal"],
+    summary="List / Create Journal Entries",
+    description=(
+        "List the authenticated user's journal entries, one cursor page at a time "
+        "(pick columns with `fields=a,b`; keep entries carrying all of "
+        "`tags=<id>,<id>`), or create a new journal entry."
+    ),
+    responses={
+        200: JournalEntrySerializer(many=True),
+        201: JournalEntrySerializer,
+    },
+)
+class JournalEntryListCreate(
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedListCreateAPIView,
+):
+    """
+    View to list the authenticated user's journal entries or create a new one.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted journal entries are listed.
+    """
+
+    queryset = JournalEntry.objects.defer("search_vector")
+    serializer_class = JournalEntrySerializer
+    pagination_class = JournalEntryCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = JournalEntryFilter
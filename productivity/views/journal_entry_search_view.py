@@ -0,0 +1,52 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from productivity.search import search_journal
+from productivity.serializers.journal_entry_search_serializer import (
+    JournalEntrySearchSerializer,
+)
+
+
+class JournalSearchParamsSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+@extend_schema(
+    tags=["Journal"],
+    summary="Search Journal Entries",
+    description=(
+        "Full-text search over the authenticated user's journal titles and "
+        "content. Supports quoted phrases, `or` and `-word` exclusion on "
+        "PostgreSQL. Best matches come first, each with a `rank` and a "
+        "`headline`: an HTML excerpt of the content, escaped, where matches "
+        "are wrapped in `<mark>`."
+    ),
+    parameters=[
+        OpenApiParameter("q", OpenApiTypes.STR, required=True),
+        OpenApiParameter("limit", OpenApiTypes.INT, description="1-100, default 20"),
+    ],
+    responses={200: JournalEntrySearchSerializer(many=True)},
+)
+class JournalEntrySearch(AuthenticatedGenericAPIView):
+    """
+    View to full-text search the authenticated user's journal entries.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted journal entries are searched.
+    """
+
+    serializer_class = JournalEntrySearchSerializer
+
+    def get(self, request: Request, *_args, **_kwargs) -> Response:
+        params = JournalSearchParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        entries = search_journal(
+            request.user, params.validated_data["q"], params.validated_data["limit"]
+        )
+        serializer = self.get_serializer(entries, many=True)
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from productivity.models import MoodRollup, MoodTagRollup
+from productivity.serializers.mood_rollup_serializer import MoodRollupSerializer
+
+
+class MoodAnalyticsParamsSerializer(serializers.Serializer):
+    period = serializers.ChoiceField(
+        choices=[choice for choice, _label in MoodRollup.PERIOD_CHOICES],
+        default="week",
+    )
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        attrs.setdefault("end", timezone.localdate())
+        attrs.setdefault("start", attrs["end"] - timedelta(days=365))
+        if attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"start": "Must not be after end."})
+        return attrs
+
+
+@extend_schema(
+    tags=["Journal"],
+    summary="Mood Analytics",
+    description=(
+        "Weekly or monthly mood statistics of the authenticated user's journal "
+        "(last 365 days unless `start`/`end` are given), oldest first, with "
+        "the change from the previous period and the average mood of entries "
+        "per tag. Served from pre-aggregated rollups."
+    ),
+    parameters=[
+        OpenApiParameter("period", OpenApiTypes.STR, enum=["week", "month"]),
+        OpenApiParameter("start", OpenApiTypes.DATE),
+        OpenApiParameter("end", OpenApiTypes.DATE),
+    ],
+    responses={200: MoodRollupSerializer(many=True)},
+)
+class MoodAnalytics(AuthenticatedGenericAPIView):
+    """
+    View to read the authenticated user's mood rollups.
+
+    * Requires token authentication.
+    * Reads only the rollup tables, never the journal entries themselves.
+    """
+
+    serializer_class = MoodRollupSerializer
+
+    def get(self, request: Request, *_args, **_kwargs) -> Response:
+        params = MoodAnalyticsParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        scope = {
+            "user": request.user,
+            "period": params.validated_data["period"],
+            "period_start__gte": params.validated_data["start"],
+            "period_start__lte": params.validated_data["end"],
+        }
+        rollups = list(MoodRollup.objects.filter(**scope).order_by("period_start"))
+        tag_rollups: dict = {}
+        for tag_rollup in (
+            MoodTagRollup.objects.filter(**scope)
+            .select_related("tag")
+            .order_by("-entry_count", "tag__name")
+        ):
+            tag_rollups.setdefault(tag_rollup.period_start, []).append(tag_rollup)
+
+        previous = None
+        for rollup in rollups:
+            rollup.tag_rollups = tag_rollups.get(rollup.period_start, [])
+            average = rollup.mood_average
+            rollup.mood_change = (
+                average - previous
+                if average is not None and previous is not None
+                else None
+            )
+            previous = average if average is not None else previous
+
+        return Response(
+            {
+                "period": params.validated_data["period"],
+                "results": self.get_serializer(rollups, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
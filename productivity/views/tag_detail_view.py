@@ -0,0 +1,34 @@
+from drf_spectacular.utils import extend_schema
+
+from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin, UserOwnedQuerysetMixin
+from productivity.models import Tag
+from productivity.serializers.tag_serializer import TagSerializer
+
+
+@extend_schema(
+    tags=["Tags"],
+    summary="Retrieve / Update / Delete Tag",
+    description=(
+        "Retrieve, update, or delete one of the authenticated user's tags. "
+        "Deletion is a soft delete."
+    ),
+    responses={
+        200: TagSerializer,
+        204: {"description": "Tag deleted successfully."},
+    },
+)
+class TagRetrieveUpdateDestroy(
+    ConditionalGetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedRetrieveUpdateDestroyAPIView,
+):
+    """
+    View to retrieve, update, or delete one of the user's tags.
+
+    * Requires token authentication.
+    * Other users' tags answer 404.
+    """
+
+    queryset = Tag.objects.all()
+    serializer_class = TagSerializer
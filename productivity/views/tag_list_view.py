@@ -0,0 +1,43 @@
+from drf_spectacular.utils import extend_schema
+
+from core.pagination import DefaultCursorPagination
+from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import (
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+)
+from productivity.models import Tag
+from productivity.serializers.tag_serializer import TagSerializer
+
+
+@extend_schema(
+    tags=["Tags"],
+    summary="List / Create Tags",
+    description=(
+        "List the authenticated user's tags, one cursor page at a time "
+        "(pick columns with `fields=a,b`), or create a new tag."
+    ),
+    responses={
+        200: TagSerializer(many=True),
+        201: TagSerializer,
+    },
+)
+class TagListCreate(
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedListCreateAPIView,
+):
+    """
+    View to list the authenticated user's tags or create a new one.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted tags are listed.
+    """
+
+    queryset = Tag.objects.all()
+    serializer_class = TagSerializer
+    pagination_class = DefaultCursorPagination
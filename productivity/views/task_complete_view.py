@@ -0,0 +1,43 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from core.views.mixins import UserOwnedQuerysetMixin
+from productivity.models import Task
+from productivity.serializers.task_serializer import TaskSerializer
+from productivity.services import complete_task
+
+
+@extend_schema(
+    tags=["Tasks"],
+    summary="Complete Task",
+    description=(
+        "Mark one of the authenticated user's tasks as done and award its XP. "
+        "Safe to retry: only the request that completed the task answers 201; "
+        "repeats answer 200 and award nothing."
+    ),
+    request=None,
+    responses={201: TaskSerializer, 200: TaskSerializer},
+)
+class TaskComplete(UserOwnedQuerysetMixin, AuthenticatedGenericAPIView):
+    """
+    View to mark one of the user's tasks as done.
+
+    * Requires token authentication.
+    * Other users' tasks answer 404.
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+
+    def post(self, request: Request, *_args, **_kwargs) -> Response:
+        task = self.get_object()
+        # XP is credited by user id, in one UPDATE, so concurrent completions
+        # cannot overwrite each other's total as saving request.user could.
+        completed = complete_task(task)
+        return Response(
+            self.get_serializer(task).data,
+            status=status.HTTP_201_CREATED if completed else status.HTTP_200_OK,
+        )
@@ -0,0 +1,34 @@
+from drf_spectacular.utils import extend_schema
+
+from core.views.authenticated_views import AuthenticatedRetrieveUpdateDestroyAPIView
+from core.views.mixins import ConditionalGetMixin, UserOwnedQuerysetMixin
+from productivity.models import Task
+from productivity.serializers.task_serializer import TaskSerializer
+
+
+@extend_schema(
+    tags=["Tasks"],
+    summary="Retrieve / Update / Delete Task",
+    description=(
+        "Retrieve, update, or delete one of the authenticated user's tasks. "
+        "Deletion is a soft delete."
+    ),
+    responses={
+        200: TaskSerializer,
+        204: {"description": "Task deleted successfully."},
+    },
+)
+class TaskRetrieveUpdateDestroy(
+    ConditionalGetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedRetrieveUpdateDestroyAPIView,
+):
+    """
+    View to retrieve, update, or delete one of the user's tasks.
+
+    * Requires token authentication.
+    * Other users' tasks answer 404.
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
@@ -0,0 +1,50 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
+
+from core.pagination import DefaultCursorPagination
+from core.views.authenticated_views import AuthenticatedListCreateAPIView
+from core.views.mixins import (
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+)
+from productivity.filters import TaskFilter
+from productivity.models import Task
+from productivity.serializers.task_serializer import TaskSerializer
+
+
+@extend_schema(
+    tags=["Tasks"],
+    summary="List / Create Tasks",
+    description=(
+        "List the authenticated user's tasks, one cursor page at a time "
+        "(pick columns with `fields=a,b`; filter with `status`, "
+        "`due_after`/`due_before` and `tags=<id>,<id>`, which keeps tasks "
+        "carrying all of them), or create a new task. Recurring tasks "
+        "(`recurrence`) get their upcoming occurrences created as tasks."
+    ),
+    responses={
+        200: TaskSerializer(many=True),
+        201: TaskSerializer,
+    },
+)
+class TaskListCreate(
+    ConditionalGetMixin,
+    FastListMixin,
+    SparseFieldsetMixin,
+    UserOwnedQuerysetMixin,
+    AuthenticatedListCreateAPIView,
+):
+    """
+    View to list the authenticated user's tasks or create a new one.
+
+    * Requires token authentication.
+    * Only the user's own, non-deleted tasks are listed.
+    """
+
+    queryset = Task.objects.all()
+    serializer_class = TaskSerializer
+    pagination_class = DefaultCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = TaskFilter
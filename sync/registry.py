@@ -0,0 +1,88 @@
+"""Models exchanged with offline clients through the sync endpoint.
+
+Every entry is a ``BaseModel`` (UUID keys, ``updated_at``, soft deletes)
+with an index leading on ``updated_at`` (after the owner column for
+per-user models), which the change feed walks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from rest_framework import serializers
+
+from core.serializers.fast import FastSerializer
+from gamification.models import Badge, Reward, UserBadge, UserReward
+from gamification.serializers import (
+    BadgeSerializer,
+    RewardSerializer,
+    UserBadgeSerializer,
+    UserRewardSerializer,
+)
+from productivity.models import Goal, Habit, HabitEntry, JournalEntry, Tag, Task
+from productivity.serializers import (
+    GoalSerializer,
+    HabitEntrySerializer,
+    HabitSerializer,
+    JournalEntrySerializer,
+    TagSerializer,
+    TaskSerializer,
+)
+
+
+@dataclass(frozen=True)
+class SyncedModel:
+    """A model in the change feed, keyed by *label* in requests and responses.
+
+    *owner_path* is the lookup from the model to its user (``None`` for
+    catalogs shared by everyone); *writable* models accept client uploads.
+    """
+
+    label: str
+    model: type[models.Model]
+    serializer_class: type[serializers.ModelSerializer]
+    owner_path: str | None = "user"
+    writable: bool = False
+
+    @cached_property
+    def fast_serializer(self) -> FastSerializer:
+        fast = FastSerializer.compile(self.serializer_class)
+        if fast is None:
+            msg = f"{self.serializer_class.__name__} cannot be compiled for sync."
+            raise ImproperlyConfigured(msg)
+        return fast
+
+    def owned(self, queryset: models.QuerySet, user: Any) -> models.QuerySet:
+        """Restrict *queryset* to the records *user* may sync."""
+        if self.owner_path is None:
+            return queryset
+        return queryset.filter(**{self.owner_path: user})
+
+
+SYNCED_MODELS: tuple[SyncedModel, ...] = (
+    SyncedModel("badges", Badge, BadgeSerializer, owner_path=None),
+    SyncedModel("goals", Goal, GoalSerializer, writable=True),
+    # Read-only: completions go through ``habits/<id>/complete/`` so the
+    # streak and XP follow; a raw entry upload would bypass them.
+    SyncedModel(
+        "habit_entries", HabitEntry, HabitEntrySerializer, owner_path="habit__user"
+    ),
+    SyncedModel("habits", Habit, HabitSerializer, writable=True),
+    SyncedModel("journal", JournalEntry, JournalEntrySerializer, writable=True),
+    SyncedModel("rewards", Reward, RewardSerializer, owner_path=None),
+    SyncedModel("tags", Tag, TagSerializer, writable=True),
+    SyncedModel("tasks", Task, TaskSerializer, writable=True),
+    SyncedModel("user_badges", UserBadge, UserBadgeSerializer),
+    SyncedModel("user_rewards", UserReward, UserRewardSerializer),
+)
+
+SYNCED_BY_LABEL: dict[str, SyncedModel] = {
+    entry.label: entry for entry in SYNCED_MODELS
+}
+WRITABLE_LABELS: tuple[str, ...] = tuple(
+    entry.label for entry in SYNCED_MODELS if entry.writable
+)
@@ -0,0 +1,3 @@
+from sync.serializers.sync_serializer import SyncChangeSerializer, SyncPushSerializer
+
+__all__ = ["SyncChangeSerializer", "SyncPushSerializer"]
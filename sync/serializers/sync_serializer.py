@@ -0,0 +1,24 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from sync.registry import WRITABLE_LABELS
+
+
+class SyncChangeSerializer(serializers.Serializer):
+    """One offline change: a create, update or delete of a single record."""
+
+    type = serializers.ChoiceField(choices=WRITABLE_LABELS)
+    id = serializers.UUIDField()
+    base_updated_at = serializers.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text="`updated_at` of the server copy the change was based on.",
+    )
+    deleted = serializers.BooleanField(default=False)
+    data = serializers.DictField(default=dict)
+
+
+class SyncPushSerializer(serializers.Serializer):
+    changes = serializers.ListField(
+        child=SyncChangeSerializer(), max_length=settings.SYNC_MAX_PAGE_SIZE
+    )
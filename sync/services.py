@@ -0,0 +1,206 @@
+"""Change feed and upload logic behind ``/api/sync/``.
+
+Pulling walks every synced model in one keyset order,
+``(updated_at, label, id)``, and hands the client an opaque cursor to the
+last change it received.  Soft-deleted rows come back as tombstones.
+
+``updated_at`` is stamped by the application when a row is saved, not when
+its transaction commits, so a slow transaction can make a change visible
+with a timestamp older than changes already served.  The feed therefore
+stops ``SYNC_SAFETY_WINDOW_SECONDS`` short of now; writes that take longer
+than the window to commit can still be skipped by a cursor.
+
+Pushing applies a batch of offline changes one by one, each in its own
+savepoint.  A change carries the ``updated_at`` the client based it on; if
+the server copy moved on since, the change is reported as a conflict along
+with the server copy, and nothing is written.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from heapq import merge
+from typing import Any
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from sync.registry import SYNCED_BY_LABEL, SYNCED_MODELS, SyncedModel
+
+_TIMESTAMP = serializers.DateTimeField()
+
+
+@dataclass(frozen=True, order=True)
+class SyncCursor:
+    """Position in the change feed: the last change a client has seen."""
+
+    updated_at: datetime
+    label: str
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        raw = json.dumps([self.updated_at.isoformat(), self.label, str(self.id)])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> SyncCursor:
+        """Parse an encoded cursor, raising ``ValueError`` when malformed."""
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            stamp, label, pk = json.loads(base64.urlsafe_b64decode(padded))
+            updated_at = parse_datetime(stamp)
+            cursor = cls(updated_at, label, uuid.UUID(pk))
+        except (binascii.Error, TypeError, ValueError) as exc:
+            msg = "Invalid sync cursor."
+            raise ValueError(msg) from exc
+        if updated_at is None or timezone.is_naive(updated_at):
+            msg = "Invalid sync cursor."
+            raise ValueError(msg)
+        return cursor
+
+
+def _changes_after(
+    entry: SyncedModel, user: Any, since: SyncCursor | None, upper: datetime
+) -> models.QuerySet:
+    queryset = entry.owned(entry.model.all_objects.all(), user).filter(
+        updated_at__lte=upper
+    )
+    if since is None:
+        return queryset
+    if entry.label < since.label:
+        return queryset.filter(updated_at__gt=since.updated_at)
+    if entry.label > since.label:
+        return queryset.filter(updated_at__gte=since.updated_at)
+    return queryset.filter(
+        models.Q(updated_at__gt=since.updated_at)
+        | models.Q(updated_at=since.updated_at, pk__gt=since.id)
+    )
+
+
+def pull_changes(user: Any, since: SyncCursor | None, limit: int) -> dict[str, Any]:
+    """Return up to *limit* changes visible to *user* after *since*."""
+    upper = timezone.now() - timedelta(seconds=settings.SYNC_SAFETY_WINDOW_SECONDS)
+    streams = []
+    for entry in SYNCED_MODELS:
+        rows = entry.fast_serializer.project(
+            _changes_after(entry, user, since, upper).order_by("updated_at", "pk"),
+            "updated_at",
+            "is_deleted",
+            "deleted_at",
+        )[: limit + 1]
+        streams.append(
+            [(row["updated_at"], entry.label, row["id"], row) for row in rows]
+        )
+    changes = list(merge(*streams, key=lambda change: change[:3]))
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    grouped: dict[str, dict[str, list[Any]]] = {}
+    for _updated_at, label, pk, row in changes:
+        bucket = grouped.setdefault(label, {"updated": [], "deleted": []})
+        if row["is_deleted"]:
+            bucket["deleted"].append(
+                {
+                    "id": str(pk),
+                    "deleted_at": _TIMESTAMP.to_representation(row["deleted_at"]),
+                }
+            )
+        else:
+            bucket["updated"].append(row)
+    for label, bucket in grouped.items():
+        bucket["updated"] = SYNCED_BY_LABEL[label].fast_serializer.serialize(
+            bucket["updated"]
+        )
+
+    if changes:
+        updated_at, label, pk, _row = changes[-1]
+        since = SyncCursor(updated_at, label, pk)
+    return {
+        "changes": grouped,
+        "cursor": since.encode() if since is not None else None,
+        "has_more": has_more,
+    }
+
+
+def _owner_id(instance: models.Model, owner_path: str) -> Any:
+    *relations, field = owner_path.split("__")
+    for name in relations:
+        instance = getattr(instance, name)
+    return getattr(instance, f"{field}_id")
+
+
+def _server_copy(
+    entry: SyncedModel, instance: models.Model, context: dict[str, Any]
+) -> dict[str, Any]:
+    if instance.is_deleted:
+        return {
+            "id": str(instance.pk),
+            "is_deleted": True,
+            "deleted_at": _TIMESTAMP.to_representation(instance.deleted_at),
+            "updated_at": _TIMESTAMP.to_representation(instance.updated_at),
+        }
+    return entry.serializer_class(instance, context=context).data
+
+
+def apply_change(change: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+    """Apply one uploaded change and describe the outcome.
+
+    The status is ``applied``, ``conflict`` (with the server ``record``) or
+    ``invalid`` (with ``errors``).
+    """
+    entry = SYNCED_BY_LABEL[change["type"]]
+    user = context["request"].user
+    result: dict[str, Any] = {"type": entry.label, "id": str(change["id"])}
+    with transaction.atomic():
+        instance = (
+            entry.model.all_objects.select_for_update().filter(pk=change["id"]).first()
+        )
+        if instance is not None and _owner_id(instance, entry.owner_path) != user.pk:
+            return {**result, "status": "invalid", "errors": {"id": ["Unknown id."]}}
+
+        if instance is None:
+            if change["deleted"]:
+                # Created and deleted offline: nothing to do on the server.
+                return {**result, "status": "applied"}
+            serializer = entry.serializer_class(data=change["data"], context=context)
+        elif (
+            instance.is_deleted
+            or change.get("base_updated_at") is None
+            or instance.updated_at != change["base_updated_at"]
+        ):
+            record = _server_copy(entry, instance, context)
+            return {**result, "status": "conflict", "record": record}
+        elif change["deleted"]:
+            instance.delete()
+            return {
+                **result,
+                "status": "applied",
+                "record": _server_copy(entry, instance, context),
+            }
+        else:
+            serializer = entry.serializer_class(
+                instance, data=change["data"], partial=True, context=context
+            )
+
+        if not serializer.is_valid():
+            return {**result, "status": "invalid", "errors": serializer.errors}
+        if instance is None:
+            serializer.save(id=change["id"])
+        else:
+            serializer.save()
+        return {**result, "status": "applied", "record": serializer.data}
+
+
+def push_changes(
+    changes: list[dict[str, Any]], context: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Apply uploaded *changes* in order; one result per change."""
+    return [apply_change(change, context) for change in changes]
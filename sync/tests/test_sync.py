@@ -0,0 +1,228 @@
+"""Tests for the delta sync endpoint."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from gamification.models import Badge
+from productivity.models import Goal, Habit, HabitEntry, Tag, Task
+from sync.services import SyncCursor
+from users.models import CustomUser
+
+
+@override_settings(SYNC_SAFETY_WINDOW_SECONDS=0)
+class SyncPullTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+        cls.task = Task.objects.create(user=cls.user, title="Mine")
+        cls.goal = Goal.objects.create(user=cls.user, name="Ship it")
+        cls.badge = Badge.objects.create(name="Starter", description="", xp_required=0)
+        Task.objects.create(user=cls.other, title="Theirs")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def pull(self, **params: object) -> dict:
+        response = self.client.get(reverse("sync:sync"), params)
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_full_sync_returns_own_records_and_catalogs(self) -> None:
+        data = self.pull()
+        changes = data["changes"]
+        assert [task["title"] for task in changes["tasks"]["updated"]] == ["Mine"]
+        assert [goal["name"] for goal in changes["goals"]["updated"]] == ["Ship it"]
+        assert [badge["name"] for badge in changes["badges"]["updated"]] == ["Starter"]
+        assert data["has_more"] is False
+
+    def test_cursor_returns_only_later_changes(self) -> None:
+        cursor = self.pull()["cursor"]
+        assert self.pull(since=cursor)["changes"] == {}
+
+        self.task.title = "Renamed"
+        self.task.save()
+        changes = self.pull(since=cursor)["changes"]
+        assert list(changes) == ["tasks"]
+        assert changes["tasks"]["updated"][0]["title"] == "Renamed"
+
+    @override_settings(RECURRENCE_WINDOW_DAYS=3)
+    def test_tag_only_changes_reach_the_feed(self) -> None:
+        tag = Tag.objects.create(user=self.user, name="focus")
+        template = Task.objects.create(
+            user=self.user,
+            title="Stretch",
+            due_date=timezone.now() + timedelta(hours=1),
+            recurrence="daily",
+        )
+        series = {str(template.pk)} | {
+            str(pk) for pk in template.occurrences.values_list("pk", flat=True)
+        }
+        assert len(series) > 1
+        cursor = self.pull()["cursor"]
+
+        template.tags.add(tag)
+        updated = self.pull(since=cursor)["changes"]["tasks"]["updated"]
+        assert {str(row["id"]) for row in updated} == series
+        assert all(row["tags"] == [tag.pk] for row in updated)
+
+        cursor = self.pull()["cursor"]
+        tag.delete()
+        changes = self.pull(since=cursor)["changes"]
+        assert {str(row["id"]) for row in changes["tasks"]["updated"]} == series
+
+    def test_deleted_records_come_back_as_tombstones(self) -> None:
+        cursor = self.pull()["cursor"]
+        self.goal.delete()
+        changes = self.pull(since=cursor)["changes"]
+        assert changes["goals"]["updated"] == []
+        assert changes["goals"]["deleted"][0]["id"] == str(self.goal.pk)
+        assert changes["goals"]["deleted"][0]["deleted_at"] is not None
+
+    def test_pages_cover_every_change_exactly_once(self) -> None:
+        habit = Habit.objects.create(user=self.user, name="Read")
+        for day in range(1, 6):
+            HabitEntry.objects.create(habit=habit, date=f"2026-01-0{day}")
+
+        seen, cursor, has_more = [], None, True
+        while has_more:
+            data = self.pull(**({"since": cursor} if cursor else {}), limit=2)
+            for bucket in data["changes"].values():
+                seen.extend(row["id"] for row in bucket["updated"])
+            cursor, has_more = data["cursor"], data["has_more"]
+        assert len(seen) == len(set(seen)) == 9
+
+    def test_habit_entries_follow_habit_owner(self) -> None:
+        habit = Habit.objects.create(user=self.other, name="Not mine")
+        HabitEntry.objects.create(habit=habit, date="2026-01-01")
+        assert "habit_entries" not in self.pull()["changes"]
+
+    @override_settings(SYNC_SAFETY_WINDOW_SECONDS=3600)
+    def test_recent_changes_wait_for_the_safety_window(self) -> None:
+        assert self.pull()["changes"] == {}
+
+    def test_rejects_malformed_cursor(self) -> None:
+        response = self.client.get(reverse("sync:sync"), {"since": "nope"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cursor_round_trips(self) -> None:
+        cursor = SyncCursor(self.task.updated_at, "tasks", self.task.pk)
+        assert SyncCursor.decode(cursor.encode()) == cursor
+
+
+class SyncPushTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = CustomUser.objects.create_user(
+            username="owner", email="owner@example.com", password="x"
+        )
+        cls.other = CustomUser.objects.create_user(
+            username="other", email="other@example.com", password="x"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+        self.task = Task.objects.create(user=self.user, title="Mine")
+
+    def push(self, *changes: dict) -> list[dict]:
+        response = self.client.post(
+            reverse("sync:sync"), {"changes": list(changes)}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.data["results"]
+
+    def test_creates_record_with_client_id(self) -> None:
+        client_id = "0b7c0c5e-0f7e-4c1b-9a52-8d3f3c8a1e10"
+        [result] = self.push(
+            {"type": "tasks", "id": client_id, "data": {"title": "Offline"}}
+        )
+        assert result["status"] == "applied"
+        assert Task.objects.get(pk=client_id).user == self.user
+
+    def test_applies_update_based_on_current_version(self) -> None:
+        [result] = self.push(
+            {
+                "type": "tasks",
+                "id": str(self.task.pk),
+                "base_updated_at": self.task.updated_at.isoformat(),
+                "data": {"title": "Edited offline"},
+            }
+        )
+        assert result["status"] == "applied"
+        self.task.refresh_from_db()
+        assert self.task.title == "Edited offline"
+
+    def test_stale_update_is_a_conflict(self) -> None:
+        base = self.task.updated_at.isoformat()
+        self.task.title = "Edited online"
+        self.task.save()
+        [result] = self.push(
+            {
+                "type": "tasks",
+                "id": str(self.task.pk),
+                "base_updated_at": base,
+                "data": {"title": "Edited offline"},
+            }
+        )
+        assert result["status"] == "conflict"
+        assert result["record"]["title"] == "Edited online"
+        self.task.refresh_from_db()
+        assert self.task.title == "Edited online"
+
+    def test_delete_leaves_tombstone(self) -> None:
+        [result] = self.push(
+            {
+                "type": "tasks",
+                "id": str(self.task.pk),
+                "base_updated_at": self.task.updated_at.isoformat(),
+                "deleted": True,
+            }
+        )
+        assert result["status"] == "applied"
+        assert Task.all_objects.get(pk=self.task.pk).is_deleted
+
+    def test_cannot_touch_other_users_records(self) -> None:
+        theirs = Task.objects.create(user=self.other, title="Theirs")
+        [result] = self.push(
+            {
+                "type": "tasks",
+                "id": str(theirs.pk),
+                "base_updated_at": theirs.updated_at.isoformat(),
+                "data": {"title": "Hijacked"},
+            }
+        )
+        assert result["status"] == "invalid"
+        theirs.refresh_from_db()
+        assert theirs.title == "Theirs"
+
+    def test_invalid_change_does_not_block_the_batch(self) -> None:
+        results = self.push(
+            {"type": "goals", "id": "5d1b0f9e-6a43-4c36-8f0e-2a1f9b7c3d21", "data": {}},
+            {
+                "type": "goals",
+                "id": "6e2c1a0f-7b54-4d47-9a1f-3b2a0c8d4e32",
+                "data": {"name": "Valid"},
+            },
+        )
+        assert [result["status"] for result in results] == ["invalid", "applied"]
+        assert Goal.objects.filter(user=self.user).count() == 1
+
+    def test_rejects_read_only_types(self) -> None:
+        for label in ("badges", "habit_entries"):
+            response = self.client.post(
+                reverse("sync:sync"),
+                {"changes": [{"type": label, "id": str(self.task.pk)}]},
+                format="json",
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,3 @@
+from sync.views.sync_view import SyncView
+
+__all__ = ["SyncView"]
@@ -0,0 +1,85 @@
+from typing import ClassVar
+
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.views.authenticated_views import AuthenticatedGenericAPIView
+from sync.serializers import SyncPushSerializer
+from sync.services import SyncCursor, pull_changes, push_changes
+
+
+class SyncView(AuthenticatedGenericAPIView):
+    """
+    Delta sync for offline-first clients.
+
+    * Requires token authentication.
+    * ``GET`` pages through changes and tombstones after ``since``.
+    * ``POST`` uploads a batch of offline changes with conflict detection.
+    """
+
+    serializer_class = SyncPushSerializer
+    # A cursor taken from the primary must never be answered by a replica
+    # that has not caught up to it.
+    read_from_replica: ClassVar[bool] = False
+
+    @extend_schema(
+        tags=["Sync"],
+        summary="Pull Changes",
+        description=(
+            "Records created, updated or soft-deleted since `since`, grouped "
+            "by type as `updated` rows and `deleted` tombstones. Pass the "
+            "returned `cursor` as the next `since`; keep pulling while "
+            "`has_more` is true. Omit `since` for a full sync."
+        ),
+        parameters=[
+            OpenApiParameter("since", OpenApiTypes.STR, description="Sync cursor."),
+            OpenApiParameter("limit", OpenApiTypes.INT, description="Page size."),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request: Request, *_args, **_kwargs) -> Response:
+        since = request.query_params.get("since")
+        try:
+            cursor = SyncCursor.decode(since) if since else None
+        except ValueError as exc:
+            raise ValidationError({"since": [str(exc)]}) from exc
+        return Response(
+            pull_changes(request.user, cursor, self.get_limit(request)),
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        tags=["Sync"],
+        summary="Push Changes",
+        description=(
+            "Apply offline changes in order. Updates and deletes must carry "
+            "the `base_updated_at` they were made against; if the server copy "
+            "changed since, the result is a `conflict` with the server "
+            "`record` and nothing is written. Creates use the client's `id`."
+        ),
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def post(self, request: Request, *_args, **_kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = push_changes(
+            serializer.validated_data["changes"], self.get_serializer_context()
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+    def get_limit(self, request: Request) -> int:
+        limit = request.query_params.get("limit")
+        if limit is None:
+            return settings.SYNC_PAGE_SIZE
+        try:
+            value = int(limit)
+        except ValueError as exc:
+            raise ValidationError({"limit": ["A valid integer is required."]}) from exc
+        if value < 1:
+            raise ValidationError({"limit": ["Must be at least 1."]})
+        return min(value, settings.SYNC_MAX_PAGE_SIZE)
@@ -0,0 +1,14 @@
+"""Domain events of the users app (see ``core.events``)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from core.events import Event
+
+
+@dataclass(frozen=True)
+class XPAwarded(Event):
+    amount: int
+    previous_xp: int
+    xp: int
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# LOWER(column) LIKE 'term%' (authentication.filters.UserFilter.search) can
+# only use a btree index built with text_pattern_ops unless the database runs
+# in the C collation.  Opclasses on expressions are PostgreSQL syntax, so the
+# indexes are created only there.
+INDEXES = {
+    'user_live_username_prefix_idx': 'username',
+    'user_live_email_prefix_idx': 'email',
+}
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON users_customuser '
+            f'(LOWER({column}) text_pattern_ops) WHERE NOT is_deleted'
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_customuser_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
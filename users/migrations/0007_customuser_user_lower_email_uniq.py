@@ -0,0 +1,49 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+
+
+def deduplicate_emails(apps, schema_editor):
+    """
+    Keep each email, compared case-insensitively, on one account only.
+
+    Registration rejected case variants but never enforced it, so the table
+    may hold some.  The email stays with a live account before a soft-deleted
+    one, then with the most recently logged in, then the oldest; the others
+    have theirs cleared and can still log in by username.
+    """
+    CustomUser = apps.get_model('users', 'CustomUser')
+    users = CustomUser._base_manager.exclude(email='').annotate(
+        email_lower=Lower('email')
+    )
+    duplicated = list(
+        users.values('email_lower')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    for email in duplicated:
+        ranked = users.filter(email_lower=email).order_by(
+            'is_deleted',
+            F('last_login').desc(nulls_last=True),
+            'date_joined',
+            'pk',
+        )
+        keep = ranked.values_list('pk', flat=True)[0]
+        ranked.exclude(pk=keep).update(email='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_customuser_search_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), condition=models.Q(('email', ''), _negated=True), name='user_lower_email_uniq'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+# The prefix indexes of 0006 were partial (WHERE NOT is_deleted), which the
+# admin's search cannot use: it lists soft-deleted users too.  Indexing
+# every row serves both it and the user list's search, which filters the
+# few deleted rows after the index scan.  PostgreSQL only, as in 0006.
+COLUMNS = {
+    'username': ('user_live_username_prefix_idx', 'user_username_prefix_idx'),
+    'email': ('user_live_email_prefix_idx', 'user_email_prefix_idx'),
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column, (partial, full) in COLUMNS.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {full} ON users_customuser '
+            f'(LOWER({column}) text_pattern_ops)'
+        )
+        schema_editor.execute(f'DROP INDEX IF EXISTS {partial}')
+
+
+def restore_partial_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column, (partial, full) in COLUMNS.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {partial} ON users_customuser '
+            f'(LOWER({column}) text_pattern_ops) WHERE NOT is_deleted'
+        )
+        schema_editor.execute(f'DROP INDEX IF EXISTS {full}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_customuser_user_lower_email_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, restore_partial_indexes),
+    ]
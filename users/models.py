@@ -2,11 +2,30 @@ from __future__ import annotations
 
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
+from django.db.models.functions import Lower
 
+from core.events import emit
 from core.models.base import BaseModel
+from users.events import XPAwarded
 
 
-class CustomUserManager(UserManager):
+class CustomUserQuerySet(models.QuerySet["CustomUser"]):
+    def with_email(self, email: str) -> CustomUserQuerySet:
+        """
+        Users whose email matches *email* case-insensitively.
+
+        Written as ``LOWER(email) = lower(value)`` on non-blank emails so it
+        is served by the ``user_lower_email_uniq`` index; ``email__iexact``
+        (``UPPER(email) = UPPER(%s)``) scans the whole table.
+        """
+        return (
+            self.alias(email_lower=Lower("email"))
+            .filter(email_lower=email.lower())
+            .exclude(email="")
+        )
+
+
+class CustomUserManager(UserManager.from_queryset(CustomUserQuerySet)):
     def get_queryset(self) -> models.QuerySet[CustomUser]:
         return super().get_queryset().filter(is_deleted=False)
 
@@ -27,6 +46,32 @@ class CustomUser(AbstractUser, BaseModel):
     class Meta:  # pyright: ignore[reportIncompatibleVariableOverride]
         verbose_name = "User"
         verbose_name_plural = "Users"
+        # Cursor pages of the user list walk these; soft-deleted rows are
+        # never listed, so they are left out of the index.  The prefix
+        # search indexes cover every row, as the admin searches deleted
+        # users too, and are PostgreSQL-only (see migrations 0006 and 0008).
+        indexes = [
+            models.Index(
+                fields=["-date_joined"],
+                condition=models.Q(is_deleted=False),
+                name="user_live_joined_idx",
+            ),
+            models.Index(
+                fields=["level", "-date_joined"],
+                condition=models.Q(is_deleted=False),
+                name="user_live_level_joined_idx",
+            ),
+        ]
+        # One account per email whatever its case, soft-deleted accounts
+        # included (registration checks them too).  Users without an email
+        # are left out.  See migration 0007 for the deduplication.
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                condition=~models.Q(email=""),
+                name="user_lower_email_uniq",
+            ),
+        ]
 
     profile = models.ForeignKey(
         Profile, on_delete=models.SET_NULL, blank=True, null=True
@@ -36,13 +81,21 @@ class CustomUser(AbstractUser, BaseModel):
     level = models.PositiveIntegerField(default=1)
 
     objects: CustomUserManager = CustomUserManager()  # pyright: ignore[reportIncompatibleVariableOverride]
-    all_objects: models.Manager[CustomUser] = models.Manager()  # pyright: ignore[reportIncompatibleVariableOverride]
+    all_objects: models.Manager[CustomUser] = models.Manager.from_queryset(
+        CustomUserQuerySet
+    )()  # pyright: ignore[reportIncompatibleVariableOverride]
 
     def add_xp(self, amount: int) -> None:
+        previous_xp = self.xp
         self.xp += amount
         while self.xp >= self.level * 100:
             self.level += 1
         self.save(update_fields=["xp", "level"])
+        emit(
+            XPAwarded(
+                user_id=self.pk, amount=amount, previous_xp=previous_xp, xp=self.xp
+            )
+        )
 
     def fullname(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
@@ -1,3 +1,4 @@
+from django.db import IntegrityError
 from django.test import TestCase
 
 from users.models import CustomUser
@@ -65,3 +66,17 @@ class UserModelTestCase(TestCase):
         deleted_user.restore()
         restored_user = CustomUser.objects.get(id=user_id)
         self.assertFalse(restored_user.is_deleted)
+
+    def test_email_is_unique_in_any_case(self) -> None:
+        CustomUser.objects.create(username="first", email="Same@example.com")
+        # Accounts without an email do not collide.
+        CustomUser.objects.create(username="blank1")
+        CustomUser.objects.create(username="blank2")
+        with self.assertRaises(IntegrityError):
+            CustomUser.objects.create(username="second", email="same@EXAMPLE.com")
+
+    def test_with_email_matches_case_insensitively(self) -> None:
+        user = CustomUser.objects.create(username="mixed", email="Mixed@Example.com")
+        CustomUser.objects.create(username="blank")
+        assert list(CustomUser.all_objects.with_email("mixed@example.COM")) == [user]
+        assert not CustomUser.all_objects.with_email("").exists()